@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Compares the throughput of :meth:`argmagic.magic_parser.MagicParser.parse_many` with calling
+:meth:`argmagic.magic_parser.MagicParser.parse_args` in a loop.
+"""
+
+
+import argparse
+import random
+import time
+
+from argmagic import magic_parser
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+NUM_OPTIONS = 50
+"""int: The number of options of the :class:`BenchConfig`."""
+
+
+class BenchConfig(object):
+    """A configuration class with :attr:`NUM_OPTIONS` options of type ``int`` and ``float`` each (created below)."""
+    
+    def __init__(self):
+        for i in range(NUM_OPTIONS):
+            setattr(self, "_int_{}".format(i), 0)
+            setattr(self, "_float_{}".format(i), 0.0)
+
+
+def _add_property(name: str, data_type: type) -> None:
+    """Adds a property with the provided name and type to :class:`BenchConfig`."""
+    
+    def getter(self):
+        return getattr(self, "_" + name)
+    
+    def setter(self, value):
+        if not isinstance(value, data_type):
+            raise TypeError("The config <{}> has to be of type {}!".format(name, data_type.__name__))
+        setattr(self, "_" + name, value)
+    
+    setattr(BenchConfig, "DEFAULT_" + name.upper(), data_type(0))
+    setattr(BenchConfig, name, property(getter, setter, doc="{}: Option {}.".format(data_type.__name__, name)))
+
+
+for _i in range(NUM_OPTIONS):
+    _add_property("int_{}".format(_i), int)
+    _add_property("float_{}".format(_i), float)
+
+
+def create_args(num_items: int, seed: int=0) -> list:
+    """Creates the provided number of random lists of args for the :class:`BenchConfig`, each of which specifies ten
+    options.
+    """
+    rand = random.Random(seed)
+    all_args = []
+    for _ in range(num_items):
+        args = []
+        for i in rand.sample(range(NUM_OPTIONS), 10):
+            if rand.random() < 0.5:
+                args += ["--int-{}".format(i), str(rand.randint(0, 100))]
+            else:
+                args += ["--float-{}".format(i), "{:.4f}".format(rand.random())]
+        all_args.append(args)
+    
+    return all_args
+
+
+def _measure(label: str, num_items: int, func) -> float:
+    """Measures the number of items per second that the provided function processes, and prints the result."""
+    start = time.perf_counter()
+    func()
+    items_per_second = num_items / (time.perf_counter() - start)
+    print("{:<40} {:>12,.0f} items/s".format(label, items_per_second))
+    
+    return items_per_second
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--num-items", type=int, default=10000, help="The number of lists of args to parse.")
+    num_items = arg_parser.parse_args().num_items
+    
+    all_args = create_args(num_items)
+    parser = magic_parser.MagicParser(BenchConfig)
+    fast_parser = magic_parser.MagicParser(BenchConfig, fast_parsing=True)
+    
+    baseline = _measure("parse_args in a loop", num_items, lambda: [parser.parse_args(a) for a in all_args])
+    _measure("parse_args in a loop (fast parsing)", num_items, lambda: [fast_parser.parse_args(a) for a in all_args])
+    batch = _measure("parse_many", num_items, lambda: list(parser.parse_many(all_args)))
+    print("speedup of parse_many: {:.1f}x".format(batch / baseline))
+
+
+if __name__ == "__main__":
+    main()
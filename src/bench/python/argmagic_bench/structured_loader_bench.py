@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Compares the modes of :class:`argmagic.parsing.structured_loader.StructuredLoader` on values of different sizes."""
+
+
+import argparse
+import json
+import random
+import time
+
+from argmagic.parsing import structured_loader
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+SIZES = [1 << 10, 10 << 10, 100 << 10, 1 << 20, 10 << 20]
+"""list[int]: The approximate sizes in bytes of the values that are loaded."""
+
+PURE_MAX_SIZE = 1 << 20
+"""int: The maximum size of values that are loaded in mode ``"pure"``, which is very slow for large values."""
+
+
+def create_value(size: int, seed: int=0) -> str:
+    """Creates a JSON object of approximately the provided size, which maps strs to lists of ints and floats."""
+    rand = random.Random(seed)
+    value = {}
+    length = 2
+    while length < size:
+        key = "key_{}".format(len(value))
+        entry = [rand.randint(0, 10000) for _ in range(8)] + [round(rand.random(), 4) for _ in range(8)]
+        value[key] = entry
+        length += len(json.dumps({key: entry}))
+    
+    return json.dumps(value)
+
+
+def _measure(label: str, size: int, func, repetitions: int) -> float:
+    """Measures the throughput of the provided function in MB/s, and prints the result."""
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        func()
+    megabytes_per_second = size * repetitions / (time.perf_counter() - start) / (1 << 20)
+    print("{:<30} {:>12,.2f} MB/s".format(label, megabytes_per_second))
+    
+    return megabytes_per_second
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument(
+            "--max-size",
+            type=int,
+            default=SIZES[-1],
+            help="The maximum size of the loaded values in bytes."
+    )
+    max_size = arg_parser.parse_args().max_size
+    
+    for size in (s for s in SIZES if s <= max_size):
+        value = create_value(size)
+        repetitions = max(1, (1 << 20) // size)
+        print("value of {:,} bytes:".format(len(value)))
+        for mode in structured_loader.StructuredLoader.MODES:
+            if mode == "pure" and size > PURE_MAX_SIZE:
+                continue
+            loader = structured_loader.StructuredLoader(mode)
+            _measure("  " + mode, len(value), lambda: loader.load(value), repetitions)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Measures the time and peak memory of the main operations of argmagic on synthetic configurations of different sizes,
+and compares the results with a saved baseline.
+
+The suite exits with status 1, if any result is worse than the baseline by more than the given threshold.
+"""
+
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+import typing
+
+import argmagic
+
+from argmagic import config_spec
+from argmagic import magic_parser
+from argmagic_bench import synthetic_config
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "..", "..", "resources", "baseline.json")
+"""str: The path of the baseline that is used by default."""
+
+IMPORT_CODE = (
+        "import time, tracemalloc\n"
+        "tracemalloc.start()\n"
+        "start = time.perf_counter()\n"
+        "import argmagic\n"
+        "seconds = time.perf_counter() - start\n"
+        "print(seconds, tracemalloc.get_traced_memory()[1])\n"
+)
+"""str: The code that measures ``import argmagic`` in a fresh interpreter."""
+
+MIN_TIME = 0.5
+"""float: The minimum total time in seconds that every benchmark is repeated for."""
+
+MIN_REPETITIONS = 3
+"""int: The minimum number of times that every benchmark is repeated."""
+
+NOISE_BYTES = 4096
+"""int: Differences in peak memory that are smaller than this are never considered regressions."""
+
+NOISE_SECONDS = 100e-6
+"""float: Differences in time that are smaller than this are never considered regressions."""
+
+SIZES = [10, 100, 1000, 10000]
+"""list[int]: The numbers of properties of the synthetic configuration classes that are benchmarked by default."""
+
+
+def compare(
+        results: typing.Dict[str, dict],
+        baseline: typing.Dict[str, dict],
+        threshold: float
+) -> typing.List[str]:
+    """Compares the provided results with a baseline, and prints a table of the relative changes.
+    
+    Args:
+        results (dict): The results of the current run.
+        baseline (dict): The results of the baseline run.
+        threshold (float): The relative increase of time or peak memory above which a result is considered a
+            regression.
+    
+    Returns:
+        list[str]: The names of all benchmarks that have regressed.
+    """
+    regressions = []
+    header = ("benchmark", "baseline", "current", "change", "peak", "change")
+    print("{:<24} {:>12} {:>12} {:>9} {:>14} {:>9}".format(*header))
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print("{:<24} (not in baseline)".format(name))
+            continue
+        
+        time_change = result["seconds"] / base["seconds"] - 1 if base["seconds"] > 0 else 0.0
+        memory_change = result["peak_bytes"] / base["peak_bytes"] - 1 if base["peak_bytes"] > 0 else 0.0
+        regressed = (
+                (time_change > threshold and result["seconds"] - base["seconds"] > NOISE_SECONDS) or
+                (memory_change > threshold and result["peak_bytes"] - base["peak_bytes"] > NOISE_BYTES)
+        )
+        if regressed:
+            regressions.append(name)
+        print(
+                "{:<24} {:>9.3f} ms {:>9.3f} ms {:>+8.1%} {:>11,d} B {:>+8.1%}{}".format(
+                        name,
+                        base["seconds"] * 1000,
+                        result["seconds"] * 1000,
+                        time_change,
+                        result["peak_bytes"],
+                        memory_change,
+                        "  REGRESSION" if regressed else ""
+                )
+        )
+    
+    return regressions
+
+
+def measure(func: typing.Callable[[], typing.Any]) -> typing.Dict[str, float]:
+    """Measures the time and peak memory of the provided function.
+    
+    The time is the minimum over at least :attr:`MIN_REPETITIONS` runs that take at least :attr:`MIN_TIME` seconds in
+    total, and the peak memory is measured in a separate run by means of ``tracemalloc``.
+    
+    Returns:
+        dict: The time in ``"seconds"`` and the peak memory in ``"peak_bytes"``.
+    """
+    best = float("inf")
+    total = 0.0
+    repetitions = 0
+    while repetitions < MIN_REPETITIONS or total < MIN_TIME:
+        start = time.perf_counter()
+        func()
+        seconds = time.perf_counter() - start
+        best = min(best, seconds)
+        total += seconds
+        repetitions += 1
+    
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    
+    return {"seconds": best, "peak_bytes": peak}
+
+
+def measure_import() -> typing.Dict[str, float]:
+    """Measures ``import argmagic`` in fresh interpreters."""
+    env = dict(os.environ)
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(argmagic.__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(p for p in [package_dir, env.get("PYTHONPATH")] if p)
+    
+    results = []
+    for _ in range(MIN_REPETITIONS):
+        output = subprocess.check_output([sys.executable, "-c", IMPORT_CODE], env=env, universal_newlines=True)
+        seconds, peak = output.split()
+        results.append((float(seconds), int(peak)))
+    
+    return {"seconds": min(r[0] for r in results), "peak_bytes": min(r[1] for r in results)}
+
+
+def run(sizes: typing.Sequence[int]) -> typing.Dict[str, dict]:
+    """Runs all benchmarks for synthetic configuration classes of the provided sizes.
+    
+    Returns:
+        dict: Maps names of benchmarks, e.g., ``"parse_args[100]"``, to their results (see :func:`measure`).
+    """
+    results = {"import": measure_import()}
+    _print_result("import", results["import"])
+    
+    for size in sizes:
+        conf_class = synthetic_config.create_config_class(size)
+        args = synthetic_config.create_args(conf_class)
+        
+        # the specification is cached after the first benchmark, which means that the creation of the parser is
+        # measured without creating the specification
+        # in contrast, the help text is rendered from scratch by the benchmark "help", and retrieved from the cache of
+        # rendered help texts by the benchmark "help_cached"
+        parser = magic_parser.MagicParser(conf_class)
+        conf = parser.parse_args(args)
+        benchmarks = [
+                ("create_spec", lambda: config_spec.ConfigSpec.create_spec(conf_class, use_cache=False)),
+                ("magic_parser", lambda: magic_parser.MagicParser(conf_class)),
+                ("parse_args", lambda: parser.parse_args(args)),
+                ("help", lambda: _render_help(parser, cold=True)),
+                ("help_cached", lambda: _render_help(parser)),
+                ("get_config", lambda: argmagic.get_config(conf))
+        ]
+        for name, func in benchmarks:
+            key = "{}[{}]".format(name, size)
+            results[key] = measure(func)
+            _print_result(key, results[key])
+    
+    return results
+
+
+def _print_result(name: str, result: typing.Dict[str, float]) -> None:
+    """Prints the result of a single benchmark."""
+    print("{:<24} {:>12.3f} ms {:>14,d} B".format(name, result["seconds"] * 1000, result["peak_bytes"]))
+
+
+def _render_help(parser: magic_parser.MagicParser, cold: bool=False) -> str:
+    """Renders the help text of the provided parser by means of the option ``--help``.
+    
+    If ``cold`` is ``True``, then the cache of rendered help texts is cleared beforehand, which means that the entire
+    help text is rendered again.
+    """
+    if cold:
+        parser._parser._help_cache.clear()
+    
+    stream = io.StringIO()
+    with contextlib.redirect_stdout(stream):
+        try:
+            parser.parse_args(["--help"])
+        except SystemExit:
+            pass
+    
+    return stream.getvalue()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=SIZES,
+            help="The numbers of properties of the benchmarked configuration classes."
+    )
+    arg_parser.add_argument(
+            "--save",
+            metavar="PATH",
+            help="Saves the results as baseline at the given path."
+    )
+    arg_parser.add_argument(
+            "--compare",
+            metavar="PATH",
+            nargs="?",
+            const=DEFAULT_BASELINE,
+            help="Compares the results with the baseline at the given path, which is {} by default.".format(
+                    os.path.normpath(DEFAULT_BASELINE)
+            )
+    )
+    arg_parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.25,
+            help="The relative increase of time or peak memory above which a result is considered a regression."
+    )
+    args = arg_parser.parse_args()
+    
+    results = run(args.sizes)
+    
+    if args.save is not None:
+        with open(args.save, "w") as f:
+            json.dump({"python": platform.python_version(), "results": results}, f, indent=4, sort_keys=True)
+            f.write("\n")
+    
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        print()
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(
+                    "\n{} benchmark(s) regressed by more than {:.0%}: {}".format(
+                            len(regressions),
+                            args.threshold,
+                            ", ".join(regressions)
+                    )
+            )
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
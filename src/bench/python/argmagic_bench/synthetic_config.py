@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Generates synthetic configuration classes of arbitrary sizes, which are used for benchmarking."""
+
+
+import enum
+import typing
+
+from argmagic import decorators
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+Color = enum.Enum("Color", [("RED", 1), ("GREEN", 2), ("BLUE", 3)])
+"""type: The ``Enum`` that specifies the values of exhaustive options."""
+
+KINDS = ["int", "float", "str", "bool", "list", "enum", "optional", "int", "float", "positional"]
+"""list[str]: The kinds of options that are generated, which are assigned to properties in a round-robin fashion."""
+
+MAX_POSITIONAL = 20
+"""int: The maximum number of positional options of a generated class."""
+
+
+def create_args(conf_class: type, num_options: int=10) -> typing.List[str]:
+    """Creates args that provide values for all positional options of a generated class and for some of the others.
+    
+    Args:
+        conf_class (type): A class that has been created by :func:`create_config_class`.
+        num_options (int, optional): The number of (non-positional) options to provide values for.
+    
+    Returns:
+        list[str]: The args.
+    """
+    args = [str(i) for i in range(conf_class.NUM_POSITIONAL)]
+    for i in range(min(num_options, conf_class.NUM_PROPERTIES)):
+        kind = KINDS[i % len(KINDS)]
+        option = "--option-{}".format(i)
+        if kind == "int":
+            args += [option, str(i)]
+        elif kind == "float":
+            args += [option, "0.25"]
+        elif kind == "str":
+            args += [option, "value"]
+        elif kind == "bool":
+            args.append(option)
+        elif kind == "enum":
+            args += [option, "BLUE"]
+    
+    return args
+
+
+def create_config_class(num_properties: int) -> type:
+    """Creates a configuration class with the provided number of properties, which mix all kinds of options.
+    
+    The properties of the created class are named ``option_0``, ``option_1``, etc., and their kinds are determined by
+    :attr:`KINDS`. In addition to these, the class provides the number of properties and positional options as
+    ``NUM_PROPERTIES`` and ``NUM_POSITIONAL``, respectively.
+    
+    Args:
+        num_properties (int): The number of properties to create.
+    
+    Returns:
+        type: The created class.
+    """
+    members = {}
+    defaults = {}
+    num_positional = 0
+    for i in range(num_properties):
+        name = "option_{}".format(i)
+        kind = KINDS[i % len(KINDS)]
+        if kind == "positional" and num_positional >= MAX_POSITIONAL:
+            kind = "int"
+        
+        if kind == "int":
+            prop = _create_property(name, "int: An int option.")
+            defaults[name] = i
+        elif kind == "float":
+            prop = _create_property(name, "float: A float option.")
+            defaults[name] = 0.5
+        elif kind == "str":
+            prop = _create_property(name, "str: A str option.")
+            defaults[name] = "default"
+        elif kind == "bool":
+            prop = _create_property(name, "bool: A flag.")
+            defaults[name] = False
+        elif kind == "list":
+            prop = decorators.optional(_create_property(name, "list[int]: A list option without default value."))
+        elif kind == "enum":
+            prop = decorators.exhaustive(Color)(_create_property(name, "An exhaustive option."))
+            defaults[name] = Color.RED.value
+        elif kind == "optional":
+            prop = decorators.optional(_create_property(name, "int: An optional int without default value."))
+        else:
+            prop = decorators.position(num_positional)(_create_property(name, "int: A positional option."))
+            num_positional += 1
+        
+        members[name] = prop
+        if name in defaults:
+            members["DEFAULT_" + name.upper()] = defaults[name]
+    
+    def __init__(self):
+        for n in range(num_properties):
+            setattr(self, "_option_{}".format(n), defaults.get("option_{}".format(n)))
+    
+    members["__init__"] = __init__
+    members["NUM_POSITIONAL"] = num_positional
+    members["NUM_PROPERTIES"] = num_properties
+    
+    return type("SyntheticConfig{}".format(num_properties), (object,), members)
+
+
+def _create_property(name: str, doc: str) -> property:
+    """Creates a property with a getter and a setter that store its value in the attribute ``_<name>``."""
+    attr = "_" + name
+    
+    def getter(self):
+        return getattr(self, attr)
+    
+    def setter(self, value):
+        setattr(self, attr, value)
+    
+    getter.__doc__ = doc
+    
+    return property(getter, setter)
@@ -1,12 +1,14 @@
 # -*- coding: utf-8 -*-
 
-"""Tools for defining and parsing command-line args automagically based on a configuration class."""
+"""Tools for defining and parsing command-line args automagically based on a configuration class.
 
+In order to keep the import of ``argmagic`` cheap, its submodules are loaded lazily, i.e., when they are used for the
+first time.
+"""
 
-import inspect
-import typing
 
-from argmagic import magic_parser
+import importlib
+import typing
 
 
 __author__ = "Patrick Hohenecker"
@@ -45,18 +47,54 @@ CONFIG_VALUES = "argmagic.config_values"
 DEFAULT_PREFIX = "DEFAULT_"
 """str: A prefix that identifies class variables as default values."""
 
+NESTED_KEY = "argmagic.nested"
+"""str: The key that is used for storing the classes of nested configurations."""
+
 OPTIONAL_KEY = "argmagic.optional"
 """str: The key that is used for storing that an arg is optional."""
 
 POSITION = "argmagic.position"
 """str: The key that is used for storing the position of positional args."""
 
+_SUBMODULES = frozenset(
+        [
+                "completion",
+                "config_export",
+                "config_file",
+                "config_snapshot",
+                "config_spec",
+                "config_sweep",
+                "config_value",
+                "decorators",
+                "magic_parser",
+                "nested_config",
+                "parallel_parsing",
+                "parse_error",
+                "parsing",
+                "record_parser",
+                "spec_cache",
+                "subcommand_parser",
+                "tracing",
+                "type_ref"
+        ]
+)
+"""frozenset[str]: The names of all submodules that are imported lazily when they are accessed as attributes."""
+
+
+def __getattr__(name: str):
+    # this is invoked for attributes that do not exist (yet), and imports submodules on first access (see PEP 562)
+    if name in _SUBMODULES:
+        return importlib.import_module("argmagic." + name)
+    raise AttributeError("module 'argmagic' has no attribute '{}'".format(name))
+
 
 def get_config(conf) -> typing.Dict[str, str]:
     """Creates a ``dict`` that summarizes the values of the members of the provided object.
 
     This function considers all members of ``conf`` whose names do neither start with an underscore nor with
-    :attr:`DEFAULT_PREFIX`, and converts their values into strings.
+    :attr:`DEFAULT_PREFIX`, and converts their values into strings. To export only the options of a configuration,
+    with their values retained as they are, use :func:`config_export.export_config` instead, which does not introspect
+    ``conf``.
 
     Args:
         conf: The object to be summarized.
@@ -67,6 +105,8 @@ def get_config(conf) -> typing.Dict[str, str]:
     Raises:
         TypeError: If ``conf`` is ``None``.
     """
+    import inspect
+    
     if conf is None:
         raise TypeError("The parameter <conf> must not be None!")
 
@@ -84,7 +124,13 @@ def parse_args(
         conf_class,
         app_name: str=None,
         app_description: str=None,
-        positional_args: bool=True
+        positional_args: bool=True,
+        enum_ignore_case: bool=False,
+        enum_prefix_matching: bool=False,
+        spec_cache=None,
+        fast_parsing: bool=False,
+        config_file_option: str=None,
+        extraction_mode: str="docstrings"
 ):
     """Parses the args of the current application based on the provided configuration class, and returns an instance of
     the same that is populated accordingly.
@@ -94,13 +140,33 @@ def parse_args(
         app_name (str): The name of the application that is printed in the synopsis.
         app_description (str): The description of the application that is printed in the synopsis.
         positional_args (bool, optional): Indicates whether required config values should be parsed as positional args.
+        enum_ignore_case (bool, optional): Indicates whether names of ``Enum`` members are matched case-insensitively,
+            as long as this is unambiguous.
+        enum_prefix_matching (bool, optional): Indicates whether unique prefixes of names of ``Enum`` members are
+            accepted.
+        spec_cache (:class:`spec_cache.SpecCache`, optional): A persistent cache for the specification of
+            ``conf_class``, which allows for skipping its introspection when the application is started repeatedly.
+        fast_parsing (bool, optional): Indicates whether args should be parsed by means of a table-driven parser rather
+            than ``argparse``, which is considerably faster for configurations with many values.
+        config_file_option (str, optional): The name of an option that allows for specifying a YAML or JSON file, which
+            provides values of options that are not given on the command line.
+        extraction_mode (str, optional): Specifies whether the types of options are taken from docstrings
+            (``"docstrings"``) or the return annotations of properties (``"annotations"``).
 
     Returns:
         The parsed configuration as an object of type ``conf_class``.
     """
+    from argmagic import magic_parser
+    
     return magic_parser.MagicParser(
             conf_class,
             app_name=app_name,
             app_description=app_description,
-            positional_args=positional_args
+            positional_args=positional_args,
+            enum_ignore_case=enum_ignore_case,
+            enum_prefix_matching=enum_prefix_matching,
+            spec_cache=spec_cache,
+            fast_parsing=fast_parsing,
+            config_file_option=config_file_option,
+            extraction_mode=extraction_mode
     ).parse_args()
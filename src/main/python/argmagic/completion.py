@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+
+"""This module generates static scripts that provide shell completion for the options of a configuration.
+
+The generated scripts contain all options, including the ``--no-`` forms of flags and the options of nested
+configurations, as well as the members of ``Enum``s, and thus complete without starting Python. Values of options whose
+types are deferred (see :class:`type_ref.TypeRef`) are not known without importing them, and are completed by invoking
+this module, which loads the specification from a :class:`spec_cache.SpecCache`, if possible::
+
+    python3 -m argmagic.completion [--cache-dir DIR] [--mode MODE] MODULE.CLASS -- OPTION
+"""
+
+
+import enum
+import re
+import shlex
+import sys
+import typing
+
+from argmagic import config_spec
+from argmagic import config_value
+from argmagic import nested_config
+from argmagic import spec_cache as sc
+from argmagic import type_ref
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+SHELLS = ["bash", "fish", "zsh"]
+"""list[str]: The shells that completion scripts can be generated for."""
+
+_DYNAMIC = object()
+"""object: Marks options whose values are completed by invoking this module."""
+
+_FILES = object()
+"""object: Marks options whose values are paths of files."""
+
+_WORD_REGEX = r"^[^\s\"'`$\\()\[\]{}:;|&<>]+$"
+"""str: A regex that matches completion candidates that do not need to be quoted in any shell."""
+
+
+def complete(
+        conf_class: type,
+        option: str,
+        spec_cache: sc.SpecCache=None,
+        mode: str=config_spec.ConfigSpec.DOCSTRINGS
+) -> typing.List[str]:
+    """Retrieves the candidates for completing the value of an option, which may import the type of the option.
+    
+    This is the dynamic fallback of the generated completion scripts for options whose types are deferred.
+    
+    Args:
+        conf_class (type): The configuration class.
+        option (str): The option whose value is completed, e.g., ``"--color"``.
+        spec_cache (:class:`spec_cache.SpecCache`, optional): A persistent cache that the specification of
+            ``conf_class`` is loaded from, if possible, and stored in, otherwise.
+        mode (str, optional): The extraction mode of the specification (see
+            :meth:`config_spec.ConfigSpec.create_spec`).
+    
+    Returns:
+        list[str]: The candidates, i.e., the names of the members of an ``Enum``, or an empty ``list``, if the values of
+            the option cannot be enumerated or there is no such option.
+    """
+    # load or create the specification
+    spec = None
+    key = None
+    if spec_cache is not None:
+        key = spec_cache.key(conf_class, mode=mode)
+        if key is not None:
+            entry = spec_cache.load(key)
+            if entry is not None:
+                spec = entry[0]
+    if spec is None:
+        spec = config_spec.ConfigSpec.create_spec(conf_class, mode=mode)
+        if key is not None:
+            spec_cache.store(key, spec, spec.option_order())
+    
+    # find the option, which may belong to a nested configuration
+    values = list(spec)
+    if nested_config.SEPARATOR in option:
+        values.extend(nested_config.expand(spec, mode=mode)[0])
+    for conf in values:
+        if option in (conf.option_name, conf.name):
+            data_type = conf.data_type  # this resolves deferred types
+            if isinstance(data_type, type) and issubclass(data_type, enum.Enum):
+                return list(data_type.__members__)
+            break
+    
+    return []
+
+
+def _generate_bash(prog: str, options: typing.List[tuple], command: typing.Optional[str]) -> str:
+    """Generates a bash completion script."""
+    func = "_argmagic_" + re.sub(r"\W", "_", prog)
+    lines = [
+            "# bash completion for {}, generated by argmagic".format(prog),
+            "{}() {{".format(func),
+            "    local cur=\"${COMP_WORDS[COMP_CWORD]}\"",
+            "    local prev=\"${COMP_WORDS[COMP_CWORD-1]}\"",
+            "    case \"$prev\" in"
+    ]
+    
+    # options whose values are completed in the same way are grouped into one case each
+    cases = {}
+    free = []
+    for option, completion in options:
+        if completion is None:
+            continue
+        elif completion is _FILES:
+            cases.setdefault("compgen -f -- \"$cur\"", []).append(option)
+        elif completion is _DYNAMIC:
+            cases.setdefault(
+                    "compgen -W \"$({} {} 2>/dev/null)\" -- \"$cur\"".format(command, option),
+                    [option]
+            )
+        elif completion:
+            cases.setdefault("compgen -W \"{}\" -- \"$cur\"".format(" ".join(completion)), []).append(option)
+        else:
+            free.append(option)
+    for action, case_options in cases.items():
+        lines.append("        {})".format("|".join(case_options)))
+        lines.append("            COMPREPLY=($({}))".format(action))
+        lines.append("            return 0 ;;")
+    if free:
+        lines.append("        {})".format("|".join(free)))
+        lines.append("            return 0 ;;")
+    
+    lines += [
+            "    esac",
+            "    if [[ \"$cur\" == -* ]]; then",
+            "        COMPREPLY=($(compgen -W \"{}\" -- \"$cur\"))".format(" ".join(option for option, _ in options)),
+            "    fi",
+            "}",
+            "complete -o default -F {} {}".format(func, shlex.quote(prog))
+    ]
+    
+    return "\n".join(lines) + "\n"
+
+
+def _generate_fish(prog: str, options: typing.List[tuple], command: typing.Optional[str]) -> str:
+    """Generates a fish completion script."""
+    prefix = "complete -c {} -l ".format(shlex.quote(prog))
+    lines = ["# fish completion for {}, generated by argmagic".format(prog)]
+    for option, completion in options:
+        line = prefix + option[2:]
+        if option == "--help":
+            line += " -s h"
+        elif completion is _FILES:
+            line += " -r -F"
+        elif completion is _DYNAMIC:
+            line += " -x -a \"({} {})\"".format(command, option)
+        elif completion:
+            line += " -x -a \"{}\"".format(" ".join(completion))
+        elif completion is not None:
+            line += " -r"
+        lines.append(line)
+    
+    return "\n".join(lines) + "\n"
+
+
+def generate_script(
+        spec: config_spec.ConfigSpec,
+        prog: str,
+        shell: str="bash",
+        positional_args: bool=True,
+        config_file_option: str=None,
+        extraction_mode: str=config_spec.ConfigSpec.DOCSTRINGS,
+        conf_class: typing.Union[type, str]=None,
+        spec_cache: sc.SpecCache=None,
+        python: str="python3"
+) -> str:
+    """Generates a static script that provides completion for the options of a configuration in a particular shell.
+    
+    Values of options of ``Enum`` types are completed with the names of their members, and values of options whose
+    types are deferred are completed by invoking :func:`complete` through ``python``, if ``conf_class`` is provided.
+    The values of all other options are not completed, except for the path of a config file. The options that are added
+    by custom parser factories (see :class:`magic_parser.MagicParser`) are assumed to be named like the default ones.
+    
+    Args:
+        spec (:class:`config_spec.ConfigSpec`): The specification of the configuration.
+        prog (str): The name of the command that the script completes.
+        shell (str, optional): The shell, which is one of :attr:`SHELLS`. This is ``"bash"`` by default.
+        positional_args (bool, optional): Specifies whether required configuration values are parsed as positional
+            args, i.e., not as options.
+        config_file_option (str, optional): The name of the option for specifying a config file, if any.
+        extraction_mode (str, optional): The extraction mode of the specifications of nested configurations (see
+            :meth:`config_spec.ConfigSpec.create_spec`).
+        conf_class (type or str, optional): The configuration class, or its import path, e.g.,
+            ``"app.config.AppConfig"``, which is used for completing values that need to be looked up when they are
+            completed. Classes that are defined in the script that is run, i.e., in ``__main__``, or in functions
+            cannot be imported by the completion command, and have to be specified by their import paths instead.
+        spec_cache (:class:`spec_cache.SpecCache`, optional): The persistent cache that is used for completing values
+            that need to be looked up.
+        python (str, optional): The Python interpreter that is used for completing values that need to be looked up.
+    
+    Returns:
+        str: The completion script.
+    
+    Raises:
+        ValueError: If ``shell`` is not supported, or if values need to be looked up, but ``conf_class`` is a class
+            that cannot be imported by the completion command.
+    """
+    if shell not in SHELLS:
+        raise ValueError("The parameter <shell> has to be one of {}, but is '{}'!".format(SHELLS, shell))
+    
+    # assemble the options together with their completions, i.e., None for flags, a list of candidates, or one of the
+    # markers _DYNAMIC and _FILES
+    nested_values, _ = nested_config.expand(spec, mode=extraction_mode)
+    options = [("--help", None)]
+    for conf in list(spec) + nested_values:
+        if not (positional_args and conf.required) or nested_config.SEPARATOR in conf.name:
+            options.append((conf.option_name, _get_completion(conf, conf_class is not None)))
+    if config_file_option is not None:
+        options.append(("--" + config_file_option.replace("_", "-"), _FILES))
+    
+    # the command that provides dynamic completions lacks the option only, which is separated by "--", since it starts
+    # with dashes itself
+    command = None
+    if conf_class is not None and any(completion is _DYNAMIC for _, completion in options):
+        command = [python, "-m", "argmagic.completion"]
+        if spec_cache is not None:
+            command += ["--cache-dir", spec_cache.cache_dir]
+        if extraction_mode != config_spec.ConfigSpec.DOCSTRINGS:
+            command += ["--mode", extraction_mode]
+        command += [conf_class if isinstance(conf_class, str) else _import_path(conf_class), "--"]
+        command = " ".join(shlex.quote(part) for part in command)
+    
+    if shell == "bash":
+        return _generate_bash(prog, options, command)
+    elif shell == "fish":
+        return _generate_fish(prog, options, command)
+    else:
+        return _generate_zsh(prog, options, command)
+
+
+def _generate_zsh(prog: str, options: typing.List[tuple], command: typing.Optional[str]) -> str:
+    """Generates a zsh completion script."""
+    lines = [
+            "#compdef {}".format(prog),
+            "# zsh completion for {}, generated by argmagic".format(prog),
+            "_arguments \\"
+    ]
+    for option, completion in options:
+        name = option[2:]
+        if option == "--help":
+            spec = "'(- *)'{-h,--help}"
+        elif completion is None:
+            spec = "'{}'".format(option)
+        elif completion is _FILES:
+            spec = "'{}:{}:_files'".format(option, name)
+        elif completion is _DYNAMIC:
+            spec = "'{}:{}:{{compadd -- ${{(f)\"$({} {} 2>/dev/null)\"}}}}'".format(option, name, command, option)
+        elif completion:
+            spec = "'{}:{}:({})'".format(option, name, " ".join(completion))
+        else:
+            spec = "'{}:{}: '".format(option, name)
+        lines.append("    {} \\".format(spec))
+    lines.append("    '*: :_default'")
+    
+    return "\n".join(lines) + "\n"
+
+
+def _get_completion(conf: config_value.ConfigValue, dynamic: bool) -> typing.Any:
+    """Determines how the value of the provided configuration value is completed (see :func:`generate_script`)."""
+    declared_type = conf.declared_type
+    if declared_type is bool:
+        return None
+    if isinstance(declared_type, type_ref.TypeRef):
+        # deferred types are never resolved here, since this may be expensive or impossible at generation time
+        return _DYNAMIC if dynamic else []
+    if issubclass(declared_type, enum.Enum):
+        # members whose names would need to be quoted are omitted, since the shells quote them differently
+        return [name for name in declared_type.__members__ if re.match(_WORD_REGEX, name)]
+    return []
+
+
+def _import_path(conf_class: type) -> str:
+    """Determines the name that the provided configuration class can be imported by in another process.
+    
+    Raises:
+        ValueError: If the class is defined in ``__main__`` or in a function, since it cannot be imported in this case.
+    """
+    name = type_ref.type_name(conf_class)
+    if conf_class.__module__ == "__main__" or "<locals>" in name:
+        raise ValueError(
+                "The configuration class {} cannot be imported by the completion command, since it is defined in the "
+                "running script or in a function! Please specify its import path instead, e.g., "
+                "'app.config.{}'.".format(name, conf_class.__name__)
+        )
+    
+    return name
+
+
+def main(argv: typing.Sequence[str]=None) -> None:
+    """Prints the candidates for completing the value of an option, one per line (see :func:`complete`)."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(prog="python3 -m argmagic.completion", description=main.__doc__)
+    parser.add_argument("conf_class", help="The name of the configuration class, e.g., app.config.AppConfig.")
+    parser.add_argument("option", help="The option whose value is completed, e.g., --color.")
+    parser.add_argument("--cache-dir", help="The directory of the spec cache.")
+    parser.add_argument("--mode", default=config_spec.ConfigSpec.DOCSTRINGS, help="The extraction mode.")
+    args = parser.parse_args(argv)
+    
+    conf_class = type_ref.resolve(args.conf_class)
+    if not isinstance(conf_class, type):
+        parser.error("there is no class {}".format(args.conf_class))
+    spec_cache = None if args.cache_dir is None else sc.SpecCache(args.cache_dir)
+    
+    for candidate in complete(conf_class, args.option, spec_cache=spec_cache, mode=args.mode):
+        print(candidate)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+
+"""This module implements the export of configurations, which is driven by their specifications.
+
+In contrast to :func:`argmagic.get_config`, the values of configurations are exported without introspecting the
+configuration objects: only those fields that are declared in the :class:`config_spec.ConfigSpec` of a configuration
+class are read, and their values are retained as they are rather than converted to strings.
+"""
+
+
+import array
+import collections.abc
+import enum
+import itertools
+import operator
+import threading
+import typing
+import weakref
+
+import insanity
+
+from argmagic import config_spec
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+FORMATS = ["json", "yaml"]
+"""list[str]: The formats that configurations may be written in."""
+
+TRUNCATION_MARKER = "..."
+"""str: Marks the end of a truncated value, and is used as key of the marker of a truncated ``dict``."""
+
+_exporters = weakref.WeakKeyDictionary()
+"""weakref.WeakKeyDictionary: Maps configuration classes to pairs of their signatures (see
+:meth:`config_spec.ConfigSpec.create_spec`) and the :class:`ConfigExporter`s that were created for them.
+"""
+
+_exporters_lock = threading.Lock()
+"""threading.Lock: Guards :attr:`_exporters`."""
+
+
+def dump_config(conf, stream: typing.TextIO, fmt: str="json", max_items: int=None) -> None:
+    """Writes the values of all options of the provided configuration to a stream.
+    
+    This is a shortcut for ``get_exporter(type(conf)).dump(conf, stream, fmt=fmt, max_items=max_items)``.
+    """
+    get_exporter(type(conf)).dump(conf, stream, fmt=fmt, max_items=max_items)
+
+
+def export_config(conf, max_items: int=None) -> typing.Dict[str, typing.Any]:
+    """Retrieves the values of all options of the provided configuration.
+    
+    This is a shortcut for ``get_exporter(type(conf)).export(conf, max_items=max_items)``.
+    """
+    return get_exporter(type(conf)).export(conf, max_items=max_items)
+
+
+def get_exporter(conf_class: type) -> "ConfigExporter":
+    """Retrieves the :class:`ConfigExporter` for the provided configuration class, which is created only once per class.
+    
+    Just like cached specifications, a cached exporter is replaced if the class changes in a way that affects its
+    specification (see :meth:`config_spec.ConfigSpec.create_spec`).
+    
+    Args:
+        conf_class (type): The configuration class to retrieve the exporter for.
+    
+    Returns:
+        :class:`ConfigExporter`: The exporter.
+    """
+    signature = config_spec.ConfigSpec._class_signature(conf_class)
+    with _exporters_lock:
+        entry = _exporters.get(conf_class)
+    if entry is not None and config_spec.ConfigSpec._same_signature(entry[0], signature):
+        return entry[1]
+    
+    exporter = ConfigExporter(conf_class)
+    with _exporters_lock:
+        _exporters[conf_class] = (signature, exporter)
+    
+    return exporter
+
+
+class ConfigExporter(object):
+    """Exports the values of configurations of a particular class.
+    
+    The fields that are exported are determined once, when the exporter is created, based on the
+    :class:`config_spec.ConfigSpec` of the configuration class, and are read by means of precomputed accessors
+    subsequently. Values are exported as they are, and are converted only when they are written to a stream, which
+    happens lazily in case of JSON, i.e., while the output is written.
+    """
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, conf_class: type, spec: config_spec.ConfigSpec=None):
+        """Creates a new instance of ``ConfigExporter``.
+        
+        Args:
+            conf_class (type): The configuration class whose instances are exported.
+            spec (:class:`config_spec.ConfigSpec`, optional): The specification of ``conf_class``, which is created, if
+                not provided.
+        """
+        insanity.sanitize_type("conf_class", conf_class, type)
+        insanity.sanitize_type("spec", spec, config_spec.ConfigSpec, none_allowed=True)
+        if spec is None:
+            spec = config_spec.ConfigSpec.create_spec(conf_class)
+        
+        self._accessors = [(name, operator.attrgetter(name)) for name in spec.keys()]
+        self._conf_class = weakref.ref(conf_class)  # exporters are cached per class, which must not be kept alive
+        self._nested = spec.nested()
+        self._nested_accessors = [(name, operator.attrgetter(name)) for name in self._nested]
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def conf_class(self) -> typing.Optional[type]:
+        """type: The configuration class whose instances are exported, or ``None``, if it has been garbage-collected."""
+        return self._conf_class()
+    
+    @property
+    def names(self) -> typing.List[str]:
+        """list[str]: The names of the fields that are exported, including those of nested configurations."""
+        return [name for name, _ in self._accessors] + list(self._nested)
+    
+    @property
+    def nested(self) -> typing.Dict[str, type]:
+        """dict: Maps the names of all nested configurations to their classes."""
+        return dict(self._nested)
+    
+    #  METHODS  ########################################################################################################
+    
+    def dump(self, conf, stream: typing.TextIO, fmt: str="json", max_items: int=None) -> None:
+        """Writes the values of all options of the provided configuration to a stream.
+        
+        Values that cannot be represented in the chosen format directly are converted to the closest builtin type,
+        e.g., arrays to lists and ``Enum``s to their values, and to strings, if there is no such type.
+        
+        Args:
+            conf: The configuration to write.
+            stream (file): The text stream to write to.
+            fmt (str, optional): The format to write, which is one of :attr:`FORMATS`. This is ``"json"`` by default.
+            max_items (int, optional): If provided, then values with more items than this are truncated (see
+                :meth:`export`).
+        
+        Raises:
+            ValueError: If ``fmt`` is not supported.
+        """
+        if fmt not in FORMATS:
+            raise ValueError("The parameter <fmt> has to be one of {}, but is '{}'!".format(FORMATS, fmt))
+        values = self.export(conf, max_items=max_items)
+        
+        # these modules are imported here, since they are expensive to import, and configurations are exported rarely
+        if fmt == "json":
+            import json
+            
+            json.dump(values, stream, default=self._to_builtin)
+            stream.write("\n")
+        else:
+            import yaml
+            
+            yaml.dump(
+                    self._to_builtin_recursive(values),
+                    stream,
+                    Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+                    default_flow_style=False,
+                    sort_keys=False
+            )
+    
+    def export(self, conf, max_items: int=None) -> typing.Dict[str, typing.Any]:
+        """Retrieves the values of all options of the provided configuration.
+        
+        Args:
+            conf: The configuration to export, which has to be an instance of :attr:`conf_class`.
+            max_items (int, optional): If provided, then ``list``s, ``dict``s, and arrays with more items than this are
+                truncated to their first ``max_items`` items, which are followed by a note on how many were omitted. For
+                a ``dict``, the note is stored under the key :attr:`TRUNCATION_MARKER`.
+        
+        Returns:
+            dict: Maps the names of the options to their values. Nested configurations are exported recursively, i.e.,
+                as ``dict``s of their own values, which means that those that have not been created yet are created.
+        
+        Raises:
+            TypeError: If ``conf`` is not an instance of :attr:`conf_class`.
+            ValueError: If ``max_items`` is negative.
+        """
+        insanity.sanitize_type("conf", conf, self._conf_class())
+        if max_items is not None:
+            insanity.sanitize_type("max_items", max_items, int)
+            insanity.sanitize_range("max_items", max_items, minimum=0)
+        
+        if max_items is None:
+            values = {name: getter(conf) for name, getter in self._accessors}
+        else:
+            values = {name: self._truncate(getter(conf), max_items) for name, getter in self._accessors}
+        for name, getter in self._nested_accessors:
+            nested_conf = getter(conf)
+            if nested_conf is not None:
+                nested_conf = get_exporter(nested_conf.__class__).export(nested_conf, max_items=max_items)
+            values[name] = nested_conf
+        
+        return values
+    
+    @staticmethod
+    def _to_builtin(value: typing.Any) -> typing.Any:
+        """Converts a value that is not supported by JSON or YAML to the closest builtin type."""
+        if isinstance(value, enum.Enum):
+            return value.value
+        if isinstance(value, collections.abc.Mapping):
+            return dict(value)
+        if isinstance(value, (array.array, collections.abc.Sequence, collections.abc.Set)):
+            return list(value)
+        if callable(getattr(value, "tolist", None)):  # e.g., NumPy arrays and scalars
+            return value.tolist()
+        return str(value)
+    
+    @classmethod
+    def _to_builtin_recursive(cls, value: typing.Any) -> typing.Any:
+        """Converts a value to builtin types that are supported by YAML, including all of its items."""
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, dict):
+            return {k: cls._to_builtin_recursive(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [cls._to_builtin_recursive(v) for v in value]
+        return cls._to_builtin_recursive(cls._to_builtin(value))
+    
+    @classmethod
+    def _truncate(cls, value: typing.Any, max_items: int) -> typing.Any:
+        """Truncates the provided value, if it is a collection with more than ``max_items`` items."""
+        if isinstance(value, (str, bytes)):
+            return value
+        if isinstance(value, collections.abc.Mapping):
+            if len(value) <= max_items:
+                return value
+            truncated = dict(itertools.islice(value.items(), max_items))
+            truncated[TRUNCATION_MARKER] = "{} more items".format(len(value) - max_items)
+            return truncated
+        if hasattr(value, "__len__") and hasattr(value, "__getitem__"):  # e.g., lists, tuples, and arrays
+            try:
+                if len(value) <= max_items:
+                    return value
+            except TypeError:  # e.g., zero-dimensional NumPy arrays
+                return value
+            truncated = cls._to_builtin(value[:max_items])
+            truncated.append("{} ({} more items)".format(TRUNCATION_MARKER, len(value) - max_items))
+            return truncated
+        
+        return value
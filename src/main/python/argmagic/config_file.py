@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+"""This module implements the loading of config files, which specify values of options in YAML or JSON format.
+
+Loaded files are cached in process, and reloaded only if their modification times or sizes change.
+"""
+
+
+import collections
+import os
+import threading
+import typing
+
+from argmagic import config_spec
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+JSON_EXTENSIONS = frozenset([".json"])
+"""frozenset[str]: The extensions of files that are parsed as JSON, while all other files are parsed as YAML."""
+
+MAX_CACHE_SIZE = 64
+"""int: The maximum number of files that are kept in the cache."""
+
+MMAP_THRESHOLD = 1 << 20
+"""int: The size in bytes from which on YAML files are read through a memory-mapped buffer."""
+
+_cache = collections.OrderedDict()
+"""collections.OrderedDict: Maps absolute paths of files to triples (mtime, size, data) in LRU order."""
+
+_cache_hits = 0
+"""int: The number of loads that have been served from the cache."""
+
+_cache_misses = 0
+"""int: The number of loads that required reading a file."""
+
+_cache_lock = threading.Lock()
+"""threading.Lock: Guards the cache and its statistics."""
+
+
+def cache_clear() -> None:
+    """Removes all files from the cache that is used by :func:`load`, and resets its statistics."""
+    global _cache_hits, _cache_misses
+    
+    with _cache_lock:
+        _cache.clear()
+        _cache_hits = 0
+        _cache_misses = 0
+
+
+def cache_info() -> config_spec.CacheInfo:
+    """Retrieves statistics about the cache that is used by :func:`load`.
+    
+    Returns:
+        :class:`config_spec.CacheInfo`: The number of cache hits and misses as well as the number of cached files.
+    """
+    with _cache_lock:
+        return config_spec.CacheInfo(_cache_hits, _cache_misses, len(_cache))
+
+
+def load(path: str) -> typing.Dict[str, typing.Any]:
+    """Loads the values of options that are specified in a config file.
+    
+    Files whose extension is ``.json`` are parsed as JSON, and all other files as YAML. Files are cached by path,
+    modification time, and size, and thus parsed only once as long as they are not changed. Notice that, as a
+    consequence, the returned ``dict`` is shared, and must not be modified.
+    
+    Args:
+        path (str): The path of the config file to load.
+    
+    Returns:
+        dict: Maps names of options to values.
+    
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not well-formed, or does not contain a mapping.
+    """
+    global _cache_hits, _cache_misses
+    
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    
+    with _cache_lock:
+        entry = _cache.get(path)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            _cache.move_to_end(path)
+            _cache_hits += 1
+            return entry[2]
+        _cache_misses += 1
+    
+    # the file is parsed outside the lock, since this may take a while
+    data = _read(path, stat.st_size)
+    if data is None:  # empty files do not specify any values
+        data = {}
+    if not isinstance(data, dict):
+        raise ValueError("config file '{}' does not contain a mapping".format(path))
+    
+    with _cache_lock:
+        _cache[path] = (stat.st_mtime_ns, stat.st_size, data)
+        _cache.move_to_end(path)
+        while len(_cache) > MAX_CACHE_SIZE:
+            _cache.popitem(last=False)
+    
+    return data
+
+
+def _read(path: str, size: int) -> typing.Any:
+    """Parses the file at the provided path.
+    
+    YAML files of at least :attr:`MMAP_THRESHOLD` bytes are memory-mapped rather than copied into a buffer of their own.
+    JSON files, in contrast, are always read at once, since the ``json`` module parses ``bytes`` only, and a
+    memory-mapped file would thus have to be copied anyways.
+    """
+    import mmap
+    
+    is_json = os.path.splitext(path)[1].lower() in JSON_EXTENSIONS
+    with open(path, "rb") as f:
+        if not is_json and size > 0 and size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                return _parse(buffer, is_json)
+        return _parse(f.read(), is_json)
+
+
+def _parse(content: typing.Any, is_json: bool) -> typing.Any:
+    """Parses the content of a config file, which is either ``bytes`` or a binary stream (YAML only)."""
+    # these modules are imported here, since they are expensive to import, and not needed unless a file is read
+    # (PyYAML, in particular, is not needed for JSON files)
+    if is_json:
+        import json
+        
+        return json.loads(content)
+    
+    import yaml
+    
+    try:
+        return yaml.load(content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    except yaml.YAMLError as e:
+        raise ValueError(str(e))
@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+
+"""This module implements canonical encodings, fingerprints, and frozen snapshots of configurations.
+
+The canonical encoding of a configuration is a deterministic byte string that covers the name of its class and the
+values of all options that are declared in its :class:`config_spec.ConfigSpec`. Since it does neither depend on
+``repr``, ``hash``, nor ``pickle``, fingerprints, which are BLAKE2 digests of canonical encodings, are stable across
+processes and versions of Python.
+"""
+
+
+import array
+import collections.abc
+import copy
+import enum
+import hashlib
+import types
+import typing
+
+from argmagic import config_export
+from argmagic import type_ref
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+DIGEST_SIZE = 16
+"""int: The size of fingerprints in bytes."""
+
+
+def encode(conf) -> bytes:
+    """Computes the canonical encoding of the provided configuration.
+    
+    Values are encoded together with tags that describe their types, which means that, e.g., ``1`` and ``1.0`` are
+    encoded differently. The items of ``dict``s and ``set``s are sorted by their encodings, and arrays are encoded like
+    ``list``s of their items.
+    
+    Args:
+        conf: The configuration to encode.
+    
+    Returns:
+        bytes: The encoding.
+    
+    Raises:
+        TypeError: If any option has a value whose type cannot be encoded.
+    """
+    buffer = bytearray()
+    _encode_config(type(conf), config_export.export_config(conf), buffer.extend)
+    return bytes(buffer)
+
+
+def fingerprint(conf) -> str:
+    """Computes the fingerprint of the provided configuration, which is the BLAKE2 digest of its canonical encoding.
+    
+    Args:
+        conf: The configuration to compute the fingerprint of.
+    
+    Returns:
+        str: The fingerprint as hex string.
+    
+    Raises:
+        TypeError: If any option has a value whose type cannot be encoded.
+    """
+    return _fingerprint(type(conf), config_export.export_config(conf))
+
+
+def _create_config(conf_class: type, values: typing.Mapping[str, typing.Any]):
+    """Creates a configuration of the provided class, and populates it, including its nested configurations."""
+    nested = config_export.get_exporter(conf_class).nested
+    conf = conf_class()
+    for name, value in values.items():
+        if name in nested and value is not None:
+            value = _create_config(nested[name], value)
+        setattr(conf, name, value)
+    
+    return conf
+
+
+def _encode(value: typing.Any, write: typing.Callable[[bytes], typing.Any]) -> None:
+    """Writes the canonical encoding of the provided value by means of the function ``write``."""
+    # notice that bool has to be checked before int, and enums before their base types
+    if value is None:
+        write(b"N")
+    elif isinstance(value, bool):
+        write(b"T" if value else b"F")
+    elif isinstance(value, enum.Enum):
+        write(b"e")
+        _encode(type_ref.type_name(type(value)), write)
+        _encode(value.value, write)
+    elif isinstance(value, int):
+        write(b"i%d;" % value)
+    elif isinstance(value, float):
+        write(b"f" + value.hex().encode("ascii") + b";")
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        write(b"s%d:" % len(data))
+        write(data)
+    elif isinstance(value, (bytes, bytearray)):
+        write(b"b%d:" % len(value))
+        write(bytes(value))
+    elif isinstance(value, collections.abc.Mapping):
+        items = sorted((_encode_to_bytes(k), _encode_to_bytes(v)) for k, v in value.items())
+        write(b"d%d:" % len(items))
+        for key, item in items:
+            write(key)
+            write(item)
+    elif isinstance(value, collections.abc.Set):
+        items = sorted(_encode_to_bytes(v) for v in value)
+        write(b"S%d:" % len(items))
+        for item in items:
+            write(item)
+    elif isinstance(value, (array.array, list, tuple)) or callable(getattr(value, "tolist", None)):
+        # arrays, including NumPy arrays, are encoded like (possibly nested) lists
+        if not isinstance(value, (list, tuple)):
+            value = value.tolist()
+            if not isinstance(value, list):  # zero-dimensional NumPy arrays and scalars
+                _encode(value, write)
+                return
+        write(b"l%d:" % len(value))
+        for item in value:
+            _encode(item, write)
+    elif isinstance(value, collections.abc.Sequence):
+        _encode(list(value), write)
+    else:
+        raise TypeError("Values of type {} cannot be encoded canonically!".format(type(value).__qualname__))
+
+
+def _encode_config(
+        conf_class: type,
+        values: typing.Mapping[str, typing.Any],
+        write: typing.Callable[[bytes], typing.Any]
+) -> None:
+    """Writes the canonical encoding of a configuration, which is given by its class and the values of its options."""
+    write(b"argmagic.config:")
+    _encode(type_ref.type_name(conf_class), write)
+    _encode(values, write)
+
+
+def _encode_to_bytes(value: typing.Any) -> bytes:
+    """Computes the canonical encoding of the provided value."""
+    buffer = bytearray()
+    _encode(value, buffer.extend)
+    return bytes(buffer)
+
+
+def _fingerprint(conf_class: type, values: typing.Mapping[str, typing.Any]) -> str:
+    """Computes the fingerprint of a configuration, which is given by its class and the values of its options."""
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    _encode_config(conf_class, values, digest.update)
+    return digest.hexdigest()
+
+
+def _freeze(value: typing.Any) -> typing.Any:
+    """Creates a deeply immutable copy of the provided value, which has the same canonical encoding.
+    
+    ``dict``s are frozen as ``types.MappingProxyType``s, ``set``s as ``frozenset``s, ``bytearray``s as ``bytes``, and
+    ``list``s, arrays, and other sequences as ``tuple``s. NumPy arrays, however, are copied and made read-only.
+    """
+    if value is None or isinstance(value, (bool, enum.Enum, int, float, str, bytes)):
+        return value
+    if isinstance(value, bytearray):
+        return bytes(value)
+    if isinstance(value, collections.abc.Mapping):
+        return types.MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, collections.abc.Set):
+        return frozenset(_freeze(v) for v in value)
+    if type(value).__module__ == "numpy" and type(value).__name__ == "ndarray":
+        value = value.copy()
+        value.setflags(write=False)
+        return value
+    if isinstance(value, (array.array, collections.abc.Sequence)):
+        return tuple(_freeze(v) for v in value)
+    
+    return value
+
+
+class ConfigSnapshot(collections.abc.Mapping):
+    """A frozen copy of the values of a configuration.
+    
+    A ``ConfigSnapshot`` maps the names of all options that are declared for a configuration class to the values that
+    they had when the snapshot was taken, which may be accessed as attributes as well. Snapshots are deeply immutable,
+    i.e., their values are frozen (e.g., ``list``s are provided as ``tuple``s and ``dict``s as read-only mappings), and
+    their fingerprints are computed once only. Therefore, they may be used as keys of ``dict``s efficiently. Two
+    snapshots are equal, if they describe configurations of the same class with equal fingerprints.
+    """
+    
+    __slots__ = ("_conf_class", "_fingerprint", "_frozen", "_hash", "_values")
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, conf):
+        """Creates a new instance of ``ConfigSnapshot``.
+        
+        Args:
+            conf: The configuration to take a snapshot of. Its values are copied deeply.
+        
+        Raises:
+            TypeError: If any option has a value whose type cannot be encoded.
+        """
+        conf_class = type(conf)
+        values = copy.deepcopy(config_export.export_config(conf))  # these are used for creating configurations
+        frozen = _freeze(values)  # these are provided by the snapshot, and thus cannot be modified
+        fp = _fingerprint(conf_class, frozen)
+        object.__setattr__(self, "_conf_class", conf_class)
+        object.__setattr__(self, "_fingerprint", fp)
+        object.__setattr__(self, "_frozen", frozen)
+        object.__setattr__(self, "_hash", int(fp[:16], 16))
+        object.__setattr__(self, "_values", values)
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __delattr__(self, name):
+        raise AttributeError("ConfigSnapshot is immutable")
+    
+    def __eq__(self, other):
+        return self is other or (
+                isinstance(other, ConfigSnapshot) and
+                self._hash == other._hash and
+                self._conf_class is other._conf_class and
+                self._fingerprint == other._fingerprint
+        )
+    
+    def __getattr__(self, name):
+        if name.startswith("_"):  # e.g., slots that have not been populated yet
+            raise AttributeError(name)
+        try:
+            return self._frozen[name]
+        except KeyError:
+            raise AttributeError("'ConfigSnapshot' object has no attribute '{}'".format(name))
+    
+    def __getitem__(self, name):
+        return self._frozen[name]
+    
+    def __hash__(self):
+        return self._hash
+    
+    def __iter__(self):
+        return iter(self._frozen)
+    
+    def __len__(self):
+        return len(self._frozen)
+    
+    def __reduce__(self):
+        return ConfigSnapshot, (self.to_config(),)
+    
+    def __repr__(self):
+        return "ConfigSnapshot({}, fingerprint='{}')".format(self._conf_class.__qualname__, self._fingerprint)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("ConfigSnapshot is immutable")
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def conf_class(self) -> type:
+        """type: The class of the configuration that the snapshot was taken of."""
+        return self._conf_class
+    
+    @property
+    def fingerprint(self) -> str:
+        """str: The fingerprint of the configuration that the snapshot was taken of (see :func:`fingerprint`)."""
+        return self._fingerprint
+    
+    #  METHODS  ########################################################################################################
+    
+    def to_config(self):
+        """Creates a new configuration object of class :attr:`conf_class` with the values of this snapshot.
+        
+        The configuration is created by means of the constructor of :attr:`conf_class`, which has to accept no args, and
+        populated with copies of the values by means of the setters of its options. Nested configurations are created
+        in the same way.
+        
+        Returns:
+            A new configuration.
+        """
+        return _create_config(self._conf_class, copy.deepcopy(self._values))
@@ -1,16 +1,20 @@
 # -*- coding: utf-8 -*-
 
 
-import inspect
-import pydoc
-import re
+import bisect
+import collections
+import enum
+import functools
+import threading
 import typing
+import weakref
 
 import insanity
 
 import argmagic
 
 from argmagic import config_value
+from argmagic import type_ref
 
 
 __author__ = "Patrick Hohenecker"
@@ -43,20 +47,65 @@ __email__ = "mail@paho.at"
 __status__ = "Development"
 
 
+CacheInfo = collections.namedtuple("CacheInfo", ["hits", "misses", "currsize"])
+"""type: Summarizes the state of the cache that is used by :meth:`ConfigSpec.create_spec`."""
+
+
 class ConfigSpec(object):
-    """A specification of a configuration to be parsed."""
+    """A specification of a configuration to be parsed.
+    
+    Besides the configuration values themselves, a ``ConfigSpec`` maintains several indexes, which are updated
+    incrementally whenever a value is added. These allow for looking up values by their positions, their requiredness,
+    their data types, and the names of their command-line options without scanning the entire specification.
+    """
+    
+    ANNOTATIONS = "annotations"
+    """str: The extraction mode that takes types from the return annotations of properties' getters."""
+    
+    DOCSTRINGS = "docstrings"
+    """str: The extraction mode that takes types from the first lines of properties' docstrings."""
+    
+    EXTRACTION_MODES = [DOCSTRINGS, ANNOTATIONS]
+    """list[str]: All supported modes of extracting specifications from configuration classes."""
     
-    DOC_REGEX = r"^((?P<type>\S+):\s+)?(?P<doc>\S.*)$"
+    DOC_REGEX = r"^((?P<type>[^\s\[:]+(\[[^\]]*\])?):\s+)?(?P<doc>\S.*)$"
     """str: A regex pattern for parsing doc strings of properties."""
     
+    GENERIC_TYPE_REGEX = r"^(?P<type>[^\[]+)\[(?P<args>[^\]]*)\]$"
+    """str: A regex pattern for parsing generic types in doc strings of properties, e.g., ``dict[str, float]``."""
+    
+    _cache = weakref.WeakKeyDictionary()  # maps config classes to dicts that map extraction modes to (signature, spec)
+    _cache_hits = 0
+    _cache_misses = 0
+    _cache_lock = threading.Lock()
+    _literal_enums = {}  # maps the values of Literal annotations to the Enums that are used for representing them
+    _type_hints = weakref.WeakKeyDictionary()  # maps getters of properties to their type hints
+    _type_hints_lock = threading.Lock()
+    
     def __init__(self):
         """Create a new instance of ``ConfigSpec``."""
         self._values = {}  # a dict for storing all configurations that are part of this spec as name-value pairs
+        self._nested = {}  # maps the names of nested configurations to their classes
+        self._nested_descriptions = {}  # maps the names of nested configurations to their descriptions
+        
+        # indexes that are maintained as configurations are added
+        self._by_option = {}           # maps option names to configurations
+        self._by_type = {}             # maps data types to lists of configurations
+        self._optional = {}            # the optional configurations as name-value pairs
+        self._positional_keys = []     # the sorted keys (position, sequence number) of all required configurations
+        self._positional_values = []   # all required configurations in the same order as their keys
     
     #  MAGIC FUNCTIONS  ################################################################################################
     
+    def __contains__(self, item):
+        return item in self._values
+    
     def __eq__(self, other):
-        return isinstance(other, ConfigSpec) and set(self._values.values()) == set(other)
+        return (
+                isinstance(other, ConfigSpec) and
+                set(self._values.values()) == set(other) and
+                self._nested == other._nested
+        )
     
     def __getitem__(self, item):
         return self._values[item]
@@ -64,6 +113,9 @@ class ConfigSpec(object):
     def __iter__(self):
         return iter(self._values.values())
     
+    def __len__(self):
+        return len(self._values)
+    
     #  METHODS  ########################################################################################################
     
     def add_config(self, config: config_value.ConfigValue):
@@ -77,23 +129,64 @@ class ConfigSpec(object):
             TypeError: If ``config`` is not of type :class:`config_value.ConfigValue`.
         """
         insanity.sanitize_type("config", config, config_value.ConfigValue)
-        if config.name in self._values:
+        if config.name in self._values or config.name in self._nested:
             raise ValueError("This specification contains a configuration with name '{}' already!".format(config.name))
         
         self._values[config.name] = config
+        
+        # update indexes
+        self._by_option[config.option_name] = config
+        self._by_type.setdefault(config.declared_type, []).append(config)
+        if config.required:
+            # required configurations are sorted by their positions, and those without position come last, in the same
+            # order as they were added
+            key = (float("inf") if config.position is None else config.position, len(self._values))
+            index = bisect.bisect(self._positional_keys, key)
+            self._positional_keys.insert(index, key)
+            self._positional_values.insert(index, config)
+        else:
+            self._optional[config.name] = config
     
-    @classmethod
-    def create_spec(cls, config_cls: type):
-        """Creates a configuration specification based on the provided class.
-
-        The created specification defines one option for each property of the given class except those that start with
-        an underscore. Members whose names start with :attr:`DEFAULT_PREFIX` are assumed to define default values for
-        options. Type and description for each of the options are extracted from the first line of the corresponding
-        docstring.
+    def add_nested(
+            self,
+            name: str,
+            conf_class: type,
+            description: typing.Union[str, config_value.LazyDescription]=""
+    ) -> None:
+        """Adds a nested configuration, i.e., a property whose values are configurations themselves, to the
+        specification.
+        
+        The options of nested configurations are not part of the specification itself, but of the specification of
+        ``conf_class`` (see :meth:`nested_spec`).
         
         Args:
-            config_cls (type): The class that the configuration is based on.
+            name (str): The name of the property.
+            conf_class (type): The configuration class of the property's values.
+            description (str or :class:`config_value.LazyDescription`, optional): A description of the property, which
+                is used if its values are parsed by a custom parser instead (see :meth:`nested_value`).
+        
+        Raises:
+            ValueError: If a config with the same name exists already, or if ``conf_class`` is not a configuration
+                class (see :meth:`is_config_class`).
+            TypeError: If ``conf_class`` is not a type.
         """
+        insanity.sanitize_type("name", name, str)
+        insanity.sanitize_type("conf_class", conf_class, type)
+        if name in self._values or name in self._nested:
+            raise ValueError("This specification contains a configuration with name '{}' already!".format(name))
+        if not self.is_config_class(conf_class):
+            raise ValueError("{} is not a configuration class!".format(conf_class.__qualname__))
+        
+        self._nested[name] = conf_class
+        self._nested_descriptions[name] = description
+    
+    @classmethod
+    def _build_spec(cls, config_cls: type, mode: str=DOCSTRINGS):
+        """Creates a new configuration specification for the provided class without consulting the cache."""
+        # these modules are imported here, since they are expensive to import, and specs are cached in most cases
+        import inspect
+        import re
+        
         spec = ConfigSpec()
 
         # load default values
@@ -111,39 +204,71 @@ class ConfigSpec(object):
                 continue
 
             data_type = None
-            description = None
+            type_args = None
             default_value = None
             position = None
             required = None
-    
-            # fetch and parse summary line of docstring
-            if field.__doc__ is not None:
+            
+            # descriptions, which include the default values, are created lazily, i.e., only if they are needed, e.g.,
+            # for printing the help text -> the type of the default value is part of the key, since, e.g., 1 and 1.0
+            # are equal, but described differently
+            describe_args = (field.__doc__, name in default_values, default_values.get(name))
+            description = config_value.LazyDescription(
+                    functools.partial(cls._describe, *describe_args),
+                    key=describe_args + (type(describe_args[2]),)
+            )
+            
+            # getters may be arbitrary callables, which do not necessarily have a __dict__
+            fget_dict = getattr(field.fget, "__dict__", {})
+            
+            # properties that are declared as nested configurations are expanded into nested options, which does not
+            # depend on whether their types have been imported or not (see decorators.nested)
+            if argmagic.NESTED_KEY in fget_dict:
+                spec.add_nested(name, fget_dict[argmagic.NESTED_KEY], description=description)
+                continue
+            
+            # in annotations mode, the type is taken from the getter's return annotation, if there is any
+            annotation = None
+            if mode == cls.ANNOTATIONS:
+                annotation = cls._get_type_hints(field.fget).get("return")
+            if annotation is not None:
+                data_type, type_args, optional = cls._resolve_annotation(annotation)
+                if optional:
+                    required = False
+            
+            # otherwise, the type is taken from the summary line of the docstring
+            elif field.__doc__ is not None and argmagic.CONFIG_VALUES not in fget_dict:
                 m = re.match(cls.DOC_REGEX, field.__doc__.split("\n")[0])
-                description = m.group("doc")
-                data_type = pydoc.locate(m.group("type")) if m.group("type") is not None else None
-            else:
-                description = "No description available."
+                if m.group("type") is not None:
+                    data_type, type_args = cls._locate_type(m.group("type"))
             
             # check if the field's value is specified as enum
-            if argmagic.CONFIG_VALUES in field.fget.__dict__:
-                data_type = field.fget.__dict__[argmagic.CONFIG_VALUES]
+            if argmagic.CONFIG_VALUES in fget_dict:
+                data_type = fget_dict[argmagic.CONFIG_VALUES]
             
             # if not type is specified at all, then assume it is str
             if data_type is None:
                 data_type = str
             
+            # element types of lists and dicts may be specified by means of an annotation as well, e.g., List[int]
+            if config_value.ConfigValue.type_args_length(data_type) is not None and not type_args:
+                annotation = getattr(field.fget, "__annotations__", {}).get("return")
+                if getattr(annotation, "__origin__", None) is data_type:
+                    type_args = getattr(annotation, "__args__", None)
+                    if type_args is not None and not all(isinstance(t, type) for t in type_args):
+                        type_args = None
+            
             # check if there is a default value for the current field
             if name in default_values:
                 default_value = default_values[name]
-                description += " (Default value: {}.)".format(default_value)
             
             # check if a position has been specified
-            if argmagic.POSITION in field.fget.__dict__:
-                position = field.fget.__dict__[argmagic.POSITION]
+            if argmagic.POSITION in fget_dict:
+                position = fget_dict[argmagic.POSITION]
             
             # check if the field has been marked as optional
-            if argmagic.OPTIONAL_KEY in field.fget.__dict__:
-                required = not field.fget.__dict__[argmagic.OPTIONAL_KEY]
+            if argmagic.OPTIONAL_KEY in fget_dict:
+                required = not fget_dict[argmagic.OPTIONAL_KEY]
             
             # add configuration to specification
             spec.add_config(
@@ -153,12 +278,310 @@ class ConfigSpec(object):
                             data_type,
                             default_value=default_value,
                             position=position,
-                            required=required
+                            required=required,
+                            type_args=type_args
                     )
             )
         
         return spec
     
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Removes all specifications from the cache that is used by :meth:`create_spec`, and resets its statistics."""
+        with cls._cache_lock:
+            cls._cache.clear()
+            ConfigSpec._cache_hits = 0
+            ConfigSpec._cache_misses = 0
+    
+    @classmethod
+    def cache_info(cls) -> CacheInfo:
+        """Retrieves statistics about the cache that is used by :meth:`create_spec`.
+        
+        Returns:
+            :class:`CacheInfo`: The number of cache hits and misses as well as the number of cached specifications.
+        """
+        with cls._cache_lock:
+            return CacheInfo(
+                    ConfigSpec._cache_hits,
+                    ConfigSpec._cache_misses,
+                    sum(len(entries) for entries in cls._cache.values())
+            )
+    
+    @classmethod
+    def create_spec(cls, config_cls: type, use_cache: bool=True, mode: str=DOCSTRINGS):
+        """Creates a configuration specification based on the provided class.
+
+        The created specification defines one option for each property of the given class except those that start with
+        an underscore. Members whose names start with :attr:`DEFAULT_PREFIX` are assumed to define default values for
+        options. Type and description for each of the options are extracted from the first line of the corresponding
+        docstring. Descriptions, however, are created lazily, i.e., only if they are actually needed, e.g., for printing
+        the help text (see :class:`config_value.LazyDescription`).
+        
+        In mode :attr:`ANNOTATIONS`, types are taken from the return annotations of the properties' getters instead,
+        which supports ``Optional[...]``, ``List[...]``, ``Dict[..., ...]``, ``Literal[...]``, and ``Enum``s. Options
+        whose types are specified in this way are not required, if they are ``Optional``. Properties without return
+        annotation are treated like in mode :attr:`DOCSTRINGS`.
+        
+        By default, specifications are cached per class, and the cache holds weak references to the classes only. A
+        cached specification is rebuilt automatically whenever a property or a default value of the class is added,
+        removed, or replaced. Notice that cached specifications are shared, and must thus not be modified. If a
+        specification is going to be modified, then ``use_cache`` should be ``False``.
+        
+        Args:
+            config_cls (type): The class that the configuration is based on.
+            use_cache (bool, optional): Indicates whether the cache should be used. If this is ``False``, then a new
+                specification is created, and the cache remains untouched.
+            mode (str, optional): One of the :attr:`EXTRACTION_MODES`, which specifies where types are taken from.
+        
+        Raises:
+            ValueError: If ``mode`` is not supported, or if an annotation cannot be translated to a type of option.
+        """
+        if mode not in cls.EXTRACTION_MODES:
+            raise ValueError(
+                    "The parameter <mode> has to be one of {}, but is '{}'!".format(cls.EXTRACTION_MODES, mode)
+            )
+        if not use_cache:
+            return cls._build_spec(config_cls, mode)
+        
+        signature = cls._class_signature(config_cls)
+        with cls._cache_lock:
+            entry = cls._cache.get(config_cls, {}).get(mode)
+            if entry is not None and cls._same_signature(entry[0], signature):
+                ConfigSpec._cache_hits += 1
+                return entry[1]
+            ConfigSpec._cache_misses += 1
+        
+        # the spec is built outside of the lock, since this may take a while
+        spec = cls._build_spec(config_cls, mode)
+        with cls._cache_lock:
+            entries = cls._cache.get(config_cls)
+            if entries is None:
+                entries = {}
+                cls._cache[config_cls] = entries
+            entries[mode] = (signature, spec)
+        
+        return spec
+    
+    @classmethod
+    def _describe(cls, doc: typing.Optional[str], has_default_value: bool, default_value: typing.Any) -> str:
+        """Creates the description of an option from the docstring of the according property."""
+        import re
+        
+        if doc is None:
+            description = "No description available."
+        else:
+            description = re.match(cls.DOC_REGEX, doc.split("\n")[0]).group("doc")
+        if has_default_value:
+            description += " (Default value: {}.)".format(default_value)
+        
+        return description
+    
+    @classmethod
+    def _get_type_hints(cls, getter: typing.Callable) -> typing.Dict[str, typing.Any]:
+        """Retrieves the type hints of the provided getter, which are cached as long as the getter exists.
+        
+        If the type hints cannot be resolved, e.g., because of undefined forward references, then the getter is treated
+        as if it had no annotations.
+        """
+        try:
+            with cls._type_hints_lock:
+                return cls._type_hints[getter]
+        except (KeyError, TypeError):
+            pass
+        
+        try:
+            hints = typing.get_type_hints(getter)
+        except Exception:
+            hints = {}
+        
+        try:
+            with cls._type_hints_lock:
+                cls._type_hints[getter] = hints
+        except TypeError:  # the getter cannot be referenced weakly
+            pass
+        
+        return hints
+    
+    @staticmethod
+    def is_config_class(data_type: typing.Any) -> bool:
+        """Checks whether the provided data type is a configuration class, i.e., a class with public properties.
+        
+        Only configuration classes may be used as nested configurations (see :meth:`add_nested`). ``Enum``s and builtin
+        types are never considered configuration classes, and neither are types that have not been resolved yet.
+        """
+        if not isinstance(data_type, type) or data_type.__module__ == "builtins" or issubclass(data_type, enum.Enum):
+            return False
+        return any(
+                isinstance(member, property) and not name.startswith("_")
+                for cls in data_type.__mro__
+                for name, member in vars(cls).items()
+        )
+    
+    @classmethod
+    def _literal_enum(cls, values: tuple) -> typing.Type[enum.Enum]:
+        """Retrieves the ``Enum`` that is used for representing a ``Literal`` with the provided values.
+        
+        The names of the members are the string representations of the values, and the same ``Enum`` is used for all
+        ``Literal``s with equal values.
+        """
+        key = tuple((type(v), v) for v in values)
+        with cls._cache_lock:
+            enum_cls = cls._literal_enums.get(key)
+            if enum_cls is None:
+                enum_cls = enum.Enum("Literal", [(str(v), v) for v in values])
+                cls._literal_enums[key] = enum_cls
+        
+        return enum_cls
+    
+    @classmethod
+    def _resolve_annotation(cls, annotation: typing.Any) -> typing.Tuple[type, typing.Optional[tuple], bool]:
+        """Translates a type annotation to the data type of an option.
+        
+        Returns:
+            tuple: The data type, the types of its elements, if any, and whether the annotation is ``Optional``.
+        
+        Raises:
+            ValueError: If the annotation cannot be translated.
+        """
+        origin = getattr(annotation, "__origin__", None)
+        args = getattr(annotation, "__args__", None) or ()
+        
+        # Optional[X] is Union[X, None]
+        if origin is typing.Union:
+            types = [a for a in args if a is not type(None)]
+            if len(types) != 1:
+                raise ValueError("Unions are not supported as types of options: {}".format(annotation))
+            data_type, type_args, _ = cls._resolve_annotation(types[0])
+            return data_type, type_args, len(types) < len(args)
+        
+        literal = getattr(typing, "Literal", None)
+        if literal is not None and origin is literal:
+            return cls._literal_enum(args), None, False
+        
+        if isinstance(origin, type):
+            expected_len = config_value.ConfigValue.type_args_length(origin)
+            if len(args) == expected_len and all(isinstance(a, type) for a in args):
+                return origin, args, False
+            return origin, None, False
+        
+        if isinstance(annotation, type):
+            return annotation, None, False
+        
+        raise ValueError("Unsupported type of option: {}".format(annotation))
+    
+    @staticmethod
+    def _class_signature(config_cls: type) -> list:
+        """Collects all members of the provided class that :meth:`create_spec` depends on.
+        
+        The signature contains the members themselves rather than copies of them, and thus allows for detecting
+        reassignments by means of identity checks, which is a lot cheaper than building a specification.
+        """
+        signature = []
+        for c in config_cls.__mro__:
+            if c is object:
+                continue
+            for name, member in vars(c).items():
+                if isinstance(member, property):
+                    fget_dict = getattr(member.fget, "__dict__", {})
+                    signature.append(
+                            (
+                                    name,
+                                    member,
+                                    (
+                                            fget_dict.get(argmagic.CONFIG_VALUES),
+                                            fget_dict.get(argmagic.NESTED_KEY),
+                                            fget_dict.get(argmagic.OPTIONAL_KEY),
+                                            fget_dict.get(argmagic.POSITION)
+                                    )
+                            )
+                    )
+                elif name.startswith(argmagic.DEFAULT_PREFIX):
+                    signature.append((name, member, None))
+        
+        return signature
+    
+    @classmethod
+    def _locate_type(cls, type_name: str) -> typing.Tuple[typing.Optional[type], typing.Optional[tuple]]:
+        """Looks up the type that is specified by the provided name, e.g., ``int`` or ``list[int]``.
+        
+        Types that are defined in modules that have not been imported yet are not resolved, but represented by
+        :class:`type_ref.TypeRef`s (see :func:`type_ref.locate`). The types of elements, however, are always resolved.
+        
+        Returns:
+            tuple: The located type, or ``None``, if it cannot be found, and the types of its elements, if specified.
+        """
+        import re
+        
+        m = re.match(cls.GENERIC_TYPE_REGEX, type_name)
+        if m is None:
+            return type_ref.locate(type_name.strip()), None
+        
+        data_type = type_ref.locate(m.group("type").strip())
+        type_args = tuple(type_ref.resolve(t.strip()) for t in m.group("args").split(","))
+        expected_len = config_value.ConfigValue.type_args_length(data_type)
+        if expected_len is None:
+            return data_type, None
+        if any(t is None for t in type_args) or len(type_args) != expected_len:
+            raise ValueError("Illegal type args: '{}'".format(type_name))
+        
+        return data_type, type_args
+    
+    @staticmethod
+    def _same_signature(sig_1: list, sig_2: list) -> bool:
+        """Checks whether two signatures created by :meth:`_class_signature` describe the same state of a class."""
+        if len(sig_1) != len(sig_2):
+            return False
+        for (name_1, member_1, markers_1), (name_2, member_2, markers_2) in zip(sig_1, sig_2):
+            if name_1 != name_2 or member_1 is not member_2 or markers_1 != markers_2:
+                return False
+        
+        return True
+    
+    def by_type(self, data_type: type) -> typing.List[config_value.ConfigValue]:
+        """Retrieves all configuration values of the provided data type in the same order as they were added.
+        
+        Configuration values whose data types have not been resolved yet are included as well, if they refer to
+        ``data_type``, but are not resolved by this method.
+        
+        Args:
+            data_type (type or :class:`type_ref.TypeRef`): The data type to look up.
+        
+        Returns:
+            list[:class:`config_value.ConfigValue`]: The configuration values whose :attr:`config_value.data_type` is
+                ``data_type``.
+        """
+        values = list(self._by_type.get(data_type, ()))
+        if isinstance(data_type, type):
+            values.extend(self._by_type.get(type_ref.TypeRef(type_ref.type_name(data_type)), ()))
+        
+        return values
+    
+    def data_types(self) -> typing.List[type]:
+        """Retrieves the distinct data types of all configuration values in the same order as they were first added.
+        
+        Data types that have not been resolved yet are represented by :class:`type_ref.TypeRef`s.
+        
+        Returns:
+            list[type]: The data types.
+        """
+        return list(self._by_type.keys())
+    
+    def imports(self) -> typing.List[type_ref.ImportRecord]:
+        """Retrieves all imports that were caused by resolving the deferred data types of the configuration values.
+        
+        Since resolved types are shared across specifications, an import is reported by each specification that contains
+        a configuration value of the according type, even if it was caused by resolving the type for another one.
+        
+        Returns:
+            list[:class:`type_ref.ImportRecord`]: The imports.
+        """
+        return [
+                record
+                for data_type in self._by_type
+                if isinstance(data_type, type_ref.TypeRef)
+                for record in data_type.imports
+        ]
+    
     def keys(self) -> typing.List[str]:
         """Retrieves a list that contains the names of all configuration values that are contained in a ``ConfigSpec``.
         
@@ -166,3 +589,87 @@ class ConfigSpec(object):
              list[str]: A list of the names of all configuration values.
         """
         return list(self._values.keys())
+    
+    def lookup_option(self, option_name: str) -> typing.Optional[config_value.ConfigValue]:
+        """Retrieves the configuration value that is specified by the command-line option with the provided name.
+        
+        Args:
+            option_name (str): The name of an option, e.g., ``--some-value`` or ``--no-some-flag`` (see
+                :attr:`config_value.ConfigValue.option_name`).
+        
+        Returns:
+            :class:`config_value.ConfigValue`: The according configuration value, or ``None``, if there is none.
+        """
+        return self._by_option.get(option_name)
+    
+    def nested(self) -> typing.Dict[str, type]:
+        """Retrieves the nested configurations of the specification in the same order as they were added.
+        
+        Returns:
+            dict: Maps the names of nested configurations to their classes.
+        """
+        return dict(self._nested)
+    
+    def nested_spec(self, name: str, mode: str=DOCSTRINGS) -> "ConfigSpec":
+        """Retrieves the specification of the nested configuration with the provided name.
+        
+        Specifications of nested configurations are created on demand, and are cached (see :meth:`create_spec`), which
+        means that they are shared between all specifications that contain nested configurations of the same class.
+        
+        Args:
+            name (str): The name of the nested configuration.
+            mode (str, optional): The extraction mode that is used for creating the specification.
+        
+        Returns:
+            :class:`ConfigSpec`: The specification.
+        
+        Raises:
+            KeyError: If there is no nested configuration with the provided name.
+        """
+        return self.create_spec(self._nested[name], mode=mode)
+    
+    def nested_value(self, name: str) -> config_value.ConfigValue:
+        """Describes the nested configuration with the provided name as an optional configuration value of its class.
+        
+        This is used if the values of a nested configuration are parsed by a custom parser rather than expanded into
+        nested options.
+        
+        Args:
+            name (str): The name of the nested configuration.
+        
+        Returns:
+            :class:`config_value.ConfigValue`: The configuration value.
+        
+        Raises:
+            KeyError: If there is no nested configuration with the provided name.
+        """
+        return config_value.ConfigValue(name, self._nested_descriptions[name], self._nested[name], required=False)
+    
+    def option_order(self) -> typing.List[str]:
+        """Determines the order in which the configuration values are added to an arg parser.
+        
+        Optional values come first, in the same order as they were added, and are followed by all required ones, which
+        are sorted by their positions.
+        
+        Returns:
+            list[str]: The names of all configuration values.
+        """
+        return list(self._optional.keys()) + [conf.name for conf in self._positional_values]
+    
+    def optional_values(self) -> typing.List[config_value.ConfigValue]:
+        """Retrieves all optional configuration values in the same order as they were added.
+        
+        Returns:
+            list[:class:`config_value.ConfigValue`]: The optional configuration values.
+        """
+        return list(self._optional.values())
+    
+    def required_values(self) -> typing.List[config_value.ConfigValue]:
+        """Retrieves all required configuration values sorted by their positions.
+        
+        Values without position are placed last, in the same order as they were added.
+        
+        Returns:
+            list[:class:`config_value.ConfigValue`]: The required configuration values.
+        """
+        return list(self._positional_values)
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+
+import collections.abc
+import itertools
+import typing
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class ConfigSweep(collections.abc.Sequence):
+    """A lazy sequence of configurations that is defined by the cartesian product of multiple values for some of the
+    options of a configuration class.
+    
+    A ``ConfigSweep`` stores every value that is part of the sweep once, and creates configuration objects only when
+    they are accessed. Therefore, sweeps with millions of configurations do not consume any more memory than small
+    ones. The configurations are ordered like the results of ``itertools.product``, i.e., the values of the last axis
+    change fastest, and every configuration can be accessed by its index, which is useful, e.g., for distributing a
+    sweep among multiple workers (see also :meth:`shard`).
+    
+    Instances of this class are usually created by means of :meth:`magic_parser.MagicParser.sweep`.
+    """
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(
+            self,
+            conf_class: type,
+            fields: typing.Sequence[typing.Tuple[str, bool]],
+            base_values: typing.Dict[str, typing.Any],
+            axes: typing.Sequence[typing.Tuple[str, typing.Sequence[typing.Any]]],
+            populate: typing.Callable[[typing.Any, typing.Dict[str, typing.Any]], None]=None
+    ):
+        """Creates a new instance of ``ConfigSweep``.
+        
+        Args:
+            conf_class (type): The configuration class whose instances are created.
+            fields (list[tuple]): Pairs of names and requiredness of all options of ``conf_class`` that are populated.
+                Optional ones are skipped if their value is ``None``.
+            base_values (dict): Maps the names of all options that are not part of the sweep to their values.
+            axes (list[tuple]): Pairs of option names and the sequences of values that are swept for these options.
+            populate (function, optional): Is invoked with every created configuration and the values that it was
+                created from after the ``fields`` have been populated, e.g., for populating nested configurations.
+        """
+        self._conf_class = conf_class
+        self._fields = list(fields)
+        self._base_values = dict(base_values)
+        self._axes = [(name, tuple(values)) for name, values in axes]
+        self._populate = populate
+        
+        self._len = 1
+        for _, values in self._axes:
+            self._len *= len(values)
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        
+        if index < 0:
+            index += self._len
+        if index < 0 or index >= self._len:
+            raise IndexError("sweep index out of range")
+        
+        # decompose the index into one index per axis, where the last axis changes fastest
+        values = dict(self._base_values)
+        for name, axis_values in reversed(self._axes):
+            index, axis_index = divmod(index, len(axis_values))
+            values[name] = axis_values[axis_index]
+        
+        return self._create_config(values)
+    
+    def __iter__(self):
+        names = [name for name, _ in self._axes]
+        values = dict(self._base_values)
+        for combination in itertools.product(*(axis_values for _, axis_values in self._axes)):
+            values.update(zip(names, combination))
+            yield self._create_config(values)
+    
+    def __len__(self):
+        return self._len
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def axes(self) -> typing.Dict[str, typing.Tuple]:
+        """dict: Maps the names of all options that are part of the sweep to the (converted) values that are swept."""
+        return collections.OrderedDict(self._axes)
+    
+    #  METHODS  ########################################################################################################
+    
+    def _create_config(self, values: typing.Dict[str, typing.Any]):
+        """Creates a configuration object that is populated with the provided values."""
+        conf = self._conf_class()
+        for name, required in self._fields:
+            value = values[name]
+            if not required and value is None:
+                continue
+            setattr(conf, name, value)
+        if self._populate is not None:
+            self._populate(conf, values)
+        
+        return conf
+    
+    def shard(self, shard_index: int, num_shards: int) -> typing.Iterator:
+        """Yields the configurations that belong to one of multiple disjoint shards of the sweep.
+        
+        The shard with index ``i`` contains all configurations whose indices ``j`` satisfy ``j % num_shards == i``.
+        
+        Args:
+            shard_index (int): The index of the shard to yield.
+            num_shards (int): The total number of shards.
+        
+        Returns:
+            iterator: The configurations of the requested shard.
+        
+        Raises:
+            ValueError: If ``shard_index`` is not in ``[0, num_shards)``.
+        """
+        if num_shards < 1 or shard_index < 0 or shard_index >= num_shards:
+            raise ValueError(
+                    "The parameter <shard_index> has to be in [0, {}), but is {}!".format(num_shards, shard_index)
+            )
+        for i in range(shard_index, self._len, num_shards):
+            yield self[i]
+    
+    @staticmethod
+    def split(value: str) -> typing.List[str]:
+        """Splits a command-line value that may specify multiple values for a sweep.
+        
+        Multiple values are specified either as comma-separated list, e.g., ``1e-3,1e-4``, or as comma-separated list
+        in brackets, e.g., ``[2,4,8]``.
+        
+        Args:
+            value (str): The value to split.
+        
+        Returns:
+            list[str]: The (unconverted) values that are specified by ``value``.
+        """
+        if len(value) >= 2 and value[0] == "[" and value[-1] == "]":
+            value = value[1:-1]
+        elif "," not in value:
+            return [value]
+        
+        return [v.strip() for v in value.split(",")]
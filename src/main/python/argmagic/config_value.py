@@ -1,11 +1,14 @@
 # -*- coding: utf-8 -*-
 
 
+import array
 import enum
 import typing
 
 import insanity
 
+from argmagic import type_ref
+
 
 __author__ = "Patrick Hohenecker"
 __copyright__ = (
@@ -37,8 +40,112 @@ __email__ = "mail@paho.at"
 __status__ = "Development"
 
 
+class LazyDescription(object):
+    """A description of a configuration value that is created on first use only.
+    
+    Instances of this class may be used as help texts of options of an ``argparse.ArgumentParser``, since they support
+    all string operations that are applied to help texts by ``argparse``.
+    
+    Lazy descriptions are equal, if their texts are. However, if they have the same key, i.e., they are created from the
+    same inputs, then they are considered equal without creating them.
+    """
+    
+    __slots__ = ("_factory", "_key", "_text")
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, factory: typing.Callable[[], str], key: tuple=None):
+        """Creates a new instance of ``LazyDescription``.
+        
+        Args:
+            factory (function): A function that creates the description.
+            key (tuple, optional): The inputs that ``factory`` creates the description from, e.g., a docstring and a
+                default value.
+        """
+        self._factory = factory
+        self._key = key
+        self._text = None
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __bool__(self):
+        return True
+    
+    def __contains__(self, item):
+        return item in str(self)
+    
+    def __eq__(self, other):
+        if isinstance(other, LazyDescription):
+            if self._key is not None and self._key == other._key:
+                return True
+            other = str(other)
+        return str(self) == other
+    
+    def __getattr__(self, name):
+        # all other string operations are applied to the created description
+        return getattr(str(self), name)
+    
+    def __hash__(self):
+        return hash(str(self))
+    
+    def __len__(self):
+        return len(str(self))
+    
+    def __mod__(self, other):
+        return str(self) % other
+    
+    def __reduce__(self):
+        # a lazy description is created before pickling, since the factory may not be picklable
+        return str, (str(self),)
+    
+    def __repr__(self):
+        return "LazyDescription({})".format(repr(self._text) if self._text is not None else "...")
+    
+    def __str__(self):
+        if self._text is None:
+            self._text = str(self._factory())
+            self._factory = None
+        return self._text
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def created(self) -> bool:
+        """bool: Indicates whether the description has been created already."""
+        return self._text is not None
+
+
 class ConfigValue(object):
-    """Describes a single value that is part of a configuration to be parsed."""
+    """Describes a single value that is part of a configuration to be parsed.
+    
+    Instances of ``ConfigValue`` are immutable, which allows for sharing them, e.g., between cached specifications.
+    Their args are validated once when they are created, and their hash values are computed at the same time.
+    
+    The data type may be specified as :class:`type_ref.TypeRef`, which is resolved on first access of
+    :attr:`data_type` or :attr:`exhaustive` only. Use :attr:`declared_type` to retrieve the data type without resolving
+    it.
+    """
+    
+    __slots__ = (
+            "_data_type",
+            "_default_value",
+            "_description",
+            "_exhaustive",
+            "_hash",
+            "_name",
+            "_option_name",
+            "_position",
+            "_required",
+            "_type_args"
+    )
+    
+    TYPE_ARGS_LENGTHS = {array.array: 1, dict: 2, list: 1}
+    """dict: Maps the data types that support :attr:`type_args` to the according numbers of type args.
+    
+    In addition to these, ``numpy.ndarray`` supports a single type arg, which specifies its ``dtype``.
+    """
+    
+    #  CONSTRUCTOR  ####################################################################################################
     
     def __init__(
             self,
@@ -47,101 +154,157 @@ class ConfigValue(object):
             data_type: type,
             default_value=None,
             position: int=None,
-            required: bool=None
+            required: bool=None,
+            type_args: typing.Sequence[type]=None
     ):
         """Creates a new instance of ``ConfigValue``.
         
         Args:
             name (str): Specifies :attr:`name`.
-            description (str): Specifies :attr:`description`.
-            data_type (type): Specifies :attr:`data_type`.
+            description (str or :class:`LazyDescription`): Specifies :attr:`description`.
+            data_type (type or :class:`type_ref.TypeRef`): Specifies :attr:`data_type`.
             default_value (optional): Specifies :attr:`default_value`.
             position (int, optional): Specifies :attr:`position`.
             required (bool, optional): Specifies :attr:`required`.
+            type_args (list[type], optional): Specifies :attr:`type_args`.
         
         Raises:
-            ValueError: If ``data_type`` is ``bool`` and ``default_value`` is ``None``.
+            ValueError: If ``data_type`` is ``bool`` and ``default_value`` is ``None``, or if ``type_args`` are
+                specified for a ``data_type`` other than ``list`` or ``dict`` or have the wrong length.
         """
-        # define attributes for properties
-        self._data_type = None
-        self._default_value = None
-        self._description = None
-        self._exhaustive = None
-        self._name = None
-        self._position = None
-        self._required = None
-        
-        # specify properties
-        self.name = name
-        self.description = description
-        self.data_type = data_type
-        self.default_value = default_value
-        self.position = position
-        if required is not None:
-            self.required = required
+        # sanitize args
+        if not isinstance(data_type, type_ref.TypeRef):
+            insanity.sanitize_type("data_type", data_type, type)
+        insanity.sanitize_type("position", position, int, none_allowed=True)
+        if position is not None:
+            insanity.sanitize_range("position", position, minimum=0)
+        type_args = () if type_args is None else tuple(type_args)
+        if type_args:
+            expected_len = self.type_args_length(data_type)
+            if expected_len is None:
+                raise ValueError("type_args can be specified for configs of type list, dict, or arrays only!")
+            if len(type_args) != expected_len:
+                raise ValueError(
+                        "A ConfigValue of type {} has to have {} type args!".format(
+                                self._type_name(data_type),
+                                expected_len
+                        )
+                )
         
         # if the config value has type bool, then a default value needs to be present
-        if self.data_type == bool and self.default_value is None:
+        if data_type == bool and default_value is None:
             raise ValueError("A ConfigValue with data_type bool has to have a default value!")
+        
+        # specify attributes (notice that __setattr__ is bypassed, since instances are immutable)
+        name = str(name)
+        if not isinstance(description, LazyDescription):
+            description = str(description)
+        # whether a deferred type is exhaustive is determined when it is resolved
+        exhaustive = None if isinstance(data_type, type_ref.TypeRef) else issubclass(data_type, enum.Enum)
+        required = default_value is None if required is None else bool(required)
+        object.__setattr__(self, "_data_type", data_type)
+        object.__setattr__(self, "_default_value", default_value)
+        object.__setattr__(self, "_description", description)
+        object.__setattr__(self, "_exhaustive", exhaustive)
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_option_name", self._create_option_name(name, data_type, default_value))
+        object.__setattr__(self, "_position", position)
+        object.__setattr__(self, "_required", required)
+        object.__setattr__(self, "_type_args", type_args)
+        
+        # neither the default value, which may be of a mutable type, like dict or list, nor the description, which may
+        # be created lazily, are hashed, and neither is the data type, since deferred types are equal to the types that
+        # they refer to
+        object.__setattr__(self, "_hash", hash((name, position, required, type_args)))
     
     #  MAGIC FUNCTIONS  ################################################################################################
     
+    def __delattr__(self, name):
+        raise AttributeError("ConfigValue is immutable")
+    
     def __eq__(self, other):
-        return (
+        return self is other or (
                 isinstance(other, ConfigValue) and
-                self._data_type == other.data_type and
-                self._default_value == other.default_value and
-                self._description == other.description and
-                self._exhaustive == other.exhaustive and
-                self._name == other.name and
-                self._position == other.position and
-                self._required == other.required
+                self._hash == other._hash and
+                self._data_type == other._data_type and
+                self._default_value == other._default_value and
+                self._name == other._name and
+                self._position == other._position and
+                self._required == other._required and
+                self._type_args == other._type_args and
+                self._description == other._description  # lazy descriptions are not created if their keys are equal
         )
     
     def __hash__(self):
-        return hash(
-                "{}-{}-{}-{}-{}-{}".format(
-                    self._data_type,
-                    self._default_value,
-                    self._description,
-                    self._exhaustive,
-                    self._name,
-                    self._required
+        return self._hash
+    
+    def __reduce__(self):
+        return (
+                ConfigValue,
+                (
+                        self._name,
+                        self.description,
+                        self._data_type,
+                        self._default_value,
+                        self._position,
+                        self._required,
+                        self._type_args
                 )
         )
     
+    def __repr__(self):
+        return "ConfigValue(name={!r}, data_type={}, default_value={!r}, position={!r}, required={!r})".format(
+                self._name,
+                self._type_name(self._data_type),
+                self._default_value,
+                self._position,
+                self._required
+        )
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("ConfigValue is immutable")
+    
     #  PROPERTIES  #####################################################################################################
     
     @property
     def data_type(self) -> typing.Union[type, enum.Enum]:
-        """type: The data type of the configuration or an ``Enum`` that completely specifies its possible values."""
+        """type: The data type of the configuration or an ``Enum`` that completely specifies its possible values.
+        
+        If the data type has been specified as :class:`type_ref.TypeRef`, then accessing this property resolves it.
+        """
+        if isinstance(self._data_type, type_ref.TypeRef):
+            return self._data_type.resolve()
         return self._data_type
     
-    @data_type.setter
-    def data_type(self, data_type: typing.Union[type, enum.Enum]) -> None:
-        insanity.sanitize_type("data_type", data_type, type)
-        self._data_type = data_type
-        self._exhaustive = issubclass(data_type, enum.Enum)
+    @property
+    def declared_type(self) -> typing.Union[type, type_ref.TypeRef]:
+        """type or :class:`type_ref.TypeRef`: The data type of the configuration as it has been provided.
+        
+        In contrast to :attr:`data_type`, this does not resolve deferred types.
+        """
+        return self._data_type
     
     @property
     def default_value(self) -> typing.Any:
         """The default value of the specified configuration."""
         return self._default_value
     
-    @default_value.setter
-    def default_value(self, default_value) -> None:
-        self._default_value = default_value
-        if self._required is None:
-            self._required = default_value is None
-    
     @property
     def description(self) -> str:
-        """str: A description of the specified configuration."""
-        return self._description
+        """str: A description of the specified configuration.
+        
+        If the description has been specified as :class:`LazyDescription`, then accessing this property creates it.
+        """
+        return str(self._description)
     
-    @description.setter
-    def description(self, description: str) -> None:
-        self._description = str(description)
+    @property
+    def help_text(self) -> typing.Union[str, "LazyDescription"]:
+        """str or :class:`LazyDescription`: The description of the specified configuration as it has been provided.
+        
+        In contrast to :attr:`description`, this does not create lazy descriptions, and may thus be handed to an
+        ``argparse.ArgumentParser`` as help text, which creates the description only if the help is actually printed.
+        """
+        return self._description
     
     @property
     def exhaustive(self) -> bool:
@@ -150,6 +313,8 @@ class ConfigValue(object):
         The possible values of a configuration are considered to be specified exhaustively, if the :attr:`data_type` is
         given by means of an ``Enum``.
         """
+        if self._exhaustive is None:
+            return issubclass(self.data_type, enum.Enum)
         return self._exhaustive
     
     @property
@@ -157,9 +322,16 @@ class ConfigValue(object):
         """str: The name of the specified configuration."""
         return self._name
     
-    @name.setter
-    def name(self, name: str) -> None:
-        self._name = str(name)
+    @property
+    def option_name(self) -> str:
+        """str: The name of the command-line option that specifies the configuration, e.g., ``--some-value``.
+        
+        This is the name of the configuration with dashes instead of underscores. Flags whose default value is ``True``,
+        however, are disabled by options that start with ``--no-``, e.g., ``--no-some-flag``, or
+        ``--model.no-some-flag`` for options of nested configurations. Notice that required configurations may be parsed
+        as positional args instead.
+        """
+        return self._option_name
     
     @property
     def position(self) -> typing.Union[int, None]:
@@ -169,13 +341,6 @@ class ConfigValue(object):
         """
         return self._position
     
-    @position.setter
-    def position(self, position: typing.Union[int, None]):
-        insanity.sanitize_type("position", position, int, none_allowed=True)
-        if position is not None:
-            insanity.sanitize_range("position", position, minimum=0)
-        self._position = position
-
     @property
     def required(self) -> bool:
         """bool: Indicates whether the specified configuration has to be provided by a user.
@@ -184,6 +349,48 @@ class ConfigValue(object):
         """
         return self._required
     
-    @required.setter
-    def required(self, required: bool) -> None:
-        self._required = bool(required)
+    @property
+    def type_args(self) -> typing.Tuple[type, ...]:
+        """tuple[type]: The types of the elements of a configuration of type ``list`` or ``dict``.
+        
+        For a ``list``, this is the type of its elements, e.g., ``(int,)`` for ``list[int]``, and for a ``dict``, these
+        are the types of its keys and values, e.g., ``(str, float)`` for ``dict[str, float]``. If this is empty, then
+        the types of the elements are not specified.
+        """
+        return self._type_args
+    
+    #  METHODS  ########################################################################################################
+    
+    @classmethod
+    def type_args_length(cls, data_type: type) -> typing.Optional[int]:
+        """Determines the number of :attr:`type_args` that configurations of the provided data type have.
+        
+        Args:
+            data_type (type or :class:`type_ref.TypeRef`): The data type to check.
+        
+        Returns:
+            int: The number of type args, or ``None``, if configurations of type ``data_type`` do not support them.
+        """
+        if isinstance(data_type, type_ref.TypeRef):
+            return 1 if data_type.name == "numpy.ndarray" else None
+        length = cls.TYPE_ARGS_LENGTHS.get(data_type)
+        if length is None and getattr(data_type, "__module__", None) == "numpy" and data_type.__name__ == "ndarray":
+            length = 1
+        
+        return length
+    
+    @staticmethod
+    def _create_option_name(name: str, data_type: type, default_value: typing.Any) -> str:
+        """Creates the :attr:`option_name` of a ``ConfigValue`` with the provided attributes."""
+        if data_type == bool and default_value:
+            # the prefix "no-" is added to the last part of dotted names of nested options, e.g., --model.no-dropout
+            prefix, dot, last = name.rpartition(".")
+            return "--" + (prefix + dot + "no-" + last).replace("_", "-")
+        return "--" + name.replace("_", "-")
+    
+    @staticmethod
+    def _type_name(data_type: typing.Union[type, type_ref.TypeRef]) -> str:
+        """Retrieves the name of the provided data type without resolving deferred types."""
+        if isinstance(data_type, type_ref.TypeRef):
+            return data_type.name
+        return data_type.__qualname__
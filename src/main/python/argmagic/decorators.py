@@ -8,8 +8,6 @@ configuration class.
 import enum
 import typing
 
-import insanity
-
 import argmagic
 
 
@@ -68,7 +66,8 @@ def exhaustive(values: type) -> typing.Callable[[property], property]:
     Args:
         values (type): An enum that specifies the admissible values of the annotated property.
     """
-    insanity.sanitize_type("values", values, type)
+    if not isinstance(values, type):
+        raise TypeError("The parameter <values> has to be a type, but is an instance of {}!".format(type(values)))
     if not issubclass(values, enum.Enum):
         raise TypeError("The parameter <values> has to be an Enum, but type {} is not!".format(type.__name__))
     
@@ -81,6 +80,34 @@ def exhaustive(values: type) -> typing.Callable[[property], property]:
     return _exhaustive
 
 
+def nested(conf_class: type) -> typing.Callable[[property], property]:
+    """A decorator that marks a property of a configuration class as nested configuration, i.e., a property whose values
+    are configurations of the provided class themselves.
+    
+    The options of nested configurations are exposed as dotted options, e.g., ``--optimizer.learning-rate`` for the
+    option ``learning_rate`` of the nested configuration ``optimizer``. Properties are never treated as nested
+    configurations unless they are annotated with this decorator.
+    
+    Args:
+        conf_class (type): The configuration class of the annotated property, which has to have a constructor that
+            accepts no args.
+    """
+    if not isinstance(conf_class, type):
+        raise TypeError(
+                "The parameter <conf_class> has to be a type, but is an instance of {}!".format(type(conf_class))
+        )
+    if conf_class.__module__ == "builtins" or issubclass(conf_class, enum.Enum):
+        raise ValueError("The parameter <conf_class> has to be a configuration class, but is {}!".format(conf_class))
+    
+    def _nested(func: property) -> property:
+        if not isinstance(func, property):
+            raise TypeError("The decorator @nested may be applied to properties only!")
+        func.fget.__dict__[argmagic.NESTED_KEY] = conf_class
+        return func
+    
+    return _nested
+
+
 def position(index: int) -> typing.Callable[[property], property]:
     """A decorator that allows for specifying the position of a property of a configuration class among all parsed
     positional args.
@@ -91,8 +118,11 @@ def position(index: int) -> typing.Callable[[property], property]:
     Args:
         index (int): The index of the annotated configuration in the sequence of positional args.
     """
-    insanity.sanitize_type("index", index, int)
-    insanity.sanitize_range("index", index, minimum=0)
+    # insanity is not used here, since decorators are applied whenever a configuration class is imported
+    if not isinstance(index, int):
+        raise TypeError("The parameter <index> has to be an int, but is an instance of {}!".format(type(index)))
+    if index < 0:
+        raise ValueError("The parameter <index> has to be at least 0, but is {}!".format(index))
     
     def _position(func: property) -> property:
         if not isinstance(func, property):
@@ -2,14 +2,26 @@
 
 
 import argparse
-import collections
+import copy
+import functools
 import re
+import sys
 import typing
+import weakref
 
 import insanity
 
 from argmagic import config_spec
+from argmagic import config_sweep
+from argmagic import config_value
+from argmagic import nested_config
+from argmagic import parse_error
+from argmagic import spec_cache as sc
+from argmagic import tracing
+from argmagic import type_ref
+from argmagic.parsing import array_values
 from argmagic.parsing import default_parser_factory
+from argmagic.parsing import fast_parser
 from argmagic.parsing import parser_factory
 
 
@@ -43,10 +55,99 @@ __email__ = "mail@paho.at"
 __status__ = "Development"
 
 
+_help_cache = weakref.WeakKeyDictionary()
+"""weakref.WeakKeyDictionary: Maps configuration classes to ``dict``s that map the settings of parsers to pairs of the
+signatures of the configuration classes that the help texts depend on (see :meth:`config_spec.ConfigSpec.create_spec`)
+and caches of their rendered help texts.
+"""
+
+
+class _ArgumentParser(argparse.ArgumentParser):
+    """An ``ArgumentParser`` that raises a :class:`parse_error.ParseError` instead of exiting if an error occurs.
+    
+    This allows the :class:`MagicParser` to decide whether an error should terminate the application.
+    
+    Furthermore, the help text is rendered per argument group on demand, and cached in a ``dict`` that may be shared
+    between parsers with the same options. The rendered help is the same as the one of an ``argparse.ArgumentParser``.
+    """
+    
+    def __init__(self, *args, help_cache: dict=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._help_cache = {} if help_cache is None else help_cache
+    
+    def _cached(self, key: tuple, render: typing.Callable[[], typing.Any]) -> typing.Any:
+        """Retrieves a part of the help text from the cache, and renders it, if necessary."""
+        # notice that the width of the help text depends on the terminal, and is thus part of the key
+        key = key + (self._get_formatter()._width,)
+        value = self._help_cache.get(key)
+        if value is None:
+            value = render()
+            self._help_cache[key] = value
+        return value
+    
+    def error(self, message: str):
+        raise parse_error.ParseError(message)
+    
+    def format_group_help(self, title: str) -> str:
+        """Renders the help text of the argument group with the provided title, e.g., ``"positional arguments"``.
+        
+        Raises:
+            ValueError: If there is no argument group with the provided title.
+        """
+        for group in self._action_groups:
+            if group.title == title:
+                return self._cached(("group", title), lambda: self._render_group(group))
+        raise ValueError("There is no argument group with title '{}'!".format(title))
+    
+    def format_help(self) -> str:
+        parts = [self._cached(("header",), self._render_header)]
+        parts.extend(self.format_group_help(group.title) for group in self._action_groups if group._group_actions)
+        if self.epilog:
+            parts.append(self._cached(("epilog",), lambda: self._format_text(self.epilog)))
+        return "\n".join(parts)
+    
+    def _format_text(self, text: str) -> str:
+        """Renders a paragraph of text in the same way as the description."""
+        formatter = self._get_formatter()
+        formatter.add_text(text)
+        return formatter.format_help()
+    
+    def _invocation_length(self) -> int:
+        """Computes the length of the longest invocation of any option, which determines the alignment of help texts."""
+        formatter = self._get_formatter()
+        formatter.start_section(None)
+        for group in self._action_groups:
+            formatter.add_arguments(group._group_actions)  # this does not render the help texts of the args
+        return formatter._action_max_length
+    
+    def _render_group(self, group: argparse._ArgumentGroup) -> str:
+        """Renders the help text of a single argument group."""
+        formatter = self._get_formatter()
+        formatter.start_section(group.title)
+        formatter.add_text(group.description)
+        formatter.add_arguments(group._group_actions)
+        formatter.end_section()
+        formatter._action_max_length = max(
+                formatter._action_max_length,
+                self._cached(("invocation_length",), self._invocation_length)
+        )
+        return formatter.format_help()
+    
+    def _render_header(self) -> str:
+        """Renders the usage and description of the help text."""
+        formatter = self._get_formatter()
+        formatter.add_usage(self.usage, self._actions, self._mutually_exclusive_groups)
+        formatter.add_text(self.description)
+        return formatter.format_help()
+
+
 class MagicParser(object):
     """TODO"""
     # TODO
     
+    CONFIG_FILE_DEST = "argmagic.config_file"
+    """str: The name of the attribute that the path of a config file is parsed into."""
+    
     ARG_VALUE_REGEX = r"\<[^\>]+\>"
     """str: A regex that matches parameters of the format <param_name> in error messages created by the insanity
     package.
@@ -59,7 +160,14 @@ class MagicParser(object):
             app_name: str=None,
             app_description: str=None,
             positional_args: bool=True,
-            custom_parsers: typing.Dict[type, parser_factory.ParserFactory]=None
+            enum_ignore_case: bool=False,
+            enum_prefix_matching: bool=False,
+            custom_parsers: typing.Dict[type, parser_factory.ParserFactory]=None,
+            spec_cache: sc.SpecCache=None,
+            fast_parsing: bool=False,
+            config_file_option: str=None,
+            extraction_mode: str=config_spec.ConfigSpec.DOCSTRINGS,
+            trace: typing.Union[bool, tracing.Tracer]=None
     ):
         """Creates a new instance of ``MagicParser``.
         
@@ -73,9 +181,27 @@ class MagicParser(object):
                 printed in the help text.
             positional_args (bool, optional): Specifies whether the parser should use positional args for required
                 configuration values.
+            enum_ignore_case (bool, optional): Specifies whether names of ``Enum`` members are matched
+                case-insensitively, as long as this is unambiguous.
+            enum_prefix_matching (bool, optional): Specifies whether unique prefixes of names of ``Enum`` members are
+                accepted.
             custom_parsers (dict, optional): An optional ``dict`` that maps types to objects of type
                 :class:`parser_factory.ParserFactory`. This allows for providing custom parsers for configuration values
                 of certain data types.
+            spec_cache (:class:`spec_cache.SpecCache`, optional): A persistent cache that the specification of the
+                configuration is loaded from, if possible, and stored in, otherwise.
+            fast_parsing (bool, optional): Specifies whether args should be parsed by means of a
+                :class:`fast_parser.FastParser`, which is considerably faster for configurations with many values. In
+                this case, ``argparse`` is used only for printing help texts and reporting errors.
+            config_file_option (str, optional): The name of an option, e.g., ``"config"``, that allows for specifying a
+                YAML or JSON file, which provides values of options. Options that are given on the command line take
+                precedence over the values in the file. By default, no such option is added.
+            extraction_mode (str, optional): Specifies whether the types of options are taken from docstrings or
+                annotations (see :meth:`config_spec.ConfigSpec.create_spec`).
+            trace (bool or :class:`tracing.Tracer`, optional): Specifies whether creating the parser as well as parsing
+                configurations is traced. If this is ``True``, then a new :class:`tracing.Tracer` is created, which is
+                available as :attr:`tracer` subsequently. By default, tracing is enabled if the environment variable
+                :attr:`tracing.ENV_VAR` is set.
         """
         # sanitize args
         insanity.sanitize_type("conf_class", conf_class, type)
@@ -87,46 +213,157 @@ class MagicParser(object):
                     custom_parsers.values(),
                     elements_type=parser_factory.ParserFactory
             )
+        insanity.sanitize_type("spec_cache", spec_cache, sc.SpecCache, none_allowed=True)
+        insanity.sanitize_type("config_file_option", config_file_option, str, none_allowed=True)
+        insanity.sanitize_type("extraction_mode", extraction_mode, str)
+        insanity.sanitize_type("trace", trace, (bool, tracing.Tracer), none_allowed=True)
+        
+        # set up tracing, which is disabled if the tracer is None
+        if trace is None:
+            self._tracer = tracing.get_tracer()
+        elif trace is True:
+            self._tracer = tracing.Tracer()
+        else:
+            self._tracer = trace or None
+        tracer = self._tracer
         
-        # save config class and create specification for parsing
+        # save config class as well as all other args, which are needed for creating the same parser in other processes
         self._conf_class = conf_class
-        self._spec = config_spec.ConfigSpec.create_spec(conf_class)
+        self._parser_kwargs = {
+                "app_name": app_name,
+                "app_description": app_description,
+                "positional_args": positional_args,
+                "enum_ignore_case": enum_ignore_case,
+                "enum_prefix_matching": enum_prefix_matching,
+                "custom_parsers": custom_parsers,
+                "spec_cache": spec_cache,
+                "fast_parsing": fast_parsing,
+                "config_file_option": config_file_option,
+                "extraction_mode": extraction_mode,
+                "trace": trace if isinstance(trace, bool) else None  # tracers are not shared between processes
+        }
+        
+        # load or create specification for parsing
+        cache_key = None
+        cache_entry = None
+        if spec_cache is not None:
+            with tracing.span(tracer, "load_spec", conf_class=conf_class.__qualname__):
+                cache_key = spec_cache.key(conf_class, custom_parsers, mode=extraction_mode)
+                if cache_key is not None:
+                    cache_entry = spec_cache.load(cache_key)
+        if cache_entry is not None:
+            self._spec, option_order = cache_entry
+        else:
+            with tracing.span(tracer, "create_spec", conf_class=conf_class.__qualname__):
+                self._spec = config_spec.ConfigSpec.create_spec(conf_class, mode=extraction_mode)
+                option_order = self._spec.option_order()
+            if cache_key is not None:
+                with tracing.span(tracer, "store_spec", conf_class=conf_class.__qualname__):
+                    spec_cache.store(cache_key, self._spec, option_order)
         
         # create dict that maps types to factories for adding options to our parser (that is created subsequently)
-        default_factory = default_parser_factory.DefaultParserFactory(positional_args)
-        factory_functions = collections.defaultdict(lambda: default_factory)
-        if custom_parsers is not None:
-            factory_functions.update(custom_parsers)
+        default_factory = default_parser_factory.DefaultParserFactory(
+                positional_args,
+                enum_ignore_case=enum_ignore_case,
+                enum_prefix_matching=enum_prefix_matching
+        )
+        factory_functions = dict(custom_parsers or {})
         
-        # //////// Sort Configuration Values ---------------------------------------------------------------------------
+        # factories for types that have not been resolved yet are looked up by name, which does not resolve them
+        factories_by_name = {type_ref.type_name(t): f for t, f in (custom_parsers or {}).items()}
         
-        conf_indices = {}  # maps config values to indices
-        max_index = 0      # store the highest index encountered yet
-
-        # run through all values in the specification
-        for conf in self._spec:
-            # non-required config values are parsed as options, and thus don't need an index
-            if not conf.required:
-                conf_indices[conf] = -1
-            # for required config values, check whether an index has been specified in the config class
-            elif conf.position is not None:
-                conf_indices[conf] = conf.position
-                max_index = max(max_index, conf.position)
-        
-        # run once again through all values in the specification, and assign them (max_index + 1) as index, i.e., the
-        # last position, if they don't have one yet
-        for conf in self._spec:
-            if conf not in conf_indices:
-                conf_indices[conf] = max_index + 1
+        def get_factory(conf: config_value.ConfigValue, default: parser_factory.ParserFactory):
+            if isinstance(conf.declared_type, type_ref.TypeRef):
+                return factories_by_name.get(conf.declared_type.name, default)
+            return factory_functions.get(conf.declared_type, default)
         
         # //////// Create Arg Parser -----------------------------------------------------------------------------------
 
-        # create arg parser
-        self._parser = argparse.ArgumentParser(prog=str(app_name), description=str(app_description))
+        # options of nested configurations are never positional, and they are absent from parsed values unless they are
+        # specified, since nested configurations are created only if any of their options is given
+        # the options have to be known in advance to build the arg parser, and are thus cached per configuration class
+        nested_values, self._nested = nested_config.expand(
+                self._spec,
+                mode=extraction_mode,
+                exclude=factory_functions.keys(),
+                conf_class=conf_class
+        )
+        
+        # create arg parser, whose help text is cached per configuration class, unless there are custom factories, which
+        # may create different options for the same configuration values -> the cached help text is discarded whenever
+        # the specification of the class or any nested one is rebuilt, e.g., because a default value was reassigned
+        help_cache = None
+        if custom_parsers is None:
+            help_key = (str(app_name), str(app_description), positional_args, config_file_option, extraction_mode)
+            signature = nested_config._signature(conf_class, self._nested)
+            help_caches = _help_cache.setdefault(conf_class, {})
+            entry = help_caches.get(help_key)
+            if entry is None or not config_spec.ConfigSpec._same_signature(entry[0], signature):
+                entry = (signature, {})
+                help_caches[help_key] = entry
+            help_cache = entry[1]
+        self._parser = _ArgumentParser(prog=str(app_name), description=str(app_description), help_cache=help_cache)
         
         # run through all configuration values and add them to the arg parser
-        for conf in sorted(self._spec, key=(lambda x: conf_indices[x])):
-            factory_functions[conf.data_type].create_parser(self._parser, conf)
+        with tracing.span(tracer, "build_parser", options=len(option_order)):
+            self._options = {}
+            for name in option_order:
+                conf = self._spec[name]
+                with tracing.span(tracer, "build_option", option=name):
+                    get_factory(conf, default_factory).create_parser(self._parser, conf)
+                self._options[name] = conf
+            
+            # nested configurations whose classes have custom parsers are parsed like any other optional value
+            custom_nested = []
+            for name, nested_class in self._spec.nested().items():
+                if nested_class in factory_functions:
+                    conf = self._spec.nested_value(name)
+                    with tracing.span(tracer, "build_option", option=name):
+                        factory_functions[nested_class].create_parser(self._parser, conf)
+                    self._options[name] = conf
+                    custom_nested.append(name)
+            
+            # options of nested configurations are added subsequently, and are never positional
+            self._nested_values = [self._options[name] for name in custom_nested] + nested_values
+            if nested_values:
+                nested_factory = default_parser_factory.DefaultParserFactory(
+                        False,
+                        enum_ignore_case=enum_ignore_case,
+                        enum_prefix_matching=enum_prefix_matching
+                )
+                for conf in nested_values:
+                    with tracing.span(tracer, "build_option", option=conf.name):
+                        get_factory(conf, nested_factory).create_parser(self._parser, conf)
+                    self._options[conf.name] = conf
+                for action in self._parser._actions:
+                    if nested_config.SEPARATOR in action.dest and action.dest in self._options:
+                        action.default = argparse.SUPPRESS
+            
+            # if tracing is enabled, then the conversion of every value is traced as well
+            if tracer is not None:
+                for action in self._parser._actions:
+                    if action.dest in self._options and callable(action.type):
+                        action.type = tracer.wrap("convert", action.type, option=action.dest)
+        
+        # add an option for specifying a config file, if requested
+        self._config_file_option = None if config_file_option is None else "--" + config_file_option.replace("_", "-")
+        self._config_file_parsers = None
+        if config_file_option is not None:
+            self._parser.add_argument(
+                    self._config_file_option,
+                    dest=self.CONFIG_FILE_DEST,
+                    metavar="PATH",
+                    help="A YAML or JSON file that specifies values of options. Options that are given on the command "
+                         "line take precedence."
+            )
+        
+        # create a fast parser that mirrors the arg parser, if requested
+        self._fast_parser = fast_parser.FastParser(self._parser) if fast_parsing else None
+        
+        # precompute the fields that are populated for every parsed configuration
+        self._fields = [(conf.name, conf.required) for conf in self._spec] + [(name, False) for name in custom_nested]
+        self._populate_nested = functools.partial(nested_config.populate, nested=self._nested) if self._nested else None
+        self._record_parser = None
     
     #  PROPERTIES  #####################################################################################################
     
@@ -135,8 +372,51 @@ class MagicParser(object):
         """:class:`config_spec.ConfigSpec`: The configuration that is used for parsing command-line args."""
         return self._spec
     
+    @property
+    def tracer(self) -> typing.Optional[tracing.Tracer]:
+        """:class:`tracing.Tracer`: The tracer that records the spans of this parser, or ``None``, if it is disabled."""
+        return self._tracer
+    
     #  METHODS  ########################################################################################################
     
+    def completion_script(self, shell: str="bash", prog: str=None, import_path: str=None) -> str:
+        """Generates a static script that provides completion for the options of this parser in the provided shell.
+        
+        This is a shortcut for :func:`completion.generate_script` with the settings of this parser.
+        
+        Args:
+            shell (str, optional): The shell, which is one of :attr:`completion.SHELLS`. This is ``"bash"`` by default.
+            prog (str, optional): The name of the command that the script completes. By default, this is the name of the
+                application, if it was provided, and the name of the running script, otherwise.
+            import_path (str, optional): The import path of the configuration class, e.g., ``"app.config.AppConfig"``,
+                which is needed for completing values of deferred types if the class is defined in the running script.
+        
+        Returns:
+            str: The completion script.
+        
+        Raises:
+            ValueError: If ``shell`` is not supported, or if values of deferred types need to be completed, but the
+                configuration class is defined in the running script, and ``import_path`` is not provided.
+        """
+        import os
+        
+        from argmagic import completion
+        
+        if prog is None:
+            prog = self._parser_kwargs["app_name"] or os.path.basename(sys.argv[0])
+        
+        return completion.generate_script(
+                self._spec,
+                str(prog),
+                shell=shell,
+                positional_args=self._parser_kwargs["positional_args"],
+                config_file_option=self._parser_kwargs["config_file_option"],
+                extraction_mode=self._parser_kwargs["extraction_mode"],
+                conf_class=self._conf_class if import_path is None else import_path,
+                spec_cache=self._parser_kwargs["spec_cache"],
+                python=sys.executable or "python3"
+        )
+    
     def error(self, msg: typing.Optional[str]) -> None:
         """Prints a usage message incorporating the provided error message to stderr and exits.
         
@@ -149,38 +429,390 @@ class MagicParser(object):
         """
         # reformat parameter names such that they match the names that are printed in the synopsis
         if msg is not None:
-            msg = re.sub(
-                    self.ARG_VALUE_REGEX,
-                    lambda m: m.group(0)[1:-1].upper(),  # maps <param_name> -> PARAM_NAME
-                    msg
+            msg = self._format_message(msg)
+        
+        # call the error function of argparse, which prints the usage and exits (notice that the parser itself raises)
+        argparse.ArgumentParser.error(self._parser, msg)
+    
+    def format_help(self, group: str=None) -> str:
+        """Renders the help text that is printed for the option ``--help``.
+        
+        Help texts are rendered on demand, per argument group, and are cached per configuration class. In particular,
+        the descriptions of options are created only when the help text of their group is rendered for the first time.
+        
+        Args:
+            group (str, optional): The title of an argument group, e.g., ``"positional arguments"``. If provided, then
+                only the help text of this group is rendered.
+        
+        Returns:
+            str: The help text.
+        
+        Raises:
+            ValueError: If there is no argument group with the title ``group``.
+        """
+        if group is None:
+            return self._parser.format_help()
+        return self._parser.format_group_help(group)
+    
+    def _format_message(self, msg: str) -> str:
+        """Replaces all references to config values of the format ``<param_name>`` in the provided message with the
+        names that are printed in the synopsis.
+        """
+        return re.sub(
+                self.ARG_VALUE_REGEX,
+                lambda m: m.group(0)[1:-1].upper(),  # maps <param_name> -> PARAM_NAME
+                msg
+        )
+    
+    def _get_config_file_parsers(self) -> typing.Tuple[argparse.ArgumentParser, argparse.ArgumentParser]:
+        """Retrieves the arg parsers that are used if a config file is given, and creates them, if necessary.
+        
+        Returns:
+            tuple: An arg parser that extracts the path of the config file from the args, and one that parses the args
+                on top of the values in the config file. In the latter, positional args are optional, since their
+                values may be specified in the file.
+        """
+        def keep_suppressed(type_func: typing.Callable[[str], typing.Any]) -> typing.Callable[[str], typing.Any]:
+            # argparse converts the default values of missing positional args, even if they are suppressed
+            def convert(value: str) -> typing.Any:
+                return value if value is argparse.SUPPRESS else type_func(value)
+            convert.__name__ = getattr(type_func, "__name__", repr(type_func))  # this is part of error messages
+            return convert
+        
+        if self._config_file_parsers is None:
+            # abbreviations are not resolved, since the args may contain options that are unknown to this parser
+            option_parser = _ArgumentParser(add_help=False, allow_abbrev=False)
+            option_parser.add_argument(self._config_file_option, dest=self.CONFIG_FILE_DEST)
+            
+            file_parser = self._parser
+            if any(not action.option_strings and action.required for action in self._parser._actions):
+                file_parser = _ArgumentParser(
+                        prog=self._parser.prog,
+                        add_help=False,
+                        allow_abbrev=self._parser.allow_abbrev
+                )
+                file_parser.format_help = self._parser.format_help
+                for action in self._parser._actions:
+                    if not action.option_strings and action.required:
+                        # positional args that are not given retain the value that is specified in the config file
+                        action = copy.copy(action)
+                        action.nargs = "*" if isinstance(action, array_values.ArrayAction) else "?"
+                        action.required = False
+                        action.default = argparse.SUPPRESS
+                        if action.type is not None:
+                            action.type = keep_suppressed(action.type)
+                    file_parser._add_action(action)
+            
+            self._config_file_parsers = (option_parser, file_parser)
+        
+        return self._config_file_parsers
+    
+    def _get_record_parser(self):
+        """Retrieves the :class:`record_parser.RecordParser` that is used for converting values that are not given as
+        command-line args, and creates it, if necessary.
+        """
+        if self._record_parser is None:
+            from argmagic import record_parser
+            
+            self._record_parser = record_parser.RecordParser(
+                    self._conf_class,
+                    self._spec,
+                    self._parser,
+                    nested_values=self._nested_values,
+                    nested=self._nested
             )
         
-        # call error function of the used parser
-        self._parser.error(msg)
+        return self._record_parser
     
-    def parse_args(self):
-        """Parses the args of the current application based on the configuration class that was handed to the
-        ``MagicParser``, and returns an instance of this very class that has been populated accordingly.
-
+    def _load_config_file(self, path: str) -> typing.Dict[str, typing.Any]:
+        """Loads the values of options that are specified in the config file at the provided path.
+        
+        Raises:
+            :class:`parse_error.ParseError`: If the file cannot be read or parsed.
+            TypeError, ValueError: If the file specifies unknown options or illegal values.
+        """
+        from argmagic import config_file
+        
+        try:
+            record = config_file.load(path)
+        except (OSError, ValueError) as e:
+            raise parse_error.ParseError("cannot load config file '{}': {}".format(path, e))
+        
+        # loaded files are cached, and thus mutable values must not be shared with configuration objects
+        values = self._get_record_parser().convert_record(record)
+        for name, value in values.items():
+            if isinstance(value, (dict, list)):
+                values[name] = copy.deepcopy(value)
+        
+        return values
+    
+    def _parse(self, args: typing.Sequence[str], fast: typing.Optional[fast_parser.FastParser]):
+        """Parses the provided args, and creates an according configuration object.
+        
+        Args:
+            args (list[str]): The args to parse.
+            fast (:class:`fast_parser.FastParser`): The fast parser to try first, or ``None``.
+        
         Returns:
             The parsed configuration.
+        
+        Raises:
+            :class:`parse_error.ParseError`: If the args cannot be parsed by ``argparse``.
+            TypeError, ValueError: If any of the parsed values is rejected by the configuration class.
         """
-        try:
-            # parse args
-            args = self._parser.parse_args()
+        tracer = self._tracer
+        with tracing.span(tracer, "parse", args=len(args)):
+            # if a config file is given, then it is extracted from the args first, since the file may specify values
+            # that are required otherwise
+            config_file = None
+            if self._config_file_option is not None:
+                option_parser, _ = self._get_config_file_parsers()
+                config_file = getattr(option_parser.parse_known_args(args)[0], self.CONFIG_FILE_DEST)
+            
+            # parse args -> if the fast parser cannot handle them, then argparse is used, e.g., for reporting errors
+            values = None
+            if config_file is None:
+                with tracing.span(tracer, "tokenize"):
+                    if fast is not None:
+                        values = fast.parse(args)
+                    if values is None:
+                        values = vars(self._parser.parse_args(args))
+                config_file = values.get(self.CONFIG_FILE_DEST)  # the option may have been abbreviated
+            
+            # the args are parsed on top of the values in the config file, since argparse does not overwrite values
+            # that are present in the namespace with defaults
+            if config_file is not None:
+                with tracing.span(tracer, "config_file", path=config_file):
+                    values = self._parse_with_config_file(args, config_file)
             
             # create and populate configuration object
-            conf = self._conf_class()
-            for config_value in self._spec:
-                # get parsed value for current config value
-                value = getattr(args, config_value.name)
+            with tracing.span(tracer, "populate"):
+                conf = self._conf_class()
+                for name, required in self._fields:
+                    # get parsed value for current config value
+                    value = values[name]
+                    
+                    # if current config value is optional and no value was provided -> skip
+                    if not required and value is None:
+                        continue
+                    
+                    if tracer is None:
+                        setattr(conf, name, value)
+                    else:
+                        with tracer.span("set", option=name):
+                            setattr(conf, name, value)
                 
-                # if current config value is optional and no value was provided -> skip
-                if not config_value.required and value is None:
-                    continue
-                
-                setattr(conf, config_value.name, value)
+                if self._populate_nested is not None:
+                    self._populate_nested(conf, values)
+        
+        return conf
+    
+    def _parse_with_config_file(self, args: typing.Sequence[str], path: str) -> typing.Dict[str, typing.Any]:
+        """Parses the provided args on top of the values that are specified in the config file at the given path.
         
-            return conf
+        Raises:
+            :class:`parse_error.ParseError`: If the args cannot be parsed, or the file cannot be loaded.
+            TypeError, ValueError: If the file specifies unknown options or illegal values.
+        """
+        _, file_parser = self._get_config_file_parsers()
+        values = vars(file_parser.parse_args(args, argparse.Namespace(**self._load_config_file(path))))
+        
+        # positional args are required, unless they are specified in the config file
+        missing = [
+                argparse._get_action_name(action)
+                for action in file_parser._actions
+                if action.default is argparse.SUPPRESS and not action.option_strings and action.dest not in values
+        ]
+        if missing:
+            raise parse_error.ParseError("the following arguments are required: {}".format(", ".join(missing)))
+        
+        return values
+    
+    def parse_args(self, args: typing.Sequence[str]=None):
+        """Parses the args of the current application based on the configuration class that was handed to the
+        ``MagicParser``, and returns an instance of this very class that has been populated accordingly.
+        
+        If the args cannot be parsed, then an error message is printed, and the application is terminated.
+        
+        Args:
+            args (list[str], optional): The args to parse. By default, these are taken from ``sys.argv``.
+
+        Returns:
+            The parsed configuration.
+        """
+        try:
+            return self._parse(sys.argv[1:] if args is None else args, self._fast_parser)
+        except parse_error.ParseError as e:  # error messages of argparse are printed as they are
+            argparse.ArgumentParser.error(self._parser, e.message)
         except (TypeError, ValueError) as e:
             self.error(str(e))
+    
+    def parse_file(
+            self,
+            path: str,
+            file_format: str=None,
+            on_error: str="raise",
+            encoding: str="utf-8"
+    ) -> typing.Iterator:
+        """Parses configurations from a file that contains one record per configuration.
+        
+        Supported formats are JSON Lines, i.e., one JSON object per line, and CSV files that provide the names of the
+        fields in their first line. Fields are named like the properties of the configuration class (with either
+        underscores or dashes), and are converted by means of the same rules as command-line args. Values that are not
+        strings, as they may appear in JSON objects, are accepted if they match the data type of the respective option.
+        Missing fields as well as ``null`` values and empty cells are populated with the according default values. The
+        file is read incrementally, which means that the memory footprint of this method is independent of the file's
+        size.
+        
+        Args:
+            path (str): The path of the file to parse.
+            file_format (str, optional): Either ``"jsonl"`` or ``"csv"``. By default, the format is inferred from the
+                extension of the file.
+            on_error (str, optional): Specifies how to handle records that cannot be parsed: ``"raise"`` (the default)
+                raises a :class:`parse_error.ParseError` for the first one, ``"skip"`` silently ignores them, and
+                ``"yield"`` yields a :class:`parse_error.ParseError` in place of the configuration object.
+            encoding (str, optional): The encoding of the file.
+        
+        Returns:
+            iterator: Yields the configuration objects in the same order as the records appear in the file. The
+                :attr:`parse_error.ParseError.index` of any error is the position of the according record.
+        
+        Raises:
+            ValueError: If the format of the file is not supported, or if ``on_error`` is illegal.
+        """
+        insanity.sanitize_type("path", path, str)
+        insanity.sanitize_type("file_format", file_format, str, none_allowed=True)
+        insanity.sanitize_type("on_error", on_error, str)
+        insanity.sanitize_type("encoding", encoding, str)
+        
+        return self._get_record_parser().parse_file(path, file_format=file_format, on_error=on_error, encoding=encoding)
+    
+    def parse_many(
+            self,
+            args: typing.Iterable[typing.Sequence[str]],
+            workers: int=None,
+            chunk_size: int=1000
+    ) -> typing.Iterator:
+        """Parses many lists of command-line args at once.
+        
+        In contrast to :meth:`parse_args`, this method does not terminate the application if any of the provided lists
+        cannot be parsed. Instead, an according :class:`parse_error.ParseError` is yielded in place of the configuration
+        object. Notice further that a :class:`fast_parser.FastParser` is used, even if this has not been requested
+        explicitly when the ``MagicParser`` was created, and that help options are treated as errors (although the help
+        text is printed nevertheless).
+        
+        If ``workers`` is specified, then the args are parsed by a pool of processes, which is helpful if the setters of
+        the configuration class are expensive. Every worker creates its own ``MagicParser`` once, and the results are
+        streamed back in order. In this case, the configuration class has to be importable, and both the parsed
+        configurations and the custom parsers, if any, have to be picklable.
+        
+        Args:
+            args (iterable[list[str]]): The lists of args to parse. Each of them must not include the name of the
+                program. This may be a generator, which is consumed lazily.
+            workers (int, optional): The number of worker processes to use. By default, the args are parsed in the
+                current process.
+            chunk_size (int, optional): The number of lists of args that are sent to a worker process at once. This is
+                ignored if ``workers`` is not specified.
+        
+        Returns:
+            iterator: Yields one parsed configuration object or :class:`parse_error.ParseError` for each list of args in
+                the same order as the args are provided.
+        """
+        insanity.sanitize_type("workers", workers, int, none_allowed=True)
+        if workers is not None:
+            insanity.sanitize_range("workers", workers, minimum=1)
+        insanity.sanitize_type("chunk_size", chunk_size, int)
+        insanity.sanitize_range("chunk_size", chunk_size, minimum=1)
+        
+        if workers is not None:
+            from argmagic import parallel_parsing
+            
+            return parallel_parsing.parse_many(self._conf_class, self._parser_kwargs, args, workers, chunk_size)
+        
+        return self._parse_many(args)
+    
+    def _parse_many(self, args: typing.Iterable[typing.Sequence[str]]) -> typing.Iterator:
+        """Parses many lists of command-line args in the current process (see :meth:`parse_many`)."""
+        fast = self._fast_parser if self._fast_parser is not None else fast_parser.FastParser(self._parser)
+        for index, current_args in enumerate(args):
+            try:
+                yield self._parse(current_args, fast)
+            except parse_error.ParseError as e:
+                yield parse_error.ParseError(e.message, index=index, item=current_args)
+            except (TypeError, ValueError) as e:
+                yield parse_error.ParseError(self._format_message(str(e)), index=index, item=current_args)
+            except SystemExit:  # raised by argparse after printing the help text
+                yield parse_error.ParseError("the help text was requested", index=index, item=current_args)
+    
+    def sweep(self, args: typing.Sequence[str]=None) -> config_sweep.ConfigSweep:
+        """Parses args that specify multiple values for some of the options, and expands them into a sweep, i.e., the
+        cartesian product of all specified values.
+        
+        Multiple values for an option are specified either as comma-separated list, e.g., ``--lr 1e-3,1e-4``, or as
+        comma-separated list in brackets, e.g., ``--layers [2,4,8]``. This does not apply to options of type ``dict`` or
+        ``list`` and arrays, whose values are never split, and to flags. Every distinct value is converted once only,
+        and the configurations are created lazily when the returned sweep is accessed.
+        
+        Args:
+            args (list[str], optional): The args to parse. By default, these are taken from ``sys.argv``.
+        
+        Returns:
+            :class:`config_sweep.ConfigSweep`: The sweep of configurations that is described by the args.
+        
+        Raises:
+            :class:`parse_error.ParseError`: If the args cannot be parsed.
+        """
+        args = sys.argv[1:] if args is None else args
+        fast = self._fast_parser if self._fast_parser is not None else fast_parser.FastParser(self._parser)
+        
+        # tokenize the args without converting values
+        raw_values = fast.parse(args, convert=False)
+        if raw_values is None:
+            self._parser.parse_args(args)  # if the args are invalid, then argparse raises an according error
+            raise parse_error.ParseError("the args cannot be expanded into a sweep: {}".format(" ".join(args)))
+        
+        try:
+            base_values = fast.default_values()
+        except Exception as e:
+            raise parse_error.ParseError("invalid default value: {}".format(e))
+        
+        # values in a config file replace defaults, and are overridden by the args, which are processed subsequently
+        config_file = raw_values.pop(self.CONFIG_FILE_DEST, None)
+        if config_file is not None:
+            base_values.update(self._load_config_file(config_file))
+        
+        # split and convert the specified values
+        axes = []
+        for name, raw_value in raw_values.items():
+            converter = fast.converter(name)
+            if converter is None:  # flags store constants, which are not converted
+                base_values[name] = raw_value
+                continue
+            
+            declared_type = self._options[name].declared_type
+            if declared_type in (dict, list) or array_values.ArrayConverter.is_array_type(declared_type):
+                choices = [raw_value]
+            else:
+                choices = config_sweep.ConfigSweep.split(raw_value)
+            
+            values = []
+            for choice in dict.fromkeys(choices):  # every distinct value is converted once only
+                try:
+                    values.append(converter(choice))
+                except Exception:
+                    raise parse_error.ParseError(
+                            "invalid value for {}: '{}'".format(self._format_message("<" + name + ">"), choice)
+                    )
+            
+            if len(values) == 1:
+                base_values[name] = values[0]
+            else:
+                axes.append((name, values))
+        
+        return config_sweep.ConfigSweep(
+                self._conf_class,
+                self._fields,
+                base_values,
+                axes,
+                populate=self._populate_nested
+        )
@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+
+"""This module implements nested configurations, i.e., properties whose values are configurations themselves.
+
+Nested configurations are declared by means of the decorator :func:`decorators.nested`. Their options are exposed as
+dotted options, e.g., ``--optimizer.learning-rate`` for the property ``learning_rate`` of the nested configuration
+``optimizer``, and may be nested arbitrarily deep. Nested configuration objects are created only if any of their options
+is specified. Otherwise, if the parent configuration does not provide a nested configuration by itself, a
+:class:`LazyConfig` is used, which creates it on first access. Either way, all nested configurations that are ``None``
+are populated in the same way on every level.
+"""
+
+
+import typing
+import weakref
+
+from argmagic import config_spec
+from argmagic import config_value
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+SEPARATOR = "."
+"""str: Separates the names of nested configurations from the names of their options."""
+
+_cache = weakref.WeakKeyDictionary()
+"""weakref.WeakKeyDictionary: Maps configuration classes to dicts that map pairs of extraction modes and excluded
+classes to tuples of the signatures of all classes that an expansion depends on and the expansion itself (see
+:func:`expand`).
+"""
+
+
+def expand(
+        spec: config_spec.ConfigSpec,
+        mode: str=config_spec.ConfigSpec.DOCSTRINGS,
+        exclude: typing.Collection[type]=(),
+        conf_class: type=None
+) -> typing.Tuple[typing.List[config_value.ConfigValue], typing.List["NestedOptions"]]:
+    """Creates the options of all (recursively) nested configurations of the provided specification.
+    
+    Expanding a specification creates the specifications of all nested configurations, if they are not cached yet, as
+    well as one :class:`config_value.ConfigValue` per nested option, i.e., its cost grows with the total number of
+    nested options. Therefore, if ``conf_class`` is provided, then the expansion is cached per class, like
+    specifications are cached by :meth:`config_spec.ConfigSpec.create_spec`, and rebuilt automatically whenever the
+    class or any of its nested classes changes. Notice that cached expansions are shared, and must thus not be modified.
+    
+    Args:
+        spec (:class:`config_spec.ConfigSpec`): The specification to expand.
+        mode (str, optional): The extraction mode that is used for creating the specifications of nested configurations.
+        exclude (collection[type], optional): Classes of nested configurations that are not expanded, e.g., because
+            they are parsed by custom parsers. Nested configurations of these classes are treated as optional options
+            (see :meth:`config_spec.ConfigSpec.nested_value`), except for those of ``spec`` itself, which are skipped.
+        conf_class (type, optional): The class that is described by ``spec``, which allows for caching the expansion.
+    
+    Returns:
+        tuple: A list of :class:`config_value.ConfigValue`s that describe the options of all nested configurations,
+            which are named like their dotted paths, e.g., ``"optimizer.learning_rate"``, and a list of
+            :class:`NestedOptions` that describe the nested configurations of ``spec``.
+    
+    Raises:
+        ValueError: If a configuration class contains itself, directly or indirectly.
+    """
+    exclude = frozenset(exclude)
+    if conf_class is None:
+        values = []
+        return values, _expand(spec, mode, "", (), exclude, values)
+    
+    # the expansion depends on all classes that it contains, and is thus discarded if any of them changes
+    key = (mode, exclude)
+    entry = _cache.get(conf_class, {}).get(key)
+    if entry is not None and config_spec.ConfigSpec._same_signature(entry[0], _signature(conf_class, entry[2])):
+        return list(entry[1]), list(entry[2])
+    
+    values = []
+    nodes = _expand(spec, mode, "", (), exclude, values)
+    _cache.setdefault(conf_class, {})[key] = (_signature(conf_class, nodes), values, nodes)
+    
+    return list(values), list(nodes)
+
+
+def is_instantiated(conf) -> bool:
+    """Checks whether the provided configuration exists already, i.e., it is not a :class:`LazyConfig` that has not
+    been accessed yet.
+    """
+    return not isinstance(conf, LazyConfig) or object.__getattribute__(conf, "_instance") is not None
+
+
+def populate(conf, values: typing.Dict[str, typing.Any], nested: typing.Sequence["NestedOptions"]) -> None:
+    """Populates the nested configurations of the provided configuration.
+    
+    Nested configurations are created only if any of their options appears in ``values``. Otherwise, they are left
+    as they are, unless they are ``None``, in which case they are replaced with :class:`LazyConfig`s.
+    
+    Args:
+        conf: The configuration whose nested configurations are populated.
+        values (dict): Maps the dotted names of all nested options that have been specified to their values, and may
+            contain any other values as well.
+        nested (list[:class:`NestedOptions`]): The nested configurations of ``conf`` as created by :func:`expand`.
+    """
+    present = [name for name in values if SEPARATOR in name]
+    _populate(conf, values, nested, present)
+
+
+def _expand(
+        spec: config_spec.ConfigSpec,
+        mode: str,
+        prefix: str,
+        classes: tuple,
+        exclude: typing.FrozenSet[type],
+        values: typing.List[config_value.ConfigValue]
+) -> typing.List["NestedOptions"]:
+    """Expands the nested configurations of ``spec``, and appends their options to ``values``."""
+    nodes = []
+    for name, conf_class in spec.nested().items():
+        if conf_class in exclude:
+            continue
+        if conf_class in classes:
+            raise ValueError("The configuration class {} contains itself!".format(conf_class.__qualname__))
+        
+        # specifications of nested configurations are cached, and thus shared between all classes that contain them
+        path = prefix + name
+        nested_spec = spec.nested_spec(name, mode=mode)
+        fields = []
+        excluded = [nested_spec.nested_value(n) for n, c in nested_spec.nested().items() if c in exclude]
+        for conf in list(nested_spec) + excluded:
+            dest = path + SEPARATOR + conf.name
+            values.append(
+                    config_value.ConfigValue(
+                            dest,
+                            conf.help_text,
+                            conf.declared_type,
+                            default_value=conf.default_value,
+                            required=conf.required,
+                            type_args=conf.type_args
+                    )
+            )
+            fields.append((conf.name, dest))
+        
+        children = _expand(nested_spec, mode, path + SEPARATOR, classes + (conf_class,), exclude, values)
+        nodes.append(NestedOptions(name, path, conf_class, fields, children))
+    
+    return nodes
+
+
+def _populate(
+        conf,
+        values: typing.Dict[str, typing.Any],
+        nested: typing.Sequence["NestedOptions"],
+        present: typing.List[str]
+) -> None:
+    """Populates the nested configurations of ``conf``, where ``present`` are the dotted names of all given options."""
+    for node in nested:
+        prefix = node.path + SEPARATOR
+        if any(name.startswith(prefix) for name in present):
+            nested_conf = getattr(conf, node.name, None)
+            if nested_conf is None or isinstance(nested_conf, LazyConfig):
+                nested_conf = node.conf_class()
+            for name, dest in node.fields:
+                if dest in values:
+                    setattr(nested_conf, name, values[dest])
+            _populate(nested_conf, values, node.children, present)
+            setattr(conf, node.name, nested_conf)
+        elif getattr(conf, node.name, None) is None:
+            setattr(conf, node.name, LazyConfig(node.conf_class, node.children))
+
+
+def _signature(conf_class: type, nodes: typing.Sequence["NestedOptions"]) -> list:
+    """Collects the signatures of the provided class and all (recursively) nested classes in ``nodes``."""
+    signature = config_spec.ConfigSpec._class_signature(conf_class)
+    nodes = list(nodes)
+    while nodes:
+        node = nodes.pop()
+        signature.extend(config_spec.ConfigSpec._class_signature(node.conf_class))
+        nodes.extend(node.children)
+    
+    return signature
+
+
+class LazyConfig(object):
+    """A placeholder for a nested configuration, which is created on first access of any of its attributes.
+    
+    A ``LazyConfig`` behaves like the configuration that it stands in for, and passes checks via ``isinstance``.
+    Copying or pickling it creates the configuration, and yields a copy of the configuration itself. When the
+    configuration is created, its own nested configurations are populated with ``LazyConfig``s, just like they are if
+    it is created by the parser.
+    """
+    
+    __slots__ = ("_conf_class", "_instance", "_nested")
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, conf_class: type, nested: typing.Sequence["NestedOptions"]=()):
+        """Creates a new instance of ``LazyConfig``.
+        
+        Args:
+            conf_class (type): The class of the configuration, which has to have a constructor that accepts no args.
+            nested (list[:class:`NestedOptions`], optional): The nested configurations of ``conf_class``.
+        """
+        object.__setattr__(self, "_conf_class", conf_class)
+        object.__setattr__(self, "_instance", None)
+        object.__setattr__(self, "_nested", nested)
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __eq__(self, other):
+        if isinstance(other, LazyConfig):
+            other = other._get()
+        return self._get() == other
+    
+    def __getattr__(self, name):
+        return getattr(self._get(), name)
+    
+    def __hash__(self):
+        return hash(self._get())
+    
+    def __reduce_ex__(self, protocol):
+        return self._get().__reduce_ex__(protocol)
+    
+    def __repr__(self):
+        conf_class = object.__getattribute__(self, "_conf_class")
+        instance = object.__getattribute__(self, "_instance")
+        if instance is None:
+            return "LazyConfig({})".format(conf_class.__qualname__)
+        return repr(instance)
+    
+    def __setattr__(self, name, value):
+        setattr(self._get(), name, value)
+    
+    def __str__(self):
+        return str(self._get())
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def __class__(self):
+        return object.__getattribute__(self, "_conf_class")
+    
+    #  METHODS  ########################################################################################################
+    
+    def _get(self):
+        """Retrieves the configuration, and creates it, if necessary."""
+        instance = object.__getattribute__(self, "_instance")
+        if instance is None:
+            instance = object.__getattribute__(self, "_conf_class")()
+            _populate(instance, {}, object.__getattribute__(self, "_nested"), [])
+            object.__setattr__(self, "_instance", instance)
+        return instance
+
+
+class NestedOptions(object):
+    """Describes the options of a nested configuration, as created by :func:`expand`."""
+    
+    __slots__ = ("_children", "_conf_class", "_fields", "_name", "_path")
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(
+            self,
+            name: str,
+            path: str,
+            conf_class: type,
+            fields: typing.List[typing.Tuple[str, str]],
+            children: typing.List["NestedOptions"]
+    ):
+        """Creates a new instance of ``NestedOptions``.
+        
+        Args:
+            name (str): Specifies :attr:`name`.
+            path (str): Specifies :attr:`path`.
+            conf_class (type): Specifies :attr:`conf_class`.
+            fields (list[tuple]): Specifies :attr:`fields`.
+            children (list[:class:`NestedOptions`]): Specifies :attr:`children`.
+        """
+        self._children = children
+        self._conf_class = conf_class
+        self._fields = fields
+        self._name = name
+        self._path = path
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def children(self) -> typing.List["NestedOptions"]:
+        """list[:class:`NestedOptions`]: The nested configurations of the described one."""
+        return self._children
+    
+    @property
+    def conf_class(self) -> type:
+        """type: The class of the nested configuration."""
+        return self._conf_class
+    
+    @property
+    def fields(self) -> typing.List[typing.Tuple[str, str]]:
+        """list[tuple]: Pairs of the names of all options of the nested configuration and their dotted names."""
+        return self._fields
+    
+    @property
+    def name(self) -> str:
+        """str: The name of the property of the parent configuration that holds the nested configuration."""
+        return self._name
+    
+    @property
+    def path(self) -> str:
+        """str: The dotted path of the nested configuration, e.g., ``"model.encoder"``."""
+        return self._path
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+"""This module implements the parallel parsing of many lists of command-line args by means of a pool of processes (see
+:meth:`magic_parser.MagicParser.parse_many`).
+"""
+
+
+import collections
+import concurrent.futures
+import itertools
+import typing
+import uuid
+
+from argmagic import parse_error
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+_worker_parser = (None, None)
+"""tuple: The key and the :class:`magic_parser.MagicParser` that is used by the current worker process."""
+
+
+def _parse_chunk(
+        key: str,
+        conf_class: type,
+        parser_kwargs: dict,
+        start: int,
+        chunk: typing.List[typing.Sequence[str]]
+) -> list:
+    """Parses a chunk of lists of args in a worker process.
+    
+    The ``MagicParser`` that is used for parsing is created for the first chunk that is processed by the worker, and
+    reused for all subsequent chunks with the same key.
+    
+    Args:
+        key (str): Identifies the parser to use.
+        conf_class (type): The configuration class to parse.
+        parser_kwargs (dict): The keyword args for creating the ``MagicParser``.
+        start (int): The index of the first item of the chunk.
+        chunk (list[list[str]]): The lists of args to parse.
+    
+    Returns:
+        list: The parsed configurations and :class:`parse_error.ParseError`s for all items of the chunk.
+    """
+    global _worker_parser
+    
+    from argmagic import magic_parser
+    
+    if _worker_parser[0] != key:
+        _worker_parser = (key, magic_parser.MagicParser(conf_class, **parser_kwargs))
+    
+    results = list(_worker_parser[1].parse_many(chunk))
+    for i, r in enumerate(results):
+        if isinstance(r, parse_error.ParseError):
+            results[i] = parse_error.ParseError(r.message, index=start + r.index, item=r.item)
+    
+    return results
+
+
+def parse_many(
+        conf_class: type,
+        parser_kwargs: dict,
+        args: typing.Iterable[typing.Sequence[str]],
+        workers: int,
+        chunk_size: int
+) -> typing.Iterator:
+    """Parses many lists of args by means of a pool of worker processes.
+    
+    The provided lists of args are split into chunks, which are distributed among the workers. Every worker creates a
+    ``MagicParser`` once, and uses it for all chunks that it processes. The results are yielded in the same order as
+    the args are provided, and the number of chunks that are processed or waiting for being processed is limited to
+    twice the number of workers. Therefore, ``args`` is consumed lazily, and the results are streamed.
+    
+    Args:
+        conf_class (type): The configuration class to parse. This has to be importable by the workers.
+        parser_kwargs (dict): The keyword args for creating the ``MagicParser``, which have to be picklable.
+        args (iterable[list[str]]): The lists of args to parse.
+        workers (int): The number of worker processes.
+        chunk_size (int): The number of lists of args that are sent to a worker at once.
+    
+    Returns:
+        iterator: Yields one parsed configuration object or :class:`parse_error.ParseError` for each list of args in
+            the same order as the args are provided.
+    """
+    key = uuid.uuid4().hex
+    args = iter(args)
+    pending = collections.deque()
+    
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        try:
+            start = 0
+            while True:
+                chunk = list(itertools.islice(args, chunk_size))
+                if not chunk:
+                    break
+                pending.append(executor.submit(_parse_chunk, key, conf_class, parser_kwargs, start, chunk))
+                start += len(chunk)
+                
+                # yield results as soon as the maximum number of pending chunks is reached
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # if the generator is closed early, then chunks that have not been started yet are discarded
+            for f in pending:
+                f.cancel()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+
+import typing
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class ParseError(ValueError):
+    """Describes an error that occurred while parsing a configuration.
+    
+    Whenever many configurations are parsed at once, e.g., by means of :meth:`magic_parser.MagicParser.parse_many`,
+    errors are not reported by terminating the application, but by means of instances of this class, which specify
+    the item that could not be parsed.
+    """
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, message: str, index: int=None, item: typing.Any=None):
+        """Creates a new instance of ``ParseError``.
+        
+        Args:
+            message (str): Specifies :attr:`message`.
+            index (int, optional): Specifies :attr:`index`.
+            item (optional): Specifies :attr:`item`.
+        """
+        super().__init__(message)
+        self._index = index
+        self._item = item
+        self._message = str(message)
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __eq__(self, other):
+        return (
+                isinstance(other, ParseError) and
+                self._index == other.index and
+                self._item == other.item and
+                self._message == other.message
+        )
+    
+    def __hash__(self):
+        return hash((self._index, self._message))
+    
+    def __reduce__(self):
+        return ParseError, (self._message, self._index, self._item)
+    
+    def __repr__(self):
+        return "ParseError(message={!r}, index={!r}, item={!r})".format(self._message, self._index, self._item)
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def index(self) -> typing.Optional[int]:
+        """int: The index of the item that could not be parsed, or ``None``, if the error does not refer to an item of a
+        sequence of items.
+        """
+        return self._index
+    
+    @property
+    def item(self) -> typing.Any:
+        """The item that could not be parsed, e.g., a list of command-line args."""
+        return self._item
+    
+    @property
+    def message(self) -> str:
+        """str: A description of the error."""
+        return self._message
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+"""This module implements options whose values are typed numeric sequences, which are stored as ``array.array`` or
+NumPy arrays.
+"""
+
+
+import argparse
+import array
+import re
+import typing
+
+from argmagic import type_ref
+from argmagic.parsing import file_values
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class ArrayConverter(object):
+    """Converts sequences of numbers, which are usually provided as strings, to ``array.array``s or NumPy arrays.
+    
+    NumPy arrays are converted at once by means of ``numpy.ndarray.astype``. Elements of ``array.array``s, in contrast,
+    are converted one by one by calling the element type, i.e., ``int`` or ``float``, before they are stored in a single
+    array, which saves memory compared to a ``list`` but does not speed up conversion.
+    """
+    
+    DEFAULT_ELEMENT_TYPE = float
+    """type: The type of the elements of arrays whose element type is not specified."""
+    
+    SPLIT_REGEX = r"[\s,]+"
+    """str: A regex that matches the delimiters between elements in strings that specify entire arrays."""
+    
+    TYPE_CODES = {int: "q", float: "d"}
+    """dict: Maps the supported element types of ``array.array``s to the according type codes."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, data_type: type, element_type: type=None):
+        """Creates a new instance of ``ArrayConverter``.
+        
+        Args:
+            data_type (type): Either ``array.array`` or ``numpy.ndarray``.
+            element_type (type, optional): The type of the elements, which has to be ``int`` or ``float`` for
+                ``array.array``s, and may be any type that is understood by NumPy as ``dtype`` otherwise.
+        
+        Raises:
+            ValueError: If ``data_type`` or ``element_type`` is not supported.
+        """
+        if not self.is_array_type(data_type):
+            raise ValueError("Unsupported array type: {}!".format(data_type))
+        element_type = self.DEFAULT_ELEMENT_TYPE if element_type is None else element_type
+        if data_type is array.array and element_type not in self.TYPE_CODES:
+            raise ValueError("Unsupported element type of array.array: {}!".format(element_type))
+        
+        self._data_type = data_type
+        self._element_type = element_type
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __call__(self, values: typing.Sequence) -> typing.Any:
+        """Converts the provided sequence, which may contain strings or numbers, to an array.
+        
+        Elements of ``array.array``s are converted one by one, whereas NumPy converts all elements at once.
+        
+        Raises:
+            TypeError, ValueError: If any of the provided values cannot be converted.
+        """
+        if self._data_type is array.array:
+            return array.array(self.TYPE_CODES[self._element_type], map(self._element_type, values))
+        
+        import numpy
+        
+        if len(values) > 0 and isinstance(values[0], str):
+            return numpy.array(values).astype(self._element_type)
+        return numpy.asarray(values, dtype=self._element_type)
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def data_type(self) -> type:
+        """type: The type of the arrays that are created."""
+        return self._data_type
+    
+    @property
+    def element_type(self) -> type:
+        """type: The type of the elements of the arrays that are created."""
+        return self._element_type
+    
+    #  METHODS  ########################################################################################################
+    
+    @staticmethod
+    def is_array_type(data_type: type) -> bool:
+        """Checks whether the provided type is supported by ``ArrayConverter``s.
+        
+        Notice that this does not import NumPy, and that :class:`type_ref.TypeRef`s to ``numpy.ndarray`` are supported
+        as well.
+        """
+        if isinstance(data_type, type_ref.TypeRef):
+            return data_type.name == "numpy.ndarray"
+        return data_type is array.array or (
+                getattr(data_type, "__module__", None) == "numpy" and getattr(data_type, "__name__", None) == "ndarray"
+        )
+    
+    def parse(self, value: str) -> typing.Any:
+        """Converts a string that specifies an entire array (see :meth:`split`), or loads the array from a file if the
+        string has the format ``@path`` (see :func:`file_values.load_array`).
+        """
+        if file_values.is_file_value(value):
+            return file_values.load_array(file_values.file_path(value), self._data_type, self._element_type)
+        return self(self.split([value]))
+    
+    def parse_args(self, values: typing.Sequence[str]) -> typing.Any:
+        """Converts the args that specify an array on the command line, as they are consumed by an
+        :class:`ArrayAction`.
+        
+        A single arg is converted by means of :meth:`parse`, and thus may refer to a file, whereas multiple args are
+        split and converted at once.
+        
+        Raises:
+            TypeError, ValueError: If any of the provided values cannot be converted.
+        """
+        if len(values) == 1:
+            return self.parse(values[0])
+        return self(self.split(values))
+    
+    @classmethod
+    def split(cls, values: typing.Sequence[str]) -> typing.List[str]:
+        """Splits the provided strings into the elements that they specify.
+        
+        Elements are separated by commas and/or whitespace, and the entire sequence may be enclosed in brackets, e.g.,
+        ``"[0.1, 0.2]"``.
+        """
+        text = ",".join(values).strip()
+        if text.startswith("[") and text.endswith("]"):
+            text = text[1:-1].strip()
+        if not text:
+            return []
+        
+        return re.split(cls.SPLIT_REGEX, text.strip(", \t\n"))
+
+
+class ArrayAction(argparse.Action):
+    """An ``argparse.Action`` that stores arrays, which are specified as one or more args, each of which may contain
+    multiple delimited elements, e.g., ``--weights 0.1 0.2 0.3`` or ``--weights 0.1,0.2,0.3``, or as a single arg that
+    refers to a file, e.g., ``--weights @weights.npy``.
+    """
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, option_strings: typing.List[str], dest: str, converter: ArrayConverter=None, **kwargs):
+        """Creates a new instance of ``ArrayAction``.
+        
+        Args:
+            option_strings (list[str]): Passed to ``argparse.Action``.
+            dest (str): Passed to ``argparse.Action``.
+            converter (:class:`ArrayConverter`): The converter that creates the stored arrays.
+            **kwargs: Passed to ``argparse.Action``.
+        """
+        kwargs["nargs"] = "+"
+        super().__init__(option_strings, dest, **kwargs)
+        self.converter = converter
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __call__(self, parser, namespace, values, option_string=None):
+        try:
+            value = self.converter.parse_args(values)
+        except (TypeError, ValueError):
+            raise argparse.ArgumentError(
+                    self,
+                    "invalid {} value: '{}'".format(self.converter.element_type.__name__, " ".join(values))
+            )
+        setattr(namespace, self.dest, value)
@@ -2,14 +2,20 @@
 
 
 import argparse
+import array
 import enum
 import types
+import typing
 
 import insanity
-import yaml
 
 from argmagic import config_value
+from argmagic import type_ref
+from argmagic.parsing import array_values
+from argmagic.parsing import enum_table
+from argmagic.parsing import file_values
 from argmagic.parsing import parser_factory
+from argmagic.parsing import structured_loader as sl
 
 
 __author__ = "Patrick Hohenecker"
@@ -45,22 +51,38 @@ __status__ = "Development"
 class DefaultParserFactory(parser_factory.ParserFactory):
     """A simple implementation of :class:`parser_factory.ParserFactory` that supports configurations with data types
     ``str``, ``int``, ``float`` as well as lists and dictionaries that contain those types only. Furthermore,
-    configurations whose admissible values are given by means of an ``Enum`` can be handled by instances of this class.
+    configurations whose admissible values are given by means of an ``Enum`` can be handled by instances of this class,
+    and numeric sequences may be stored as ``array.array``s or, if NumPy is installed, as ``numpy.ndarray``s.
     """
     
-    SUPPORTED_TYPES = [bool, str, int, float, dict, list]
+    SUPPORTED_TYPES = [bool, str, int, float, dict, list, array.array]
     """list[type]: A list of all data types that are supported by a ``DefaultParserFactory``."""
     
     #  CONSTRUCTOR  ####################################################################################################
     
-    def __init__(self, positional_args: bool):
+    def __init__(
+            self,
+            positional_args: bool,
+            enum_ignore_case: bool=False,
+            enum_prefix_matching: bool=False,
+            structured_loader: sl.StructuredLoader=None
+    ):
         """Creates a new instance of ``DefaultParserFactory``.
         
         Args:
             positional_args (bool): Specifies whether required configuration values should be treated as positional
                 args.
+            enum_ignore_case (bool, optional): Specifies whether names of ``Enum`` members are matched
+                case-insensitively, as long as this is unambiguous.
+            enum_prefix_matching (bool, optional): Specifies whether unique prefixes of names of ``Enum`` members are
+                accepted.
+            structured_loader (:class:`structured_loader.StructuredLoader`, optional): The loader that is used for
+                parsing values of type ``dict`` and ``list``. By default, a loader in mode ``"auto"`` is used.
         """
         self._positional_args = positional_args
+        self._enum_ignore_case = bool(enum_ignore_case)
+        self._enum_prefix_matching = bool(enum_prefix_matching)
+        self._structured_loader = sl.StructuredLoader() if structured_loader is None else structured_loader
     
     #  METHODS  ########################################################################################################
     
@@ -70,6 +92,10 @@ class DefaultParserFactory(parser_factory.ParserFactory):
             config: config_value.ConfigValue
     ) -> argparse.ArgumentParser:
         """
+        Configurations whose data types have not been resolved yet (see :class:`type_ref.TypeRef`) are resolved when
+        the first value is converted, i.e., only if the according option is actually used or has a default value of
+        type ``str``. An unsupported deferred type thus causes an error on conversion rather than here.
+        
         Raises:
             ValueError: If the type of the provided ``config`` is not supported by the ``DefaultParserFactory``.
         """
@@ -78,45 +104,62 @@ class DefaultParserFactory(parser_factory.ParserFactory):
         insanity.sanitize_type("config", config, config_value.ConfigValue)
         
         # check if the type of the provided config is supported
-        if not issubclass(config.data_type, enum.Enum) and config.data_type not in self.SUPPORTED_TYPES:
-            raise ValueError(
-                    "The data type of the provided <config> is not supported: {}!".format(config.data_type.__qualname__)
-            )
+        declared_type = config.declared_type
+        deferred = (
+                isinstance(declared_type, type_ref.TypeRef) and
+                not array_values.ArrayConverter.is_array_type(declared_type)
+        )
+        if not deferred:
+            self._check_type(declared_type)
 
-        # the names of the command line args are simply those of the corresponding config values where
-        # underscores are replaced with dashes
-        # furthermore, optional args get "--" prepended to their names
-        arg_name = config.name.replace("_", "-")
-        if not self._positional_args or not config.required:
-            arg_name = "--" + arg_name
+        # the names of the command line options are simply those of the corresponding config values where
+        # underscores are replaced with dashes, prepended by "--" (see config_value.ConfigValue.option_name)
+        # positional args, however, are named exactly like the config values
+        arg_name = config.option_name
 
         # boolean optional are treated differently (notice that they are required to have default values)
         # if the default value is True, then the name of the according option starts with "--no-"
-        if config.data_type == bool:
-            if config.default_value:
-                arg_name = "--no-" + arg_name[2:]
+        if declared_type == bool:
             parser.add_argument(
                     arg_name,
                     dest=config.name,
                     action="store_const",
                     const=not config.default_value,
                     default=config.default_value,
-                    help=config.description
+                    help=config.help_text
             )
-        else:
-            if config.exhaustive:
-                arg_type = self._enum_type(config.data_type)
-            elif config.data_type == dict or config.data_type == list:
-                arg_type = yaml.load
+        elif array_values.ArrayConverter.is_array_type(declared_type):
+            # arrays are specified as one or more args, which are converted at once by an ArrayAction
+            converter = array_values.ArrayConverter(declared_type, *config.type_args)
+            default_value = config.default_value
+            if isinstance(default_value, str):
+                default_value = converter.parse(default_value)
+            elif isinstance(default_value, (list, tuple)):
+                default_value = converter(default_value)
+            
+            if self._positional_args and config.required:
+                names = [config.name]
+                kwargs = {}
             else:
-                arg_type = config.data_type
+                names = [arg_name]
+                kwargs = {"dest": config.name}
+            parser.add_argument(
+                    *names,
+                    action=array_values.ArrayAction,
+                    converter=converter,
+                    default=default_value,
+                    help=config.help_text,
+                    **kwargs
+            )
+        else:
+            arg_type = self._deferred_type(config) if deferred else self._create_type(config)
     
             if self._positional_args and config.required:
                 parser.add_argument(
                         config.name,
                         type=arg_type,
                         default=config.default_value,
-                        help=config.description
+                        help=config.help_text
                 )
             else:
                 parser.add_argument(
@@ -124,15 +167,62 @@ class DefaultParserFactory(parser_factory.ParserFactory):
                         dest=config.name,
                         type=arg_type,
                         default=config.default_value,
-                        help=config.description
+                        help=config.help_text
                 )
         
         return parser
 
-    @staticmethod
-    def _enum_type(cls: enum.Enum) -> types.FunctionType:
+    def _check_type(self, data_type: type) -> None:
+        """Raises a ``ValueError`` if the provided data type is not supported by the ``DefaultParserFactory``."""
+        if (
+                not issubclass(data_type, enum.Enum) and
+                data_type not in self.SUPPORTED_TYPES and
+                not array_values.ArrayConverter.is_array_type(data_type)
+        ):
+            raise ValueError(
+                    "The data type of the provided <config> is not supported: {}!".format(data_type.__qualname__)
+            )
+    
+    def _create_type(self, config: config_value.ConfigValue) -> typing.Callable[[str], typing.Any]:
+        """Creates the function that converts values of the provided (non-bool, non-array) configuration."""
+        if config.exhaustive:
+            return self._enum_type(config.data_type)
+        if config.data_type == dict or config.data_type == list:
+            return self._structured_type(config)
+        return config.data_type
+    
+    def _deferred_type(self, config: config_value.ConfigValue) -> types.FunctionType:
+        """Creates a function that may be passed to an ``argparse.ArgumentParser`` for handling an option whose data
+        type has not been resolved yet.
+        
+        The data type is resolved, and the actual conversion function is created, when the first value is converted.
+        
+        Args:
+            config (:class:`config_value.ConfigValue`): The configuration that describes the option.
+        
+        Returns:
+            function: A function that can be passed to an ``ArgumentParser`` via the keyword arg ``type`` of the method
+                ``add_argument``.
+        """
+        converter = []
+        
+        def type_func(val: str):
+            if not converter:
+                # argparse reports ValueErrors as invalid values, which is why unsupported types are reported like this
+                try:
+                    self._check_type(config.data_type)
+                except ValueError as e:
+                    raise argparse.ArgumentTypeError(str(e))
+                converter.append(self._create_type(config))
+            return converter[0](val)
+        
+        return type_func
+    
+    def _enum_type(self, cls: enum.Enum) -> types.FunctionType:
         """Creates a function that may be passed to an ``argparse.ArgumentParser`` for handling an option that is
         described by the provided ``Enum``.
+        
+        Values are looked up in an :class:`enum_table.EnumTable`, which is created once per ``Enum``.
 
         Args:
             cls (enum.Enum): The ``Enum`` that describes the option.
@@ -141,12 +231,39 @@ class DefaultParserFactory(parser_factory.ParserFactory):
             function: A function that can be passed to an ``ArgumentParser`` via the keyword arg ``type`` of the method
                 ``add_argument``.
         """
+        table = enum_table.EnumTable.for_enum(cls)
+        ignore_case = self._enum_ignore_case
+        allow_prefix = self._enum_prefix_matching
     
-        # noinspection PyUnresolvedReferences
         def type_func(val: str):
-            if val not in cls.__members__.keys():
-                raise ValueError(
-                    "illegal value '%s', possible values are {%s}" % (val, ", ".join(cls.__members__.keys())))
-            return cls[val].value
+            return table.lookup(val, ignore_case=ignore_case, allow_prefix=allow_prefix)
     
         return type_func
+    
+    def _structured_type(self, config: config_value.ConfigValue) -> types.FunctionType:
+        """Creates a function that may be passed to an ``argparse.ArgumentParser`` for handling an option of type
+        ``dict`` or ``list``.
+        
+        Values are parsed by means of the :class:`structured_loader.StructuredLoader` of this factory, and the types of
+        their elements are checked against :attr:`config_value.ConfigValue.type_args`. Values of the format ``@path``
+        are loaded from the specified file lazily, i.e., on first access, by means of a
+        :class:`file_values.LazyMapping` or :class:`file_values.LazySequence`, respectively.
+        
+        Args:
+            config (:class:`config_value.ConfigValue`): The configuration that describes the option.
+        
+        Returns:
+            function: A function that can be passed to an ``ArgumentParser`` via the keyword arg ``type`` of the method
+                ``add_argument``.
+        """
+        loader = self._structured_loader
+        data_type = config.data_type
+        type_args = config.type_args
+        lazy_type = file_values.LazyMapping if data_type is dict else file_values.LazySequence
+        
+        def type_func(val: str):
+            if file_values.is_file_value(val):
+                return lazy_type(file_values.file_path(val), loader, data_type, type_args)
+            return sl.check_type(loader.load(val), data_type, type_args)
+        
+        return type_func
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+
+"""This module implements lookup tables that map names of ``Enum`` members to their values."""
+
+
+import bisect
+import enum
+import threading
+import typing
+import weakref
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class UnknownMemberError(ValueError):
+    """Indicates that a string does not denote any member of an ``Enum``.
+    
+    The error message, which lists the possible values, is created lazily, since it is expensive to build for ``Enum``s
+    with many members, and not needed in many cases, e.g., if the error is handled by ``argparse``.
+    """
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, table, value: str):
+        """Creates a new instance of ``UnknownMemberError``.
+        
+        Args:
+            table (:class:`EnumTable`): The table that has been searched for ``value``.
+            value (str): The string that does not denote any member.
+        """
+        super().__init__(value)
+        self._table = table
+        self._value = value
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __reduce__(self):
+        return ValueError, (str(self),)
+    
+    def __str__(self):
+        return "illegal value '{}', possible values are {{{}}}".format(self._value, self._table.possible_values())
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def value(self) -> str:
+        """str: The string that does not denote any member."""
+        return self._value
+
+
+class EnumTable(object):
+    """A table that allows for looking up members of an ``Enum`` by their names.
+    
+    Tables are immutable, and should be retrieved via :meth:`for_enum`, which creates one table per ``Enum`` only, and
+    shares it between all parsers.
+    """
+    
+    MAX_LISTED_VALUES = 20
+    """int: The maximum number of possible values that are listed in error messages."""
+    
+    _tables = weakref.WeakKeyDictionary()  # maps Enums to tables
+    _tables_lock = threading.Lock()
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, enum_cls: typing.Type[enum.Enum]):
+        """Creates a new instance of ``EnumTable``.
+        
+        Args:
+            enum_cls (type): The ``Enum`` to create a table for.
+        """
+        self._values = {name: member.value for name, member in enum_cls.__members__.items()}
+        
+        # case-insensitive lookups map case-folded names to all names that are equal except for their case
+        self._folded = {}
+        for name in self._values:
+            self._folded.setdefault(name.casefold(), []).append(name)
+        
+        # prefix lookups use binary search on sorted lists of names
+        self._sorted_names = sorted(self._values)
+        self._sorted_folded = sorted(self._folded)
+        
+        self._possible_values = None  # the (capped) list of possible values, which is created lazily
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __contains__(self, item):
+        return item in self._values
+    
+    def __len__(self):
+        return len(self._values)
+    
+    #  METHODS  ########################################################################################################
+    
+    @classmethod
+    def for_enum(cls, enum_cls: typing.Type[enum.Enum]):
+        """Retrieves the table for the provided ``Enum``, and creates it, if necessary.
+        
+        Args:
+            enum_cls (type): The ``Enum`` to retrieve the table for.
+        
+        Returns:
+            :class:`EnumTable`: The shared table for ``enum_cls``.
+        """
+        with cls._tables_lock:
+            table = cls._tables.get(enum_cls)
+            if table is None:
+                table = EnumTable(enum_cls)
+                cls._tables[enum_cls] = table
+        
+        return table
+    
+    def lookup(self, value: str, ignore_case: bool=False, allow_prefix: bool=False) -> typing.Any:
+        """Looks up the value of the member of the ``Enum`` that is denoted by the provided string.
+        
+        Exact matches always take precedence. Otherwise, if ``ignore_case`` is ``True``, then a member whose name
+        differs from ``value`` in case only is accepted, provided that there is exactly one such member. If
+        ``allow_prefix`` is ``True``, then ``value`` may be a prefix of exactly one member's name as well.
+        
+        Args:
+            value (str): The string to look up.
+            ignore_case (bool, optional): Indicates whether matching is case-insensitive.
+            allow_prefix (bool, optional): Indicates whether unique prefixes of names are accepted.
+        
+        Returns:
+            The value of the according member.
+        
+        Raises:
+            :class:`UnknownMemberError`: If ``value`` does not denote any member unambiguously.
+        """
+        try:
+            return self._values[value]
+        except KeyError:
+            pass
+        
+        if ignore_case:
+            names = self._folded.get(value.casefold())
+            if names is not None and len(names) == 1:
+                return self._values[names[0]]
+        
+        if allow_prefix:
+            if ignore_case:
+                match = self._unique_prefix_match(self._sorted_folded, value.casefold())
+                if match is not None and len(self._folded[match]) == 1:
+                    return self._values[self._folded[match][0]]
+            else:
+                match = self._unique_prefix_match(self._sorted_names, value)
+                if match is not None:
+                    return self._values[match]
+        
+        raise UnknownMemberError(self, value)
+    
+    def possible_values(self) -> str:
+        """Creates a list of the possible values, which is capped at :attr:`MAX_LISTED_VALUES` entries.
+        
+        Returns:
+            str: The comma-separated names of the members.
+        """
+        if self._possible_values is None:
+            names = list(self._values)
+            text = ", ".join(names[:self.MAX_LISTED_VALUES])
+            if len(names) > self.MAX_LISTED_VALUES:
+                text += ", ... ({} more)".format(len(names) - self.MAX_LISTED_VALUES)
+            self._possible_values = text
+        
+        return self._possible_values
+    
+    @staticmethod
+    def _unique_prefix_match(sorted_names: typing.List[str], prefix: str) -> typing.Optional[str]:
+        """Finds the only name in the provided sorted list that starts with ``prefix``, if there is exactly one."""
+        index = bisect.bisect_left(sorted_names, prefix)
+        if index == len(sorted_names) or not sorted_names[index].startswith(prefix):
+            return None
+        if index + 1 < len(sorted_names) and sorted_names[index + 1].startswith(prefix):
+            return None
+        return sorted_names[index]
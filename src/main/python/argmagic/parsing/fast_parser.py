@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+
+
+import argparse
+import bisect
+import typing
+
+from argmagic.parsing import array_values
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class FastParser(object):
+    """A table-driven parser for command-line args that mirrors the behavior of an ``argparse.ArgumentParser``.
+    
+    A ``FastParser`` is created from an ``argparse.ArgumentParser`` that has been populated already, and precomputes a
+    hash table that maps option strings to the according actions as well as a sorted table of all long option strings,
+    which allows for resolving abbreviations by means of binary search instead of scanning all option strings. Parsed
+    values are converted by directly invoking the types of the respective actions.
+    
+    The ``FastParser`` handles the common cases only, i.e., options that store a single value, a constant, or an array
+    (see :class:`array_values.ArrayAction`), and positional args that consume a single value each. Whenever it
+    encounters anything else, e.g., a help option, an error, or an unknown or ambiguous option, it gives up, and the
+    wrapped ``ArgumentParser`` has to be used instead. This way, the results of both parsers are guaranteed to be the
+    same, and all help texts and error messages are produced by ``argparse``.
+    """
+    
+    _HELP = object()   # a marker for help options
+    _STORE = 0         # the kind of actions that store a single value
+    _STORE_CONST = 1   # the kind of actions that store a constant
+    _STORE_ARRAY = 2   # the kind of actions that store an array, which is specified as one or more args
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, parser: argparse.ArgumentParser):
+        """Creates a new instance of ``FastParser``.
+        
+        Args:
+            parser (argparse.ArgumentParser): The arg parser whose behavior the ``FastParser`` mirrors. This must not be
+                modified after the ``FastParser`` has been created.
+        """
+        self._parser = parser
+        self._supported = True  # indicates whether all actions of the parser can be handled
+        
+        self._converters = {}         # maps dests to the converters of the according actions
+        self._defaults = {}           # maps dests to default values
+        self._str_defaults = []       # (dest, converter, default) for all options with default values of type str
+        self._options = {}            # maps option strings to tuples (kind, dest, converter, const)
+        self._positionals = []        # (dest, converter) for all positional args in the order they are parsed
+        self._required_options = []   # the dests of all options that are required
+        
+        # features that are not considered by the FastParser at all
+        if parser.prefix_chars != "-" or parser.fromfile_prefix_chars is not None or parser._mutually_exclusive_groups:
+            self._supported = False
+            return
+        
+        # parser-level defaults, i.e., those specified via set_defaults, are applied first
+        for dest, default in parser._defaults.items():
+            self._defaults[dest] = default
+        
+        for action in parser._actions:
+            if isinstance(action, argparse._HelpAction):
+                for option_string in action.option_strings:
+                    self._options[option_string] = self._HELP
+                continue
+            
+            # check whether the current action is supported
+            # (positional arrays are not, as argparse distributes args among multiple positionals by pattern matching)
+            is_array = isinstance(action, array_values.ArrayAction)
+            if (
+                    action.choices is not None or
+                    action.dest is argparse.SUPPRESS or
+                    not isinstance(
+                            action,
+                            (argparse._StoreAction, argparse._StoreConstAction, array_values.ArrayAction)
+                    ) or
+                    (isinstance(action, argparse._StoreAction) and action.nargs is not None) or
+                    (is_array and not action.option_strings)
+            ):
+                self._supported = False
+                return
+            if is_array:
+                converter = action.converter.parse_args
+            else:
+                converter = parser._registry_get("type", action.type, action.type)
+                if not callable(converter):
+                    self._supported = False
+                    return
+            
+            if action.dest not in self._defaults and action.default is not argparse.SUPPRESS:
+                self._defaults[action.dest] = action.default
+            if not isinstance(action, argparse._StoreConstAction):
+                self._converters[action.dest] = converter
+            
+            if not action.option_strings:
+                self._positionals.append((action.dest, converter))
+                continue
+            
+            if isinstance(action, argparse._StoreConstAction):
+                entry = (self._STORE_CONST, action.dest, None, action.const)
+            elif is_array:
+                entry = (self._STORE_ARRAY, action.dest, converter, None)
+            else:
+                entry = (self._STORE, action.dest, converter, None)
+                if isinstance(action.default, str) and action.default is not argparse.SUPPRESS:
+                    self._str_defaults.append((action.dest, converter, action.default))
+            for option_string in action.option_strings:
+                self._options[option_string] = entry
+            if action.required:
+                self._required_options.append(action.dest)
+        
+        # abbreviations are resolved by means of binary search in a sorted list of all long option strings
+        self._long_options = sorted(o for o in self._options if o.startswith("--")) if parser.allow_abbrev else []
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def supported(self) -> bool:
+        """bool: Indicates whether the ``FastParser`` can handle the actions of the wrapped arg parser at all."""
+        return self._supported
+    
+    #  METHODS  ########################################################################################################
+    
+    def converter(self, dest: str) -> typing.Optional[typing.Callable[[str], typing.Any]]:
+        """Retrieves the function that converts values of the action with the provided dest.
+        
+        Returns:
+            function: The converter, or ``None``, if the according action does not store a value that is parsed from the
+                command line.
+        """
+        return self._converters.get(dest)
+    
+    def default_values(self) -> typing.Dict[str, typing.Any]:
+        """Retrieves the default values of all actions of the wrapped arg parser.
+        
+        Just like ``argparse`` does, default values of type ``str`` are converted by the according actions.
+        
+        Returns:
+            dict: Maps the dests of all actions to the according default values.
+        
+        Raises:
+            Exception: If any of the conversions fails.
+        """
+        values = dict(self._defaults)
+        for dest, converter, default in self._str_defaults:
+            if values.get(dest) is default:
+                values[dest] = converter(default)
+        
+        return values
+    
+    def _lookup_abbreviation(self, prefix: str) -> typing.Optional[tuple]:
+        """Retrieves the option that is uniquely identified by the provided prefix.
+        
+        Returns:
+            tuple: The option that ``prefix`` is an abbreviation of, or ``None``, if there is no such option or the
+                abbreviation is ambiguous.
+        """
+        index = bisect.bisect_left(self._long_options, prefix)
+        if index >= len(self._long_options) or not self._long_options[index].startswith(prefix):
+            return None
+        if index + 1 < len(self._long_options) and self._long_options[index + 1].startswith(prefix):
+            return None
+        
+        return self._options[self._long_options[index]]
+    
+    def parse(self, args: typing.Sequence[str], convert: bool=True) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """Parses the provided command-line args.
+        
+        Args:
+            args (list[str]): The args to parse, which must not include the name of the program.
+            convert (bool, optional): Indicates whether parsed values should be converted. If this is ``False``, then
+                the args are tokenized only, i.e., the result contains the raw values of those actions that are
+                specified in ``args``, and no default values. The raw values of arrays are tuples of all args that
+                specify them.
+        
+        Returns:
+            dict: Maps the dests of all actions of the wrapped arg parser to the parsed values, just like the
+                ``Namespace`` that is created by the arg parser, or ``None``, if the args cannot be handled by the
+                ``FastParser``.
+        """
+        if not self._supported:
+            return None
+        
+        values = dict(self._defaults) if convert else {}
+        seen = set()
+        num_args = len(args)
+        num_positionals = 0
+        index = 0
+        
+        try:
+            while index < num_args:
+                token = args[index]
+                index += 1
+                
+                # //////// Positional Args ---------------------------------------------------------------------------
+                
+                if not token or token[0] != "-":
+                    if num_positionals >= len(self._positionals):
+                        return None
+                    dest, converter = self._positionals[num_positionals]
+                    values[dest] = converter(token) if convert else token
+                    num_positionals += 1
+                    continue
+                
+                # //////// Options -----------------------------------------------------------------------------------
+                
+                explicit_arg = None
+                option = self._options.get(token)
+                if option is None:
+                    # single-dash tokens are either negative numbers or short options, which are left to argparse
+                    if not token.startswith("--") or token == "--":
+                        return None
+                    if "=" in token:
+                        token, explicit_arg = token.split("=", 1)
+                        option = self._options.get(token)
+                    if option is None:
+                        option = self._lookup_abbreviation(token)
+                        if option is None:
+                            return None
+                if option is self._HELP:
+                    return None
+                
+                kind, dest, converter, const = option
+                if kind == self._STORE_CONST:
+                    if explicit_arg is not None:
+                        return None
+                    values[dest] = const
+                elif kind == self._STORE_ARRAY:
+                    # just like argparse, an array consumes all args up to the next one that looks like an option
+                    if explicit_arg is None:
+                        start = index
+                        while index < num_args and args[index][:1] != "-":
+                            index += 1
+                        if index == start:
+                            return None
+                        raw_value = tuple(args[start:index])
+                    elif explicit_arg:
+                        raw_value = (explicit_arg,)
+                    else:
+                        return None
+                    values[dest] = converter(raw_value) if convert else raw_value
+                else:
+                    if explicit_arg is None:
+                        if index >= num_args or args[index][:1] == "-":
+                            return None
+                        explicit_arg = args[index]
+                        index += 1
+                    elif not explicit_arg:
+                        return None
+                    values[dest] = converter(explicit_arg) if convert else explicit_arg
+                seen.add(dest)
+            
+            # //////// Missing Args ----------------------------------------------------------------------------------
+            
+            if num_positionals < len(self._positionals):
+                return None
+            for dest in self._required_options:
+                if dest not in seen:
+                    return None
+            
+            # just like argparse, convert all default values of type str that have not been overwritten
+            if convert:
+                for dest, converter, default in self._str_defaults:
+                    if dest not in seen and values.get(dest) is default:
+                        values[dest] = converter(default)
+        except Exception:  # the error is reported by argparse
+            return None
+        
+        return values
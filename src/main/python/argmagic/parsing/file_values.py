@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+
+"""This module implements option values that are loaded from files, which are specified as ``@path``, e.g.,
+``--mapping @map.json``.
+
+Files are memory-mapped. Numeric arrays are loaded as views of the mapped files wherever possible, and structured values
+are represented by proxies, which parse the files on first access only.
+"""
+
+
+import array
+import collections.abc
+import os
+import threading
+import typing
+
+from argmagic.parsing import structured_loader as sl
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+FILE_PREFIX = "@"
+"""str: The prefix that indicates that a value is the path of a file that contains the actual value."""
+
+RAW_EXTENSIONS = frozenset([".bin", ".raw"])
+"""frozenset[str]: The extensions of files that contain arrays as raw binary data in native byte order."""
+
+
+def is_file_value(value: str) -> bool:
+    """Checks whether the provided value refers to a file, i.e., starts with :attr:`FILE_PREFIX`."""
+    return value.startswith(FILE_PREFIX) and len(value) > len(FILE_PREFIX)
+
+
+def file_path(value: str) -> str:
+    """Retrieves the absolute path of the file that the provided value refers to.
+    
+    Relative paths are resolved immediately, since files are loaded lazily, i.e., possibly after the working directory
+    has changed.
+    
+    Raises:
+        ValueError: If there is no such file.
+    """
+    path = value[len(FILE_PREFIX):]
+    if not os.path.isfile(path):
+        raise ValueError("no such file: '{}'".format(path))
+    
+    return os.path.abspath(path)
+
+
+def load_array(path: str, data_type: type, element_type: type) -> typing.Any:
+    """Loads an array from a file.
+    
+    The format of the file is determined by its extension:
+    
+    - ``.npy``: a NumPy array, which requires NumPy to be installed,
+    - ``.bin`` or ``.raw``: raw binary data in native byte order, and
+    - anything else: a text file that lists the elements separated by commas and/or whitespace.
+    
+    If a NumPy array of matching ``dtype`` is loaded from a binary file, then the returned array is a read-only view of
+    the memory-mapped file, i.e., no data is copied. Otherwise, the elements are copied exactly once.
+    
+    Args:
+        path (str): The path of the file to load.
+        data_type (type): Either ``array.array`` or ``numpy.ndarray``.
+        element_type (type): The type of the elements of the loaded array.
+    
+    Returns:
+        The loaded array.
+    
+    Raises:
+        ValueError: If the file does not contain a valid array.
+    """
+    from argmagic.parsing import array_values
+    
+    converter = array_values.ArrayConverter(data_type, element_type)
+    extension = os.path.splitext(path)[1].lower()
+    
+    # text files are parsed just like values that are given on the command line
+    if extension != ".npy" and extension not in RAW_EXTENSIONS:
+        return converter(converter.split([read_text(path)]))
+    
+    if data_type is array.array:
+        result = array.array(array_values.ArrayConverter.TYPE_CODES[element_type])
+        if extension == ".npy":
+            import numpy
+            
+            values = numpy.ascontiguousarray(numpy.load(path, mmap_mode="r"), dtype=result.typecode)
+            result.frombytes(memoryview(values).cast("B"))
+        elif os.path.getsize(path) > 0:
+            import mmap
+            
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                result.frombytes(buffer)
+        return result
+    
+    import numpy
+    
+    if extension == ".npy":
+        values = numpy.load(path, mmap_mode="r")
+    elif os.path.getsize(path) > 0:
+        values = numpy.memmap(path, dtype=element_type, mode="r")
+    else:
+        values = numpy.empty(0, dtype=element_type)
+    
+    return values if values.dtype == numpy.dtype(element_type) else values.astype(element_type)
+
+
+def read_text(path: str) -> str:
+    """Reads a UTF-8 encoded text file by means of a memory-mapped buffer."""
+    import mmap
+    
+    if os.path.getsize(path) == 0:
+        return ""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        return str(buffer[:], "utf-8")
+
+
+class _LazyValue(object):
+    """The base class of proxies for structured values, which are loaded from files on first access."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(
+            self,
+            path: str,
+            loader: sl.StructuredLoader,
+            data_type: type,
+            type_args: typing.Sequence[type]=()
+    ):
+        """Creates a new lazy value.
+        
+        Args:
+            path (str): The path of the file that contains the value.
+            loader (:class:`structured_loader.StructuredLoader`): The loader that is used for parsing the file.
+            data_type (type): The expected type of the loaded value.
+            type_args (list[type], optional): The expected types of the elements of the loaded value.
+        """
+        self._path = path
+        self._loader = loader
+        self._data_type = data_type
+        self._type_args = tuple(type_args)
+        self._value = None
+        self._lock = threading.Lock()
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __reduce__(self):
+        return type(self), (self._path, self._loader, self._data_type, self._type_args)
+    
+    def __repr__(self):
+        if self._value is None:
+            return "{}('{}{}')".format(type(self).__name__, FILE_PREFIX, self._path)
+        return repr(self._value)
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def loaded(self) -> bool:
+        """bool: Indicates whether the value has been loaded already."""
+        return self._value is not None
+    
+    @property
+    def path(self) -> str:
+        """str: The path of the file that contains the value."""
+        return self._path
+    
+    #  METHODS  ########################################################################################################
+    
+    def load(self) -> typing.Any:
+        """Retrieves the actual value, and loads it, if necessary.
+        
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the file does not contain a valid value of the expected type.
+        """
+        value = self._value
+        if value is None:
+            with self._lock:
+                if self._value is None:
+                    self._value = sl.check_type(
+                            self._loader.load(read_text(self._path)),
+                            self._data_type,
+                            self._type_args
+                    )
+                value = self._value
+        
+        return value
+
+
+class LazyMapping(_LazyValue, collections.abc.Mapping):
+    """A read-only proxy for a ``dict`` that is loaded from a file on first access."""
+    
+    def __getitem__(self, key):
+        return self.load()[key]
+    
+    def __iter__(self):
+        return iter(self.load())
+    
+    def __len__(self):
+        return len(self.load())
+
+
+class LazySequence(_LazyValue, collections.abc.Sequence):
+    """A read-only proxy for a ``list`` that is loaded from a file on first access."""
+    
+    def __eq__(self, other):
+        if isinstance(other, LazySequence):
+            other = other.load()
+        return self.load() == other
+    
+    def __getitem__(self, index):
+        return self.load()[index]
+    
+    def __len__(self):
+        return len(self.load())
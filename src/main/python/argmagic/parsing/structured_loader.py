@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+"""This module implements the loading of structured values, i.e., values of type ``dict`` or ``list``, from strings."""
+
+
+import typing
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class StructuredLoader(object):
+    """Loads structured values that are provided in JSON or YAML format.
+    
+    The following modes are supported:
+    
+    - ``"auto"``: values that look like JSON objects or arrays are parsed as JSON first, which is the fastest option,
+      and everything else, as well as values that are not valid JSON, is parsed as YAML (see ``"yaml"``),
+    - ``"json"``: values are parsed as JSON only,
+    - ``"yaml"``: values are parsed by means of PyYAML's ``CSafeLoader``, if it is available, and the pure-Python
+      ``SafeLoader`` otherwise, and
+    - ``"pure"``: values are parsed by means of PyYAML's pure-Python ``SafeLoader``.
+    
+    Notice that all modes load plain data only, i.e., they never construct arbitrary Python objects.
+    """
+    
+    MODES = ["auto", "json", "yaml", "pure"]
+    """list[str]: The modes that are supported by a ``StructuredLoader``."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, mode: str="auto"):
+        """Creates a new instance of ``StructuredLoader``.
+        
+        Args:
+            mode (str, optional): Specifies :attr:`mode`.
+        
+        Raises:
+            ValueError: If ``mode`` is not supported.
+        """
+        if mode not in self.MODES:
+            raise ValueError("The parameter <mode> has to be one of {}, but is '{}'!".format(self.MODES, mode))
+        self._mode = mode
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __eq__(self, other):
+        return isinstance(other, StructuredLoader) and self._mode == other.mode
+    
+    def __hash__(self):
+        return hash(self._mode)
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def mode(self) -> str:
+        """str: Specifies how values are parsed."""
+        return self._mode
+    
+    #  METHODS  ########################################################################################################
+    
+    def load(self, value: str) -> typing.Any:
+        """Parses the provided value.
+        
+        Args:
+            value (str): The value to parse.
+        
+        Returns:
+            The parsed value.
+        
+        Raises:
+            ValueError: If ``value`` is not well-formed.
+        """
+        # these modules are imported here, since they are expensive to import, and only needed if a value is parsed
+        import json
+        
+        if self._mode == "json" or (self._mode == "auto" and value.lstrip()[:1] in ("{", "[")):
+            try:
+                return json.loads(value)
+            except ValueError:
+                if self._mode == "json":
+                    raise
+        
+        import yaml
+        
+        if self._mode == "pure":
+            loader = yaml.SafeLoader
+        else:
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        try:
+            return yaml.load(value, Loader=loader)
+        except yaml.YAMLError as e:
+            raise ValueError(str(e))
+
+
+def check_type(value: typing.Any, data_type: type, type_args: typing.Sequence[type]=()) -> typing.Any:
+    """Checks whether the provided value is of the expected type, including the types of its elements.
+    
+    Elements of type ``int`` are accepted as ``float``s, and converted accordingly.
+    
+    Args:
+        value: The value to check.
+        data_type (type): The expected type, e.g., ``list``.
+        type_args (list[type], optional): The types of the elements of ``value``, i.e., one type for ``list``s, e.g.,
+            ``[int]`` for ``list[int]``, and types of keys and values for ``dict``s, e.g., ``[str, float]`` for
+            ``dict[str, float]``. If this is empty, then elements are not checked.
+    
+    Returns:
+        ``value``, or a copy of it if any elements had to be converted.
+    
+    Raises:
+        ValueError: If ``value`` or any of its elements is of the wrong type.
+    """
+    if not isinstance(value, data_type):
+        raise ValueError("expected a value of type {}, but found {!r}".format(data_type.__name__, value))
+    if not type_args:
+        return value
+    
+    if data_type is list:
+        element_type, = type_args
+        return [_check_element(v, element_type) for v in value]
+    if data_type is dict:
+        key_type, value_type = type_args
+        return {_check_element(k, key_type): _check_element(v, value_type) for k, v in value.items()}
+    
+    return value
+
+
+def _check_element(value: typing.Any, data_type: type) -> typing.Any:
+    """Checks the type of a single element of a structured value (see :func:`check_type`)."""
+    if data_type is typing.Any or data_type is object:
+        return value
+    if isinstance(value, bool) and data_type is not bool:
+        raise ValueError("expected an element of type {}, but found {!r}".format(data_type.__name__, value))
+    if data_type is float and isinstance(value, int):
+        return float(value)
+    if not isinstance(value, data_type):
+        raise ValueError("expected an element of type {}, but found {!r}".format(data_type.__name__, value))
+    return value
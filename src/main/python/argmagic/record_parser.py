@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+
+"""This module implements the parsing of configurations from files that contain one record per configuration, e.g.,
+JSON Lines or CSV files (see :meth:`magic_parser.MagicParser.parse_file`).
+"""
+
+
+import argparse
+import csv
+import json
+import os
+import typing
+
+from argmagic import config_spec
+from argmagic import config_value
+from argmagic import nested_config
+from argmagic import parse_error
+from argmagic.parsing import array_values
+from argmagic.parsing import structured_loader
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class RecordParser(object):
+    """Creates configuration objects from records, i.e., ``dict``s that map names of options to values.
+    
+    Values of type ``str`` are converted by means of the same functions that are used by the arg parser of a
+    :class:`magic_parser.MagicParser`, and thus in the same way as command-line args. Values of other types, e.g., as
+    they are found in JSON files, are accepted if they match the data type of the respective option. Fields whose values
+    are missing or ``None`` are populated with the according default values, just like options that are not specified
+    on the command line.
+    
+    Options of nested configurations may be specified either by their dotted names, e.g., ``"optimizer.learning_rate"``,
+    or as ``dict``s, e.g., ``{"optimizer": {"learning_rate": 0.5}}``.
+    """
+    
+    BOOL_VALUES = {
+            "1": True, "0": False, "true": True, "false": False, "yes": True, "no": False, "on": True, "off": False
+    }
+    """dict: Maps (lowercase) strings that are accepted as values of type ``bool`` to the according values."""
+    
+    ERROR_MODES = ["raise", "skip", "yield"]
+    """list[str]: The admissible ways of handling records that cannot be parsed."""
+    
+    FILE_FORMATS = {".csv": "csv", ".json": "jsonl", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+    """dict: Maps file extensions to the file formats that are supported by a ``RecordParser``."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(
+            self,
+            conf_class: type,
+            spec: config_spec.ConfigSpec,
+            parser: argparse.ArgumentParser,
+            nested_values: typing.Sequence[config_value.ConfigValue]=None,
+            nested: typing.Sequence[nested_config.NestedOptions]=None
+    ):
+        """Creates a new instance of ``RecordParser``.
+        
+        Args:
+            conf_class (type): The configuration class whose instances are created.
+            spec (:class:`config_spec.ConfigSpec`): The specification of ``conf_class``.
+            parser (argparse.ArgumentParser): The arg parser that has been created for ``spec``, whose actions provide
+                the functions for converting values.
+            nested_values (list[:class:`config_value.ConfigValue`], optional): The options of nested configurations
+                that ``parser`` provides in addition to those in ``spec`` (see :func:`nested_config.expand`). Those
+                without a dotted name are nested configurations that are parsed like any other optional value.
+            nested (list[:class:`nested_config.NestedOptions`], optional): The nested configurations of ``conf_class``.
+        """
+        nested_values = list(nested_values or [])
+        all_values = list(spec) + nested_values
+        names = {conf.name for conf in all_values}
+        
+        self._conf_class = conf_class
+        self._fields = [(conf.name, conf.required) for conf in spec]
+        self._fields.extend((conf.name, False) for conf in nested_values if nested_config.SEPARATOR not in conf.name)
+        self._nested = list(nested or [])
+        
+        # collect converters and default values from the arg parser
+        self._converters = {}
+        array_converters = {}
+        defaults = {}
+        for action in parser._actions:
+            if action.dest is argparse.SUPPRESS or action.dest not in names:
+                continue
+            if isinstance(action, argparse._StoreAction):
+                self._converters[action.dest] = parser._registry_get("type", action.type, action.type)
+            elif isinstance(action, array_values.ArrayAction):
+                self._converters[action.dest] = action.converter.parse
+                array_converters[action.dest] = action.converter
+            if action.default is not argparse.SUPPRESS:
+                defaults[action.dest] = action.default
+        
+        # just like argparse, convert all default values of type str
+        for name, converter in self._converters.items():
+            if isinstance(defaults.get(name), str):
+                defaults[name] = converter(defaults[name])
+        
+        # create a lookup table for the values that are used for populating the fields
+        self._values = {}  # maps the names of fields (as they may appear in records) to pairs (name, converter)
+        for conf in all_values:
+            converter = self._create_converter(conf, self._converters.get(conf.name), array_converters.get(conf.name))
+            self._values[conf.name] = (conf.name, converter)
+            self._values[conf.name.replace("_", "-")] = (conf.name, converter)
+        self._defaults = {name: defaults.get(name) for name, _ in self._fields}
+        
+        # nested configurations may be specified as dicts as well
+        self._nested_paths = {}  # maps the names of nested configurations (as they may appear in records) to paths
+        nodes = list(self._nested)
+        while nodes:
+            node = nodes.pop()
+            self._nested_paths[node.path] = node.path
+            self._nested_paths[node.path.replace("_", "-")] = node.path
+            nodes.extend(node.children)
+    
+    #  METHODS  ########################################################################################################
+    
+    @classmethod
+    def _create_converter(
+            cls,
+            conf,
+            str_converter: typing.Optional[typing.Callable[[str], typing.Any]],
+            array_converter: typing.Optional[array_values.ArrayConverter]=None
+    ) -> typing.Callable[[typing.Any], typing.Any]:
+        """Creates a function that converts values of records for the provided config value.
+        
+        Args:
+            conf (:class:`config_value.ConfigValue`): The config value to create a converter for.
+            str_converter (function): The function that is used by the arg parser for converting values of ``conf``.
+            array_converter (:class:`array_values.ArrayConverter`, optional): The converter for values of ``conf``, if
+                these are arrays, which also accepts lists of numbers.
+        
+        Returns:
+            function: The created converter.
+        """
+        # deferred data types are resolved on first conversion of a value that is not a string
+        is_bool = conf.declared_type is bool
+        enum_values = None  # the values of the members of an exhaustive data type, which are collected on first use
+        
+        def convert(value):
+            nonlocal enum_values
+            
+            if isinstance(value, str):
+                if is_bool:
+                    try:
+                        return cls.BOOL_VALUES[value.lower()]
+                    except KeyError:
+                        raise ValueError("invalid bool value: '{}'".format(value))
+                if str_converter is None:
+                    raise ValueError("values of <{}> cannot be parsed from records".format(conf.name))
+                return str_converter(value)
+            
+            # values of other types are accepted if they match the data type (ints are accepted as floats)
+            data_type = conf.data_type
+            if array_converter is not None and isinstance(value, list):
+                return array_converter(value)
+            if conf.exhaustive:
+                if enum_values is None:
+                    enum_values = [m.value for m in data_type.__members__.values()]
+                    try:
+                        enum_values = frozenset(enum_values)
+                    except TypeError:  # members with unhashable values are looked up linearly
+                        pass
+                try:
+                    legal = value in enum_values
+                except TypeError:  # unhashable values, e.g., lists, are not values of members with hashable values
+                    legal = False
+                if not legal:
+                    raise ValueError("illegal value for <{}>: {!r}".format(conf.name, value))
+                return value
+            if data_type is float and isinstance(value, int) and not isinstance(value, bool):
+                return float(value)
+            if conf.type_args:
+                return structured_loader.check_type(value, data_type, conf.type_args)
+            if not isinstance(value, data_type) or (isinstance(value, bool) and data_type is not bool):
+                raise ValueError(
+                        "invalid value for <{}>: {!r} is not of type {}".format(conf.name, value, data_type.__name__)
+                )
+            return value
+        
+        return convert
+    
+    def parse_file(
+            self,
+            path: str,
+            file_format: str=None,
+            on_error: str="raise",
+            encoding: str="utf-8"
+    ) -> typing.Iterator:
+        """Parses all records in the provided file (see :meth:`magic_parser.MagicParser.parse_file`)."""
+        if file_format is None:
+            file_format = self.FILE_FORMATS.get(os.path.splitext(path)[1].lower())
+            if file_format is None:
+                raise ValueError("The format of the file <path> cannot be inferred: '{}'!".format(path))
+        elif file_format not in self.FILE_FORMATS.values():
+            raise ValueError("The parameter <file_format> specifies an unsupported format: '{}'!".format(file_format))
+        if on_error not in self.ERROR_MODES:
+            raise ValueError(
+                    "The parameter <on_error> has to be one of {}, but is '{}'!".format(self.ERROR_MODES, on_error)
+            )
+        
+        return self._parse_file(path, file_format, on_error, encoding)
+    
+    def _parse_file(self, path: str, file_format: str, on_error: str, encoding: str) -> typing.Iterator:
+        """Parses all records in the provided file after the args have been checked (see :meth:`parse_file`)."""
+        with open(path, "r", encoding=encoding, newline="") as f:
+            records = self.read_csv(f) if file_format == "csv" else self.read_jsonl(f)
+            for index, record in enumerate(records):
+                try:
+                    if isinstance(record, parse_error.ParseError):
+                        raise record
+                    yield self.parse_record(record)
+                except (TypeError, ValueError) as e:
+                    if on_error == "raise":
+                        raise self._create_error(e, index, record)
+                    if on_error == "yield":
+                        yield self._create_error(e, index, record)
+    
+    @staticmethod
+    def _create_error(error: Exception, index: int, record: typing.Any) -> parse_error.ParseError:
+        """Creates a :class:`parse_error.ParseError` that describes a record that could not be parsed."""
+        if isinstance(error, parse_error.ParseError):
+            return parse_error.ParseError(error.message, index=index, item=error.item)
+        return parse_error.ParseError(str(error), index=index, item=record)
+    
+    def convert_record(self, record: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+        """Converts the values in the provided record without creating a configuration object.
+        
+        Args:
+            record (dict): Maps names of options to values (see :meth:`parse_record`).
+        
+        Returns:
+            dict: Maps the names of all options that are specified in ``record`` to their converted values. Notice that
+                fields whose values are missing are not included.
+        
+        Raises:
+            TypeError: If ``record`` is not a ``dict``.
+            ValueError: If ``record`` contains unknown fields or illegal values.
+        """
+        if not isinstance(record, dict):
+            raise TypeError("a record has to be a dict, but found an instance of {}".format(type(record).__name__))
+        
+        values = {}
+        for field, value in record.items():
+            try:
+                name, converter = self._values[field]
+            except KeyError:
+                # the options of nested configurations that are given as dicts are converted like dotted ones
+                path = self._nested_paths.get(field)
+                if path is None or not isinstance(value, dict):
+                    raise ValueError("unknown field: '{}'".format(field))
+                values.update(
+                        self.convert_record(
+                                {"{}{}{}".format(path, nested_config.SEPARATOR, k): v for k, v in value.items()}
+                        )
+                )
+                continue
+            if value is None or value == "":  # missing values, e.g., empty cells of a CSV file
+                continue
+            values[name] = converter(value)
+        
+        return values
+    
+    def parse_record(self, record: typing.Dict[str, typing.Any]):
+        """Creates a configuration object from the provided record.
+        
+        Args:
+            record (dict): Maps names of options to values. Names of options may be specified with underscores, like
+                the names of the according properties, or with dashes, like the names of command-line options. Nested
+                configurations may be specified as ``dict``s.
+        
+        Returns:
+            The created configuration object.
+        
+        Raises:
+            TypeError: If ``record`` is not a ``dict``.
+            ValueError: If ``record`` contains unknown fields or illegal values, or if required fields are missing.
+        """
+        values = dict(self._defaults)
+        values.update(self.convert_record(record))
+        
+        # create and populate configuration object
+        conf = self._conf_class()
+        for name, required in self._fields:
+            value = values[name]
+            if not required and value is None:
+                continue
+            if required and value is None:
+                raise ValueError("missing required field: '{}'".format(name))
+            setattr(conf, name, value)
+        if self._nested:
+            nested_config.populate(conf, values, self._nested)
+        
+        return conf
+    
+    @staticmethod
+    def read_csv(f: typing.TextIO) -> typing.Iterator[typing.Dict[str, str]]:
+        """Reads records from a CSV file one by one, which has to provide the names of all fields in its first line."""
+        yield from csv.DictReader(f)
+    
+    @staticmethod
+    def read_jsonl(f: typing.TextIO) -> typing.Iterator:
+        """Reads records from a JSON Lines file one by one.
+        
+        Lines that do not contain valid JSON are yielded as :class:`parse_error.ParseError`s, and empty lines are
+        skipped.
+        """
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                yield parse_error.ParseError("invalid JSON: {}".format(e), item=line.rstrip("\n"))
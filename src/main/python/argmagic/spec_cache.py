@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+
+"""This module provides a persistent cache for configuration specifications, which allows for skipping the
+introspection of configuration classes when an application is started repeatedly.
+"""
+
+
+import os
+import sys
+import typing
+
+import insanity
+
+import argmagic
+
+from argmagic import config_spec
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class SpecCache(object):
+    """A cache that persists configuration specifications on disk.
+    
+    Every entry of the cache stores the specification of a configuration class together with the order in which its
+    options are added to the arg parser. Entries are keyed by a hash of the source files of the configuration class
+    and its base classes, the version of ``argmagic``, the version of Python, and the custom parser factories that are
+    used. Hence, an entry is invalidated automatically as soon as any of these changes.
+    
+    Entries are written atomically, i.e., they are written to a temporary file first, which is renamed afterwards.
+    Therefore, multiple processes may use the same cache concurrently. Entries that cannot be read are ignored, and
+    the according specification is simply created again.
+    
+    A cache may be opened in read-only mode, which is useful for caches that are shared, e.g., as part of an image that
+    is deployed on a cluster. A read-only cache is used for looking up specifications only, and never written.
+    
+    Notice that entries are stored by means of ``pickle``, which is why a cache directory must not be writable by
+    anyone who is not trusted.
+    """
+    
+    FILE_EXTENSION = ".spec"
+    """str: The extension of all files that store entries of a ``SpecCache``."""
+    
+    FORMAT_VERSION = 6
+    """int: The version of the format that entries are stored in."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, cache_dir: str, read_only: bool=False):
+        """Creates a new instance of ``SpecCache``.
+        
+        Args:
+            cache_dir (str): Specifies :attr:`cache_dir`. If the directory does not exist, then it is created when the
+                first entry is stored.
+            read_only (bool, optional): Specifies :attr:`read_only`.
+        """
+        insanity.sanitize_type("cache_dir", cache_dir, str)
+        
+        self._cache_dir = cache_dir
+        self._read_only = bool(read_only)
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def cache_dir(self) -> str:
+        """str: The directory that the entries of the cache are stored in."""
+        return self._cache_dir
+    
+    @property
+    def read_only(self) -> bool:
+        """bool: Indicates whether the cache is used for looking up specifications only."""
+        return self._read_only
+    
+    #  METHODS  ########################################################################################################
+    
+    def _path(self, key: str) -> str:
+        """Computes the path of the file that stores the entry with the provided key."""
+        return os.path.join(self._cache_dir, key + self.FILE_EXTENSION)
+    
+    def clear(self) -> None:
+        """Removes all entries from the cache.
+        
+        Raises:
+            ValueError: If the cache is read-only.
+        """
+        if self._read_only:
+            raise ValueError("A read-only cache cannot be cleared!")
+        if not os.path.isdir(self._cache_dir):
+            return
+        for name in os.listdir(self._cache_dir):
+            if name.endswith(self.FILE_EXTENSION):
+                try:
+                    os.remove(os.path.join(self._cache_dir, name))
+                except FileNotFoundError:  # the file was removed by someone else in the meantime
+                    pass
+    
+    def key(
+            self,
+            conf_class: type,
+            custom_parsers: typing.Dict[type, typing.Any]=None,
+            mode: str=config_spec.ConfigSpec.DOCSTRINGS
+    ) -> typing.Optional[str]:
+        """Computes the key of the entry that stores the specification of the provided configuration class.
+        
+        Args:
+            conf_class (type): The configuration class to compute the key for.
+            custom_parsers (dict, optional): The custom parser factories that are used together with ``conf_class``.
+            mode (str, optional): The mode that the specification is extracted in (see
+                :meth:`config_spec.ConfigSpec.create_spec`).
+        
+        Returns:
+            str: The key, or ``None``, if the configuration class cannot be cached, because (some of) its source code is
+                not available as a file.
+        """
+        import hashlib
+        
+        h = hashlib.sha256()
+        h.update(
+                "{}|{}|{}|{}.{}|{}".format(
+                        self.FORMAT_VERSION,
+                        argmagic.__version__,
+                        sys.implementation.cache_tag,
+                        conf_class.__module__,
+                        conf_class.__qualname__,
+                        mode
+                ).encode("utf-8")
+        )
+        
+        # add the source files of the configuration class and all of its bases
+        for c in conf_class.__mro__:
+            if c is object:
+                continue
+            module = sys.modules.get(c.__module__)
+            path = getattr(module, "__file__", None)
+            if path is None:
+                return None
+            try:
+                with open(path, "rb") as f:
+                    h.update(f.read())
+            except OSError:
+                return None
+        
+        # add the custom parser factories
+        if custom_parsers:
+            for name in sorted(
+                    "{}.{}={}.{}".format(
+                            t.__module__,
+                            t.__qualname__,
+                            type(f).__module__,
+                            type(f).__qualname__
+                    )
+                    for t, f in custom_parsers.items()
+            ):
+                h.update(b"|" + name.encode("utf-8"))
+        
+        return h.hexdigest()
+    
+    def load(self, key: str) -> typing.Optional[typing.Tuple[config_spec.ConfigSpec, typing.List[str]]]:
+        """Loads an entry from the cache.
+        
+        Args:
+            key (str): The key of the entry to load, as computed by :meth:`key`.
+        
+        Returns:
+            tuple: A pair that consists of the cached specification and the names of its values in the order that they
+                are added to the arg parser in, or ``None``, if there is no (readable) entry for the provided key.
+        """
+        import pickle
+        
+        try:
+            with open(self._path(key), "rb") as f:
+                stored_key, spec, option_order = pickle.load(f)
+        except Exception:  # the entry is missing, corrupt, or outdated -> it is simply rebuilt
+            return None
+        
+        # make sure that the entry was not overwritten by an entry for another key
+        if stored_key != key or not isinstance(spec, config_spec.ConfigSpec):
+            return None
+        
+        return spec, option_order
+    
+    def store(self, key: str, spec: config_spec.ConfigSpec, option_order: typing.List[str]) -> bool:
+        """Stores an entry in the cache.
+        
+        If the cache is read-only, then this method does not do anything.
+        
+        Args:
+            key (str): The key of the entry to store, as computed by :meth:`key`.
+            spec (:class:`config_spec.ConfigSpec`): The specification to store.
+            option_order (list[str]): The names of the values in ``spec`` in the order that they are added to the arg
+                parser in.
+        
+        Returns:
+            bool: Indicates whether the entry has been stored.
+        """
+        if self._read_only:
+            return False
+        
+        import pickle
+        import uuid
+        
+        try:
+            data = pickle.dumps((key, spec, list(option_order)), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:  # some default value cannot be pickled -> the spec is not cached
+            return False
+        
+        # write the entry to a temporary file first, and rename it afterwards, which is atomic
+        # (the temporary file is created exclusively, just like by tempfile.mkstemp, but with the same permissions as
+        # any other file, i.e., according to the umask of the process)
+        # caches are best-effort -> if the directory cannot be written, then the entry is not stored
+        tmp_path = os.path.join(self._cache_dir, ".tmp-{}{}.part".format(uuid.uuid4().hex, self.FILE_EXTENSION))
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+        except OSError:
+            return False
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+        
+        return True
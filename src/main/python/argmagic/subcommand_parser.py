@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+
+"""This module provides a parser for applications that consist of several subcommands with their own configurations.
+
+A :class:`SubcommandParser` maps the names of subcommands to configuration classes or import paths of such, and only
+the subcommand that is selected by the first arg is ever loaded. This means that neither the modules nor the
+specifications nor the parsers of any other subcommands are created, and that the startup cost of an application does
+not grow with the number of its subcommands.
+"""
+
+
+import importlib
+import sys
+import typing
+
+import insanity
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class SubcommandParser(object):
+    """Parses args whose first item is a subcommand, which determines the configuration class of the remaining args.
+    
+    Configuration classes may be given as import paths, e.g., ``"app.train:TrainConfig"`` or
+    ``"app.train.TrainConfig"``, in which case their modules are imported only if the according subcommand is selected.
+    Furthermore, the :class:`magic_parser.MagicParser`s of subcommands are created on demand, and reused subsequently.
+    """
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(
+            self,
+            commands: typing.Dict[str, typing.Union[type, str]],
+            app_name: str=None,
+            app_description: str=None,
+            **parser_kwargs
+    ):
+        """Creates a new instance of ``SubcommandParser``.
+        
+        Args:
+            commands (dict): Maps the names of all subcommands to their configuration classes or import paths of these.
+            app_name (str, optional): The name of the application, which is printed in help texts. The help texts of
+                subcommands are printed with the name of the subcommand appended.
+            app_description (str, optional): A description of the application, which is printed in the help text.
+            **parser_kwargs: Additional args that are passed to the :class:`magic_parser.MagicParser`s of all
+                subcommands, e.g., ``spec_cache`` or ``fast_parsing``.
+        
+        Raises:
+            TypeError: If any subcommand is mapped to anything but a class or a ``str``.
+            ValueError: If there are no subcommands, or any of their names is empty or starts with a dash.
+        """
+        # sanitize args
+        insanity.sanitize_type("commands", commands, dict)
+        if not commands:
+            raise ValueError("The parameter <commands> must not be empty!")
+        for name, conf_class in commands.items():
+            insanity.sanitize_type("commands.keys", name, str)
+            if not name or name.startswith("-"):
+                raise ValueError("Invalid command name: '{}'!".format(name))
+            if not isinstance(conf_class, (type, str)):
+                raise TypeError(
+                        "Commands have to be mapped to classes or import paths, but '{}' is mapped to {}!".format(
+                                name,
+                                type(conf_class).__qualname__
+                        )
+                )
+        
+        # store args
+        self._app_description = app_description
+        self._app_name = app_name
+        self._commands = dict(commands)
+        self._parser_kwargs = parser_kwargs
+        self._parsers = {}
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def commands(self) -> typing.List[str]:
+        """list[str]: The names of all subcommands."""
+        return list(self._commands)
+    
+    #  METHODS  ########################################################################################################
+    
+    def conf_class(self, command: str) -> type:
+        """Retrieves the configuration class of the provided subcommand, and imports it, if necessary.
+        
+        Args:
+            command (str): The name of the subcommand.
+        
+        Returns:
+            type: The configuration class.
+        
+        Raises:
+            ImportError: If the configuration class is given as import path, and cannot be imported.
+            KeyError: If there is no subcommand with the provided name.
+            TypeError: If the import path of the configuration class does not refer to a class.
+        """
+        conf_class = self._commands[command]
+        if isinstance(conf_class, str):
+            conf_class = self._import_class(conf_class)
+            self._commands[command] = conf_class
+        
+        return conf_class
+    
+    def _error(self, message: str) -> None:
+        """Prints the usage and the provided error message in the same way as ``argparse`` does, and exits."""
+        sys.stderr.write("{}{}: error: {}\n".format(self._format_usage(), self._prog(), message))
+        sys.exit(2)
+    
+    def format_help(self) -> str:
+        """Renders the help text of the application, which lists all subcommands, without loading any of them.
+        
+        Returns:
+            str: The help text.
+        """
+        parts = [self._format_usage()]
+        if self._app_description is not None:
+            parts.append("\n{}\n".format(self._app_description))
+        parts.append("\ncommands:\n")
+        parts.extend("  {}\n".format(name) for name in self._commands)
+        
+        return "".join(parts)
+    
+    def _format_usage(self) -> str:
+        """Renders the usage line of the application."""
+        return "usage: {} [-h] COMMAND ...\n".format(self._prog())
+    
+    def get_parser(self, command: str):
+        """Retrieves the :class:`magic_parser.MagicParser` of the provided subcommand, and creates it, if necessary.
+        
+        Args:
+            command (str): The name of the subcommand.
+        
+        Returns:
+            :class:`magic_parser.MagicParser`: The parser.
+        
+        Raises:
+            ImportError: If the configuration class of the subcommand cannot be imported.
+            KeyError: If there is no subcommand with the provided name.
+        """
+        parser = self._parsers.get(command)
+        if parser is None:
+            from argmagic import magic_parser
+            
+            parser = magic_parser.MagicParser(
+                    self.conf_class(command),
+                    app_name="{} {}".format(self._prog(), command),
+                    **self._parser_kwargs
+            )
+            self._parsers[command] = parser
+        
+        return parser
+    
+    @staticmethod
+    def _import_class(path: str) -> type:
+        """Imports the class at the provided path, which is either ``"module:qualname"`` or ``"module.name"``."""
+        if ":" in path:
+            module_name, _, qualname = path.partition(":")
+        else:
+            module_name, _, qualname = path.rpartition(".")
+        
+        obj = importlib.import_module(module_name)
+        for name in qualname.split("."):
+            try:
+                obj = getattr(obj, name)
+            except AttributeError:
+                raise ImportError("cannot import '{}' from '{}'".format(qualname, module_name))
+        if not isinstance(obj, type):
+            raise TypeError("The import path '{}' does not refer to a class!".format(path))
+        
+        return obj
+    
+    def parse_args(self, args: typing.Sequence[str]=None) -> typing.Tuple[str, typing.Any]:
+        """Parses the args of the current application.
+        
+        The first arg selects the subcommand, and the remaining ones are parsed by its
+        :class:`magic_parser.MagicParser`. If the args cannot be parsed, then an error message is printed, and the
+        application is terminated.
+        
+        Args:
+            args (list[str], optional): The args to parse. By default, these are taken from ``sys.argv``.
+        
+        Returns:
+            tuple: The name of the selected subcommand and the parsed configuration.
+        """
+        args = sys.argv[1:] if args is None else list(args)
+        if not args:
+            self._error("the following arguments are required: COMMAND")
+        
+        command = args[0]
+        if command in ("-h", "--help"):
+            sys.stdout.write(self.format_help())
+            sys.exit(0)
+        if command not in self._commands:
+            self._error(
+                    "invalid choice: '{}' (choose from {})".format(
+                            command,
+                            ", ".join("'{}'".format(name) for name in self._commands)
+                    )
+            )
+        
+        return command, self.get_parser(command).parse_args(args[1:])
+    
+    def _prog(self) -> str:
+        """Retrieves the name of the application that is printed in usage lines."""
+        return str(self._app_name)
@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+
+"""This module implements the tracing of the phases of creating parsers and parsing configurations.
+
+A :class:`Tracer` records timed :class:`Span`s, e.g., for creating the specification of a configuration class, for
+building the arg parser, for tokenizing args, and for converting and setting the values of individual options, and
+passes them on to any hooks that have been registered. Tracing is disabled by default, and then costs no more than a
+check for ``None`` per phase. It is enabled either for a single :class:`magic_parser.MagicParser` by means of its arg
+``trace``, or for the entire process by means of the environment variable :attr:`ENV_VAR`. In the latter case, a
+report of the recorded spans is printed to stderr when the process exits.
+"""
+
+
+import collections
+import functools
+import os
+import sys
+import threading
+import time
+import typing
+
+import insanity
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+ENV_VAR = "ARGMAGIC_TRACE"
+"""str: The environment variable that enables tracing for the entire process.
+
+If this is set to ``"memory"``, then allocations are traced as well, and any other value except for ``""``, ``"0"``,
+and ``"false"`` enables tracing of durations only.
+"""
+
+Span = collections.namedtuple("Span", ["name", "start", "seconds", "depth", "allocated", "attributes"])
+"""type: Describes a single phase that has been traced.
+
+A ``Span`` provides its ``name``, e.g., ``"parse"``, the time when it started and its duration in ``seconds``, as well
+as its ``depth``, i.e., the number of spans that it is nested in. If allocations are traced, then ``allocated`` is the
+net number of bytes that were allocated during the span, and ``None``, otherwise. The ``attributes`` are a ``dict``
+that describes the span further, e.g., ``{"option": "learning_rate"}``.
+"""
+
+MAX_SPANS = 10000
+"""int: The default number of spans that a :class:`Tracer` retains, which bounds its memory footprint."""
+
+_global_tracer = None
+"""Tracer: The tracer that is enabled by means of :attr:`ENV_VAR`."""
+
+_global_tracer_lock = threading.Lock()
+"""threading.Lock: Guards the creation of :attr:`_global_tracer`."""
+
+_global_tracer_loaded = False
+"""bool: Indicates whether :attr:`ENV_VAR` has been evaluated already."""
+
+
+def get_tracer() -> typing.Optional["Tracer"]:
+    """Retrieves the tracer that is enabled for the entire process by means of the environment variable :attr:`ENV_VAR`.
+    
+    The environment variable is evaluated on first call only.
+    
+    Returns:
+        :class:`Tracer`: The tracer, or ``None``, if tracing is not enabled.
+    """
+    global _global_tracer, _global_tracer_loaded
+    
+    if _global_tracer_loaded:
+        return _global_tracer
+    with _global_tracer_lock:
+        if not _global_tracer_loaded:
+            value = os.environ.get(ENV_VAR, "").strip().lower()
+            if value not in ("", "0", "false"):
+                import atexit
+                
+                _global_tracer = Tracer(trace_memory=value == "memory")
+                atexit.register(lambda: sys.stderr.write(_global_tracer.report() + "\n"))
+            _global_tracer_loaded = True
+    
+    return _global_tracer
+
+
+def span(tracer: typing.Optional["Tracer"], name: str, **attributes) -> typing.ContextManager:
+    """Creates a context manager that traces a span by means of the provided tracer, if there is any.
+    
+    This allows for tracing phases without checking explicitly whether tracing is enabled.
+    
+    Args:
+        tracer (:class:`Tracer`): The tracer to use, or ``None``, if tracing is disabled.
+        name (str): The name of the span.
+        **attributes: Describe the span further.
+    
+    Returns:
+        A context manager, which does nothing, if ``tracer`` is ``None``.
+    """
+    if tracer is None:
+        return _NULL_SPAN
+    return tracer.span(name, **attributes)
+
+
+class _NullSpan(object):
+    """A context manager that does nothing, which is used if tracing is disabled."""
+    
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+"""_NullSpan: The shared instance of :class:`_NullSpan`."""
+
+
+class _SpanContext(object):
+    """A context manager that traces a single span."""
+    
+    __slots__ = ("_allocated", "_attributes", "_depth", "_name", "_start", "_tracer")
+    
+    def __init__(self, tracer: "Tracer", name: str, attributes: dict):
+        self._allocated = None
+        self._attributes = attributes
+        self._depth = None
+        self._name = name
+        self._start = None
+        self._tracer = tracer
+    
+    def __enter__(self):
+        local = self._tracer._local
+        self._depth = getattr(local, "depth", 0)
+        local.depth = self._depth + 1
+        if self._tracer.trace_memory:
+            self._allocated = self._tracer._traced_memory()
+        self._start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        seconds = time.perf_counter() - self._start
+        allocated = None
+        if self._allocated is not None:
+            allocated = self._tracer._traced_memory() - self._allocated
+        self._tracer._local.depth = self._depth
+        self._tracer._record(Span(self._name, self._start, seconds, self._depth, allocated, self._attributes))
+        return False
+
+
+class Tracer(object):
+    """Records timed spans, and passes them on to hooks.
+    
+    Spans are recorded when they end, which means that nested spans are recorded before the spans that they are
+    nested in. Tracers are thread-safe, and the nesting of spans is tracked per thread.
+    
+    Only the most recent spans are retained in a ring buffer, which allows for tracing long-running processes. However,
+    the counts and total durations of all spans are aggregated by their names (see :meth:`summary`).
+    """
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(
+            self,
+            trace_memory: bool=False,
+            hooks: typing.Iterable[typing.Callable[[Span], None]]=None,
+            max_spans: int=MAX_SPANS
+    ):
+        """Creates a new instance of ``Tracer``.
+        
+        Args:
+            trace_memory (bool, optional): Specifies whether allocations are traced by means of ``tracemalloc``, which
+                is started, if necessary, and slows down the traced code considerably.
+            hooks (iterable[function], optional): Functions that are invoked with every :class:`Span` that is recorded.
+            max_spans (int, optional): The number of spans that are retained, or ``None``, if all spans should be.
+        
+        Raises:
+            TypeError: If ``max_spans`` is not an ``int``.
+            ValueError: If ``max_spans`` is not positive.
+        """
+        insanity.sanitize_type("max_spans", max_spans, int, none_allowed=True)
+        if max_spans is not None:
+            insanity.sanitize_range("max_spans", max_spans, minimum=1)
+        
+        self._dropped = 0
+        self._hooks = list(hooks or ())
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._spans = collections.deque(maxlen=max_spans)
+        self._totals = {}  # maps names of spans to lists [count, total duration in seconds]
+        self._trace_memory = bool(trace_memory)
+        
+        if self._trace_memory:
+            import tracemalloc
+            
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def dropped(self) -> int:
+        """int: The number of spans that have been discarded, since the number of retained spans is limited."""
+        with self._lock:
+            return self._dropped
+    
+    @property
+    def spans(self) -> typing.List[Span]:
+        """list[:class:`Span`]: The retained spans in the order that they ended in."""
+        with self._lock:
+            return list(self._spans)
+    
+    @property
+    def trace_memory(self) -> bool:
+        """bool: Indicates whether allocations are traced."""
+        return self._trace_memory
+    
+    #  METHODS  ########################################################################################################
+    
+    def _record(self, span_: Span) -> None:
+        """Records the provided span, and invokes all hooks."""
+        with self._lock:
+            if len(self._spans) == self._spans.maxlen:
+                self._dropped += 1
+            self._spans.append(span_)
+            totals = self._totals.get(span_.name)
+            if totals is None:
+                self._totals[span_.name] = [1, span_.seconds]
+            else:
+                totals[0] += 1
+                totals[1] += span_.seconds
+            hooks = list(self._hooks)
+        for hook in hooks:
+            hook(span_)
+    
+    @staticmethod
+    def _traced_memory() -> int:
+        """Retrieves the size of the memory that is currently allocated according to ``tracemalloc``."""
+        import tracemalloc
+        
+        return tracemalloc.get_traced_memory()[0]
+    
+    def add_hook(self, hook: typing.Callable[[Span], None]) -> None:
+        """Registers a function that is invoked with every :class:`Span` that is recorded subsequently."""
+        with self._lock:
+            self._hooks.append(hook)
+    
+    def clear(self) -> None:
+        """Removes all spans that have been recorded so far, including their aggregates."""
+        with self._lock:
+            self._dropped = 0
+            self._spans.clear()
+            self._totals.clear()
+    
+    def remove_hook(self, hook: typing.Callable[[Span], None]) -> None:
+        """Removes a function that has been registered by means of :meth:`add_hook`.
+        
+        Raises:
+            ValueError: If ``hook`` has not been registered.
+        """
+        with self._lock:
+            self._hooks.remove(hook)
+    
+    def report(self) -> str:
+        """Creates a human-readable report of all spans that have been retained.
+        
+        Spans are listed in the order that they started in, and nested spans are indented. If any spans have been
+        discarded, then this is noted in the first line, which is followed by a summary of all spans.
+        
+        Returns:
+            str: The report.
+        """
+        lines = []
+        dropped = self.dropped
+        if dropped > 0:
+            lines.append("{} earlier spans were discarded, all spans by name:".format(dropped))
+            for name, (count, seconds) in sorted(self.summary().items()):
+                lines.append("{:9.3f} ms  {} (x{})".format(seconds * 1000, name, count))
+            lines.append("most recent spans:")
+        for s in sorted(self.spans, key=lambda x: (x.start, x.depth)):
+            attributes = "".join(" {}={}".format(k, v) for k, v in sorted(s.attributes.items()))
+            line = "{:9.3f} ms  {}{}{}".format(s.seconds * 1000, "  " * s.depth, s.name, attributes)
+            if s.allocated is not None:
+                line += " ({:+d} B)".format(s.allocated)
+            lines.append(line)
+        
+        return "\n".join(lines)
+    
+    def span(self, name: str, **attributes) -> typing.ContextManager:
+        """Creates a context manager that traces a span with the provided name.
+        
+        Args:
+            name (str): The name of the span.
+            **attributes: Describe the span further.
+        
+        Returns:
+            A context manager that records the span when it exits.
+        """
+        return _SpanContext(self, name, attributes)
+    
+    def summary(self) -> typing.Dict[str, typing.Tuple[int, float]]:
+        """Aggregates all recorded spans by their names, including those that have been discarded.
+        
+        Returns:
+            dict: Maps names of spans to pairs (count, total duration in seconds).
+        """
+        with self._lock:
+            return {name: (count, seconds) for name, (count, seconds) in self._totals.items()}
+    
+    def wrap(self, name: str, func: typing.Callable, **attributes) -> typing.Callable:
+        """Wraps the provided function such that every call of it is traced as a span.
+        
+        Args:
+            name (str): The name of the spans.
+            func (function): The function to wrap.
+            **attributes: Describe the spans further.
+        
+        Returns:
+            function: The wrapped function, which has the same name as ``func``.
+        """
+        @functools.wraps(func, updated=())
+        def traced(*args, **kwargs):
+            with _SpanContext(self, name, attributes):
+                return func(*args, **kwargs)
+        
+        return traced
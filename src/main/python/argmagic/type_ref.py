@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+
+"""This module implements the resolution of types that are specified by name, e.g., in docstrings.
+
+Types whose modules have been imported already are resolved right away. All other types are represented by
+:class:`TypeRef`s, which import the according modules on first use only. Resolved types are cached process-wide, and
+every import that is caused by resolving a type is logged together with the time that it took (see :func:`import_log`).
+"""
+
+
+import builtins
+import collections
+import importlib
+import sys
+import threading
+import time
+import typing
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+ImportRecord = collections.namedtuple("ImportRecord", ["type_name", "module", "seconds"])
+"""type: Describes the import of a module that was caused by resolving a type."""
+
+_UNRESOLVED = object()
+"""object: A marker for types that have not been resolved yet."""
+
+_import_log = []
+"""list[:class:`ImportRecord`]: All imports that were caused by resolving types."""
+
+_lock = threading.RLock()
+"""threading.RLock: Guards the caches and the import log."""
+
+_refs = {}
+"""dict: Maps names of types to the :class:`TypeRef`s that represent them."""
+
+_types = {}
+"""dict: Maps names of types to the resolved types, or ``None``, if they cannot be found."""
+
+
+def import_log() -> typing.List[ImportRecord]:
+    """Retrieves all imports that were caused by resolving types in the current process.
+    
+    Returns:
+        list[:class:`ImportRecord`]: The imports in the order that they happened in.
+    """
+    with _lock:
+        return list(_import_log)
+
+
+def locate(name: str) -> typing.Union[type, "TypeRef", None]:
+    """Looks up the type with the provided name, e.g., ``"int"`` or ``"collections.OrderedDict"``, without importing any
+    modules.
+    
+    Args:
+        name (str): The name of the type to look up, which is either the name of a builtin or fully qualified.
+    
+    Returns:
+        The type, if it is a builtin or its module has been imported already, or a :class:`TypeRef`, otherwise.
+        ``None`` is returned for names without any dots that do not refer to a builtin.
+    """
+    with _lock:
+        resolved = _types.get(name, _UNRESOLVED)
+        if resolved is not _UNRESOLVED:
+            return resolved
+    
+    # check if the type can be found without importing anything
+    parts = [part for part in name.split(".") if part]
+    if len(parts) == 1:
+        return _store(name, getattr(builtins, parts[0], None))
+    for n in range(len(parts) - 1, 0, -1):
+        module = sys.modules.get(".".join(parts[:n]))
+        if module is not None:
+            data_type = _get_attr(module, parts[n:])
+            if data_type is not None:
+                return _store(name, data_type)
+    
+    return _shared_ref(name)
+
+
+def resolve(name: str) -> typing.Optional[type]:
+    """Resolves the type with the provided name, and imports the according modules, if necessary.
+    
+    Args:
+        name (str): The name of the type to resolve (see :func:`locate`).
+    
+    Returns:
+        The type, or ``None``, if there is no such type.
+    
+    Raises:
+        ImportError: If a module exists, but cannot be imported.
+    """
+    with _lock:
+        resolved = _types.get(name, _UNRESOLVED)
+    if resolved is not _UNRESOLVED:
+        return resolved
+    
+    # import as many modules as possible along the path of the type
+    # (this happens outside of the lock, since imports acquire Python's import locks, and thus would deadlock with any
+    # thread that resolves a type while importing a module, e.g., at module level)
+    parts = [part for part in name.split(".") if part]
+    obj = builtins
+    n = 0
+    while n < len(parts):
+        module_name = ".".join(parts[:n + 1])
+        already_imported = module_name in sys.modules
+        start = time.perf_counter()
+        try:
+            obj = importlib.import_module(module_name)
+        except ModuleNotFoundError as e:
+            if e.name is not None and module_name != e.name and not module_name.startswith(e.name + "."):
+                raise  # some module that is imported by the current one is missing
+            break
+        if not already_imported:
+            with _lock:
+                _import_log.append(ImportRecord(name, module_name, time.perf_counter() - start))
+        n += 1
+    
+    return _store(name, _get_attr(obj, parts[n:]) if parts else None)
+
+
+def type_name(data_type: type) -> str:
+    """Computes the name that a :class:`TypeRef` for the provided type would have, e.g., ``"collections.OrderedDict"``.
+    """
+    module = getattr(data_type, "__module__", None)
+    qualname = getattr(data_type, "__qualname__", None) or getattr(data_type, "__name__", "")
+    if module is None or module == "builtins":
+        return qualname
+    return module + "." + qualname
+
+
+def _get_attr(obj: typing.Any, names: typing.List[str]) -> typing.Any:
+    """Follows the provided path of attribute names starting at ``obj``, and returns ``None`` if any of them is missing.
+    """
+    for name in names:
+        obj = getattr(obj, name, None)
+        if obj is None:
+            return None
+    return obj
+
+
+def _shared_ref(name: str) -> "TypeRef":
+    """Retrieves the process-wide :class:`TypeRef` for the provided name, and creates it, if necessary."""
+    with _lock:
+        ref = _refs.get(name)
+        if ref is None:
+            ref = TypeRef(name)
+            _refs[name] = ref
+    return ref
+
+
+def _store(name: str, data_type: typing.Optional[type]) -> typing.Optional[type]:
+    """Stores a resolved type in the cache, and returns it."""
+    with _lock:
+        _types[name] = data_type
+    return data_type
+
+
+class TypeRef(object):
+    """A reference to a type, which is resolved on first use.
+    
+    ``TypeRef``s are shared process-wide, i.e., there is only one instance for every name, if they are created by means
+    of :func:`locate` or unpickled. Two ``TypeRef``s are equal, if they have the same name, and a ``TypeRef`` is equal
+    to a type, if the type's name is the same (see :func:`type_name`).
+    """
+    
+    __slots__ = ("_name",)
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, name: str):
+        """Creates a new instance of ``TypeRef``.
+        
+        Args:
+            name (str): The fully qualified name of the referenced type.
+        """
+        self._name = name
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __eq__(self, other):
+        if isinstance(other, TypeRef):
+            return self._name == other._name
+        if isinstance(other, type):
+            return self._name == type_name(other)
+        return NotImplemented
+    
+    def __hash__(self):
+        return hash(self._name)
+    
+    def __reduce__(self):
+        return _shared_ref, (self._name,)
+    
+    def __repr__(self):
+        return "TypeRef('{}')".format(self._name)
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def imports(self) -> typing.List[ImportRecord]:
+        """list[:class:`ImportRecord`]: The imports that were caused by resolving the referenced type."""
+        with _lock:
+            return [r for r in _import_log if r.type_name == self._name]
+    
+    @property
+    def name(self) -> str:
+        """str: The fully qualified name of the referenced type."""
+        return self._name
+    
+    @property
+    def resolved(self) -> bool:
+        """bool: Indicates whether the referenced type has been resolved already."""
+        with _lock:
+            return self._name in _types
+    
+    #  METHODS  ########################################################################################################
+    
+    def resolve(self) -> type:
+        """Resolves the referenced type, and imports the according modules, if necessary.
+        
+        For consistency with types that are not deferred, references to types that do not exist are resolved as
+        ``str``.
+        
+        Returns:
+            type: The referenced type.
+        """
+        data_type = resolve(self._name)
+        return str if data_type is None else data_type
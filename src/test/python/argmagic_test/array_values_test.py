@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import array
+import os
+import tempfile
+import unittest
+
+from argmagic import magic_parser
+from argmagic import parse_error
+from argmagic.parsing import array_values
+from argmagic_test import dummy_config_5
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class ArrayValuesTest(unittest.TestCase):
+    
+    def setUp(self):
+        self._parser = magic_parser.MagicParser(dummy_config_5.DummyConfig5)
+    
+    def test_converter(self):
+        target = array_values.ArrayConverter(array.array, int)
+        self.assertEqual(array.array("q", [1, 2, 3]), target(["1", "2", "3"]))
+        self.assertEqual(array.array("q", [1, 2, 3]), target.parse("[1, 2, 3]"))
+        self.assertEqual(array.array("q"), target.parse(""))
+        self.assertRaises(ValueError, target, ["1", "2.5"])
+        
+        target = array_values.ArrayConverter(array.array)
+        self.assertEqual(array.array("d", [0.5, 2.0]), target.parse("0.5 2"))
+        self.assertRaises(ValueError, array_values.ArrayConverter, array.array, str)
+        self.assertRaises(ValueError, array_values.ArrayConverter, list)
+        
+        self.assertEqual(["1", "2", "3", "4"], array_values.ArrayConverter.split(["1,2", "3", " 4 "]))
+    
+    def test_parse_args(self):
+        # CHECK: default values are converted to arrays
+        conf = self._parser.parse_args(["[1]"])
+        self.assertEqual(array.array("q", [1, 2]), conf.sizes)
+        self.assertEqual(array.array("d", [0.5, 0.25]), conf.thresholds)
+        
+        # CHECK: arrays may be specified as multiple args as well as delimited strings
+        conf = self._parser.parse_args(["[1]", "--sizes", "3", "4", "5", "--thresholds", "0.1,0.2", "-0.3"])
+        self.assertEqual(array.array("q", [3, 4, 5]), conf.sizes)
+        self.assertEqual(array.array("d", [0.1, 0.2, -0.3]), conf.thresholds)
+        
+        self.assertRaises(SystemExit, self._parser.parse_args, ["[1]", "--sizes", "1", "x"])
+        self.assertRaises(SystemExit, self._parser.parse_args, ["[1]", "--sizes"])
+    
+    def test_parse_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "configs.jsonl")
+            with open(path, "w") as f:
+                f.write('{"ids": [1], "sizes": [7, 8], "thresholds": "1 2"}\n')
+            conf, = self._parser.parse_file(path)
+        self.assertEqual(array.array("q", [7, 8]), conf.sizes)
+        self.assertEqual(array.array("d", [1.0, 2.0]), conf.thresholds)
+    
+    def test_sweep_and_parse_many(self):
+        # CHECK: arrays are never split into multiple values of a sweep
+        sweep = self._parser.sweep(["[1]", "--sizes", "3,4", "5", "--names", "[a,b]", "--thresholds", "0.5"])
+        self.assertEqual(
+                [(array.array("q", [3, 4, 5]), array.array("d", [0.5]), ["a", "b"])],
+                [(c.sizes, c.thresholds, c.names) for c in sweep]
+        )
+        
+        # CHECK: configurations with arrays may be parsed in bulk as well
+        results = list(self._parser.parse_many([["[1]", "--sizes", "3", "4"], ["[2]", "--sizes", "x"]]))
+        self.assertEqual(array.array("q", [3, 4]), results[0].sizes)
+        self.assertIsInstance(results[1], parse_error.ParseError)
+    
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy(self):
+        target = array_values.ArrayConverter(numpy.ndarray, numpy.float32)
+        value = target(["0.5", "1", "2.25"])
+        self.assertEqual(numpy.float32, value.dtype)
+        self.assertEqual([0.5, 1.0, 2.25], value.tolist())
+        self.assertEqual([1, 2], array_values.ArrayConverter(numpy.ndarray, int)([1, 2]).tolist())
+        self.assertRaises(ValueError, target, ["0.5", "x"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from argmagic import completion
+from argmagic import config_spec
+from argmagic import magic_parser
+from argmagic import spec_cache
+from argmagic_test import dummy_config_4
+from argmagic_test import dummy_config_7
+from argmagic_test import dummy_config_8
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class CompletionTest(unittest.TestCase):
+    
+    def test_complete(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = spec_cache.SpecCache(cache_dir)
+            
+            # CHECK: enums are completed with their members, and other values are not completed
+            for _ in range(2):  # the second time, the spec is loaded from the cache
+                candidates = completion.complete(dummy_config_4.DummyConfig4, "--mode", cache)
+                self.assertEqual(["UNO", "DOS", "TRES"], candidates)
+            self.assertEqual([], completion.complete(dummy_config_4.DummyConfig4, "--alpha", cache))
+            self.assertEqual([], completion.complete(dummy_config_4.DummyConfig4, "--unknown", cache))
+            
+            # CHECK: the module prints the candidates one per line, and resolves deferred types (notice that this is run
+            # in a separate process, since it imports the module that defines the deferred type)
+            env = dict(os.environ)
+            env["PYTHONPATH"] = os.pathsep.join(p for p in sys.path if p)
+            result = subprocess.run(
+                    [
+                            sys.executable, "-m", "argmagic.completion",
+                            "--cache-dir", cache_dir,
+                            "argmagic_test.dummy_config_7.DummyConfig7", "--", "--color"
+                    ],
+                    stdout=subprocess.PIPE,
+                    env=env,
+                    universal_newlines=True
+            )
+            self.assertEqual(0, result.returncode)
+            self.assertEqual("RED\nGREEN\n", result.stdout)
+    
+    def test_generate_script(self):
+        spec = config_spec.ConfigSpec.create_spec(dummy_config_4.DummyConfig4)
+        for shell in completion.SHELLS:
+            script = completion.generate_script(spec, "app", shell=shell, config_file_option="config")
+            
+            # CHECK: all options are covered, including the --no- forms of flags, but positional args are not
+            for option in ("alpha", "flag", "learning-rate", "no-verbose", "config"):
+                self.assertRegex(script, r"(--|-l ){}\b".format(option))
+            self.assertNotRegex(script, r"(--|-l )(count|verbose)\b")
+            
+            # CHECK: the members of enums are completed statically
+            self.assertIn("UNO DOS TRES", script)
+            self.assertNotIn("argmagic.completion", script)
+        
+        with self.assertRaises(ValueError):
+            completion.generate_script(spec, "app", shell="cmd")
+    
+    def test_generate_script_dynamic(self):
+        parser = magic_parser.MagicParser(dummy_config_7.DummyConfig7, app_name="app")
+        for shell in completion.SHELLS:
+            script = parser.completion_script(shell=shell)
+            
+            # CHECK: only values of deferred types are completed dynamically, and generating the script imports nothing
+            self.assertIn("argmagic.completion argmagic_test.dummy_config_7.DummyConfig7 -- --color", script)
+            self.assertNotIn("DummyConfig7 --size", script)
+            self.assertNotIn("RED", script)
+        
+        # CHECK: classes that are defined in the running script have to be specified by their import paths
+        conf_class = type("MainConfig", (dummy_config_7.DummyConfig7,), {"__module__": "__main__"})
+        parser = magic_parser.MagicParser(conf_class, app_name="app")
+        with self.assertRaises(ValueError):
+            parser.completion_script()
+        script = parser.completion_script(import_path="app.config.MainConfig")
+        self.assertIn("argmagic.completion app.config.MainConfig -- --color", script)
+        
+        # CHECK: this is not required if no values are completed dynamically
+        conf_class = type("MainConfig", (dummy_config_4.DummyConfig4,), {"__module__": "__main__"})
+        self.assertNotIn("argmagic.completion", magic_parser.MagicParser(conf_class).completion_script())
+    
+    def test_generate_script_nested(self):
+        parser = magic_parser.MagicParser(dummy_config_8.DummyConfig8, app_name="app")
+        for shell in completion.SHELLS:
+            script = parser.completion_script(shell=shell)
+            
+            # CHECK: the options of nested configurations are covered
+            for option in ("optimizer.learning-rate", "optimizer.nesterov", "optimizer.schedule.steps"):
+                self.assertIn(option, script)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import array
+import gc
+import io
+import json
+import unittest
+import weakref
+
+import yaml
+
+from argmagic import config_export
+from argmagic import magic_parser
+from argmagic_test import dummy_config
+from argmagic_test import dummy_config_5
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class ConfigExportTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.conf = magic_parser.MagicParser(dummy_config_5.DummyConfig5).parse_args(
+                ["[1, 2, 3]", "--weights", '{"a": 0.5, "b": 2}']
+        )
+    
+    def test_dump(self):
+        expected = {
+                "ids": [1, 2, 3],
+                "names": ["a"],
+                "raw": {"x": [1]},
+                "sizes": [1, 2],
+                "thresholds": [0.5, 0.25],
+                "weights": {"a": 0.5, "b": 2.0}
+        }
+        
+        # CHECK: values that are not supported by JSON or YAML, like arrays, are converted to builtin types
+        stream = io.StringIO()
+        config_export.dump_config(self.conf, stream)
+        self.assertEqual(expected, json.loads(stream.getvalue()))
+        stream = io.StringIO()
+        config_export.dump_config(self.conf, stream, fmt="yaml")
+        self.assertEqual(expected, yaml.safe_load(stream.getvalue()))
+        
+        self.assertRaises(ValueError, config_export.dump_config, self.conf, io.StringIO(), fmt="xml")
+    
+    def test_export(self):
+        # CHECK: only the declared options are exported, and their values are not converted
+        values = config_export.export_config(self.conf)
+        self.assertEqual(["ids", "names", "raw", "sizes", "thresholds", "weights"], list(values.keys()))
+        self.assertEqual([1, 2, 3], values["ids"])
+        self.assertIsInstance(values["sizes"], array.array)
+        self.assertEqual({"a": 0.5, "b": 2.0}, values["weights"])
+        
+        # CHECK: exporters are created only once per class, and check the type of the exported configuration
+        exporter = config_export.get_exporter(dummy_config_5.DummyConfig5)
+        self.assertIs(exporter, config_export.get_exporter(dummy_config_5.DummyConfig5))
+        self.assertEqual(list(values.keys()), exporter.names)
+        self.assertRaises(TypeError, exporter.export, dummy_config.DummyConfig())
+    
+    def test_exporter_cache(self):
+        
+        class Config(object):
+            
+            DEFAULT_SIZE = 3
+            
+            def __init__(self):
+                self._size = self.DEFAULT_SIZE
+            
+            @property
+            def size(self) -> int:
+                """int: A size."""
+                return self._size
+            
+            @size.setter
+            def size(self, size: int) -> None:
+                self._size = size
+        
+        # CHECK: cached exporters are replaced if the class changes
+        exporter = config_export.get_exporter(Config)
+        self.assertIs(exporter, config_export.get_exporter(Config))
+        Config.extra = property(lambda self: 1, lambda self, value: None, doc="int: An extra value.")
+        self.assertEqual(["extra", "size"], config_export.get_exporter(Config).names)
+        
+        # CHECK: exporters do not keep the classes that they have been created for alive
+        self.assertEqual({"size": 3, "extra": 1}, config_export.export_config(Config()))
+        class_ref = weakref.ref(Config)
+        del Config, exporter
+        gc.collect()
+        self.assertIsNone(class_ref())
+    
+    def test_truncate(self):
+        values = config_export.export_config(self.conf, max_items=1)
+        self.assertEqual([1, "... (2 more items)"], values["ids"])
+        self.assertEqual(["a"], values["names"])
+        self.assertEqual([1, "... (1 more items)"], values["sizes"])
+        self.assertEqual({"a": 0.5, "...": "1 more items"}, values["weights"])
+        
+        self.assertRaises(ValueError, config_export.export_config, self.conf, max_items=-1)
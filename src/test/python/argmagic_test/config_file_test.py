@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from argmagic import config_file
+from argmagic import magic_parser
+from argmagic import parse_error
+from argmagic_test import dummy_config_4
+from argmagic_test import dummy_config_8
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class ConfigFileTest(unittest.TestCase):
+    
+    def setUp(self):
+        config_file.cache_clear()
+        self._dir = tempfile.TemporaryDirectory()
+        self._parser = magic_parser.MagicParser(dummy_config_4.DummyConfig4, config_file_option="config")
+    
+    def tearDown(self):
+        self._dir.cleanup()
+    
+    def _write(self, file_name: str, content: str) -> str:
+        path = os.path.join(self._dir.name, file_name)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+    
+    def test_load(self):
+        path = self._write("config.yaml", "alpha: 3\nmode: UNO\n")
+        
+        # CHECK: files are parsed once, and reloaded only if they change
+        self.assertEqual({"alpha": 3, "mode": "UNO"}, config_file.load(path))
+        self.assertIs(config_file.load(path), config_file.load(path))
+        self.assertEqual((2, 1, 1), config_file.cache_info())
+        self._write("config.yaml", "alpha: 42\nmode: UNO\n")
+        self.assertEqual({"alpha": 42, "mode": "UNO"}, config_file.load(path))
+        self.assertEqual((2, 2, 1), config_file.cache_info())
+        
+        # CHECK: large YAML files are memory-mapped, which yields the same results
+        original_threshold = config_file.MMAP_THRESHOLD
+        config_file.MMAP_THRESHOLD = 0
+        try:
+            path = self._write("config.json", json.dumps({"beta": [1, 2]}))
+            self.assertEqual({"beta": [1, 2]}, config_file.load(path))
+            self.assertEqual({"beta": 0.5}, config_file.load(self._write("other.yml", "beta: 0.5")))
+        finally:
+            config_file.MMAP_THRESHOLD = original_threshold
+        
+        # CHECK: files that do not contain mappings are rejected
+        self.assertRaises(ValueError, config_file.load, self._write("list.yaml", "- 1\n- 2\n"))
+        self.assertRaises(ValueError, config_file.load, self._write("broken.json", "{"))
+    
+    def test_parse_args(self):
+        path = self._write("config.yaml", "alpha: 3\nlearning-rate: 1\nflag: true\nmode: TRES\nalphabet: '[a]'\n")
+        fast_parser = magic_parser.MagicParser(
+                dummy_config_4.DummyConfig4,
+                fast_parsing=True,
+                config_file_option="config"
+        )
+        
+        for parser in [self._parser, fast_parser]:
+            # CHECK: the values in the config file replace the defaults
+            conf = parser.parse_args(["--config", path, "1", "a"])
+            self.assertEqual(
+                    (1, "a", 3, 1.0, True, 3, "[a]", 1.5),
+                    (conf.count, conf.name, conf.alpha, conf.learning_rate, conf.flag, conf.mode, conf.alphabet,
+                     conf.beta)
+            )
+            
+            # CHECK: options that are given on the command line take precedence
+            conf = parser.parse_args(["1", "a", "--alpha", "5", "--config", path, "--mode", "UNO"])
+            self.assertEqual((5, 1, 1.0), (conf.alpha, conf.mode, conf.learning_rate))
+            
+            # CHECK: without config file, defaults are used as usual
+            self.assertEqual(dummy_config_4.DummyConfig4.DEFAULT_BETA, parser.parse_args(["1", "a"]).beta)
+        
+        # CHECK: files that cannot be loaded or specify unknown options cause errors
+        self.assertRaises(SystemExit, self._parser.parse_args, ["--config", path + ".missing", "1", "a"])
+        unknown = self._write("unknown.yaml", "gamma: 1\n")
+        self.assertRaises(SystemExit, self._parser.parse_args, ["--config", unknown, "1", "a"])
+    
+    def test_parse_args_nested(self):
+        parser = magic_parser.MagicParser(dummy_config_8.DummyConfig8, config_file_option="config")
+        dotted = self._write("dotted.json", json.dumps({"optimizer.learning_rate": 0.5}))
+        nested = self._write("nested.yaml", "optimizer:\n  learning-rate: 0.5\n  schedule:\n    steps: 3\n")
+        
+        # CHECK: nested options may be specified by their dotted names or as dicts
+        conf = parser.parse_args(["--config", dotted])
+        self.assertEqual((0.5, dummy_config_8.DummySchedule.DEFAULT_STEPS),
+                         (conf.optimizer.learning_rate, conf.optimizer.schedule.steps))
+        conf = parser.parse_args(["--config", nested])
+        self.assertEqual((0.5, 3), (conf.optimizer.learning_rate, conf.optimizer.schedule.steps))
+        
+        # CHECK: nested options that are given on the command line take precedence
+        conf = parser.parse_args(["--config", nested, "--optimizer.schedule.steps", "7"])
+        self.assertEqual((0.5, 7), (conf.optimizer.learning_rate, conf.optimizer.schedule.steps))
+    
+    def test_parse_args_positional(self):
+        path = self._write("config.yaml", "count: 3\nname: abc\nalpha: 7\n")
+        partial = self._write("partial.yaml", "count: 3\n")
+        
+        # CHECK: the config file may specify the values of positional args
+        conf = self._parser.parse_args(["--config", path])
+        self.assertEqual((3, "abc", 7), (conf.count, conf.name, conf.alpha))
+        conf = self._parser.parse_args(["--config=" + partial, "4", "xyz"])
+        self.assertEqual((4, "xyz"), (conf.count, conf.name))
+        
+        # CHECK: positional args that are neither given nor specified in the config file are still required
+        with self.assertRaises(parse_error.ParseError) as context:
+            self._parser._parse(["--config", partial], None)
+        self.assertEqual("the following arguments are required: name", context.exception.message)
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertRaises(SystemExit, self._parser.parse_args, ["--config", partial, "1", "a", "b"])
+    
+    def test_sweep(self):
+        path = self._write("config.json", json.dumps({"beta": 2.5, "alpha": 7}))
+        sweep = self._parser.sweep(["--config", path, "--alpha", "1,2", "3", "x"])
+        self.assertEqual([(1, 2.5), (2, 2.5)], [(c.alpha, c.beta) for c in sweep])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import pickle
+import unittest
+
+from argmagic import config_snapshot
+from argmagic_test import dummy_config_4
+from argmagic_test import dummy_config_5
+from argmagic_test import dummy_enum
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class ConfigSnapshotTest(unittest.TestCase):
+    
+    def test_encode(self):
+        conf = dummy_config_4.DummyConfig4()
+        
+        # CHECK: the fingerprint of a configuration is fixed, i.e., it does not depend on the process or Python version
+        self.assertEqual("9755cd5237493f7ac1d3334f90d598ad", config_snapshot.fingerprint(conf))
+        self.assertEqual(config_snapshot.fingerprint(conf), config_snapshot.fingerprint(dummy_config_4.DummyConfig4()))
+        
+        # CHECK: the types of values are encoded, and the order of dict items is irrelevant
+        encoding = config_snapshot.encode(conf)
+        conf.beta = 1
+        self.assertNotEqual(encoding, config_snapshot.encode(conf))
+        conf.beta = 1.5
+        conf.mode = dummy_enum.DummyEnum.DOS
+        self.assertNotEqual(encoding, config_snapshot.encode(conf))
+        
+        conf = dummy_config_5.DummyConfig5()
+        conf.weights = {"a": 1.0, "b": 2.0}
+        fingerprint = config_snapshot.fingerprint(conf)
+        conf.weights = {"b": 2.0, "a": 1.0}
+        self.assertEqual(fingerprint, config_snapshot.fingerprint(conf))
+        
+        # CHECK: values that cannot be encoded canonically are rejected
+        conf.raw = {"x": object()}
+        self.assertRaises(TypeError, config_snapshot.encode, conf)
+    
+    def test_snapshot(self):
+        conf = dummy_config_5.DummyConfig5()
+        conf.ids = [1, 2]
+        target = config_snapshot.ConfigSnapshot(conf)
+        
+        # CHECK: snapshots provide the values of all options, and are not affected by changes of the configuration
+        self.assertEqual((1, 2), target["ids"])
+        self.assertEqual((1, 2), target.ids)
+        conf.ids.append(3)
+        self.assertEqual((1, 2), target.ids)
+        self.assertEqual(config_snapshot.fingerprint(target.to_config()), target.fingerprint)
+        self.assertEqual([1, 2], target.to_config().ids)
+        
+        # CHECK: snapshots are deeply immutable and may be used as dict keys
+        with self.assertRaises(AttributeError):
+            target.ids = [1]
+        with self.assertRaises(TypeError):
+            target.weights["b"] = 2.0
+        self.assertEqual((1, 2), target.sizes)
+        conf.ids = [1, 2]
+        results = {target: "result"}
+        self.assertEqual("result", results[config_snapshot.ConfigSnapshot(conf)])
+        self.assertNotIn(config_snapshot.ConfigSnapshot(dummy_config_5.DummyConfig5()), results)
+        
+        # CHECK: snapshots survive pickling
+        restored = pickle.loads(pickle.dumps(target))
+        self.assertEqual(target, restored)
+        self.assertEqual(hash(target), hash(restored))
@@ -2,11 +2,14 @@
 # -*- coding: utf-8 -*-
 
 
+import gc
 import unittest
 
 from argmagic import config_spec
 from argmagic import config_value
+from argmagic import magic_parser
 from argmagic_test import dummy_config
+from argmagic_test import dummy_config_6
 from argmagic_test import dummy_enum
 
 
@@ -64,6 +67,98 @@ class ConfigSpecTest(unittest.TestCase):
         )
         
         self.assertEqual(target, config_spec.ConfigSpec.create_spec(dummy_config.DummyConfig))
+    
+    def test_create_spec_annotations(self):
+        spec = config_spec.ConfigSpec.create_spec(dummy_config_6.DummyConfig6, use_cache=False, mode="annotations")
+        
+        # CHECK: types are taken from annotations
+        self.assertEqual((list, (int,), True), (spec["ids"].data_type, spec["ids"].type_args, spec["ids"].required))
+        self.assertEqual((str, False), (spec["label"].data_type, spec["label"].required))
+        self.assertEqual(dummy_enum.DummyEnum, spec["mode"].data_type)
+        self.assertEqual(float, spec["rate"].data_type)
+        self.assertEqual((dict, (str, float)), (spec["weights"].data_type, spec["weights"].type_args))
+        self.assertTrue(spec["level"].exhaustive)
+        self.assertEqual(["debug", "info", "warning"], [m.value for m in spec["level"].data_type])
+        
+        # CHECK: descriptions are created lazily
+        self.assertIsInstance(spec["rate"].help_text, config_value.LazyDescription)
+        self.assertFalse(spec["rate"].help_text.created)
+        self.assertEqual(
+                "A float whose annotation takes precedence over the docstring. (Default value: 0.5.)",
+                spec["rate"].description
+        )
+        self.assertTrue(spec["rate"].help_text.created)
+        self.assertEqual("No description available. (Default value: {'a': 1.0}.)", spec["weights"].description)
+        
+        # CHECK: the spec can be used for parsing, and help texts are not created unless the help is printed
+        parser = magic_parser.MagicParser(dummy_config_6.DummyConfig6, extraction_mode="annotations")
+        conf = parser.parse_args(["[1, 2]", "--level", "debug", "--mode", "TRES", "--weights", "{b: 2}"])
+        self.assertEqual(([1, 2], None, "debug", 3, 0.5), (conf.ids, conf.label, conf.level, conf.mode, conf.rate))
+        self.assertEqual({"b": 2.0}, conf.weights)
+        self.assertFalse(parser.spec["ids"].help_text.created)
+        self.assertIn("A required list of ints.", parser._parser.format_help())
+        
+        self.assertRaises(ValueError, config_spec.ConfigSpec.create_spec, dummy_config_6.DummyConfig6, mode="types")
+    
+    def test_create_spec_cache(self):
+        config_spec.ConfigSpec.cache_clear()
+        
+        # create a fresh class, since the cache is modified subsequently
+        class Config(dummy_config.DummyConfig):
+            pass
+        
+        # CHECK: specs are built once and reused subsequently
+        spec = config_spec.ConfigSpec.create_spec(Config)
+        self.assertIs(spec, config_spec.ConfigSpec.create_spec(Config))
+        self.assertEqual(config_spec.CacheInfo(1, 1, 1), config_spec.ConfigSpec.cache_info())
+        
+        # CHECK: bypassing the cache creates a new, but equal spec
+        self.assertIsNot(spec, config_spec.ConfigSpec.create_spec(Config, use_cache=False))
+        self.assertEqual(spec, config_spec.ConfigSpec.create_spec(Config, use_cache=False))
+        self.assertEqual(config_spec.CacheInfo(1, 1, 1), config_spec.ConfigSpec.cache_info())
+        
+        # CHECK: reassigning a default value invalidates the cached spec
+        Config.DEFAULT_Z = 1.0
+        spec = config_spec.ConfigSpec.create_spec(Config)
+        self.assertEqual(1.0, spec["z"].default_value)
+        self.assertEqual(config_spec.CacheInfo(1, 2, 1), config_spec.ConfigSpec.cache_info())
+        
+        # CHECK: adding a property invalidates the cached spec
+        Config.w = property(lambda self: None, lambda self, w: None, doc="int: Prop w.")
+        spec = config_spec.ConfigSpec.create_spec(Config)
+        self.assertEqual(int, spec["w"].data_type)
+        self.assertIs(spec, config_spec.ConfigSpec.create_spec(Config))
+        self.assertEqual(config_spec.CacheInfo(2, 3, 1), config_spec.ConfigSpec.cache_info())
+        
+        # CHECK: classes are referenced weakly only
+        del Config
+        gc.collect()
+        self.assertEqual(0, config_spec.ConfigSpec.cache_info().currsize)
+    
+    def test_indexes(self):
+        target = config_spec.ConfigSpec()
+        target.add_config(config_value.ConfigValue("a", "Prop a.", str))
+        target.add_config(config_value.ConfigValue("b", "Prop b.", int, position=1))
+        target.add_config(config_value.ConfigValue("c", "Prop c.", bool, default_value=True))
+        target.add_config(config_value.ConfigValue("d_e", "Prop d_e.", int, default_value=1))
+        target.add_config(config_value.ConfigValue("f", "Prop f.", str, position=0))
+        target.add_config(config_value.ConfigValue("g", "Prop g.", float))
+        
+        # CHECK: required values are sorted by position, and values without position come last
+        self.assertEqual(["f", "b", "a", "g"], [conf.name for conf in target.required_values()])
+        self.assertEqual(["c", "d_e"], [conf.name for conf in target.optional_values()])
+        self.assertEqual(["c", "d_e", "f", "b", "a", "g"], target.option_order())
+        
+        # CHECK: values can be looked up by data type and option name
+        self.assertEqual([str, int, bool, float], target.data_types())
+        self.assertEqual(["b", "d_e"], [conf.name for conf in target.by_type(int)])
+        self.assertEqual([], target.by_type(dict))
+        self.assertIs(target["c"], target.lookup_option("--no-c"))
+        self.assertIs(target["d_e"], target.lookup_option("--d-e"))
+        self.assertIsNone(target.lookup_option("--c"))
+        
+        self.assertEqual(6, len(target))
+        self.assertIn("d_e", target)
 
 
 if __name__ == "__main__":
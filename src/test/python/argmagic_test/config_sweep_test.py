@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import unittest
+
+from argmagic import config_sweep
+from argmagic import magic_parser
+from argmagic import parse_error
+from argmagic_test import dummy_config_4
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class ConfigSweepTest(unittest.TestCase):
+    
+    def setUp(self):
+        self._parser = magic_parser.MagicParser(dummy_config_4.DummyConfig4)
+    
+    def test_split(self):
+        self.assertEqual(["abc"], config_sweep.ConfigSweep.split("abc"))
+        self.assertEqual(["1e-3", "1e-4"], config_sweep.ConfigSweep.split("1e-3,1e-4"))
+        self.assertEqual(["2", "4", "8"], config_sweep.ConfigSweep.split("[2, 4, 8]"))
+        self.assertEqual(["2"], config_sweep.ConfigSweep.split("[2]"))
+    
+    def test_sweep(self):
+        target = self._parser.sweep("--alpha 1,2,3 --flag --mode [UNO,TRES] 7 a,b,a".split(" "))
+        
+        # CHECK: the sweep is the cartesian product of all specified values
+        self.assertEqual(12, len(target))
+        self.assertEqual({"alpha": (1, 2, 3), "mode": (1, 3), "name": ("a", "b")}, dict(target.axes))
+        expected = [
+                (alpha, mode, name)
+                for alpha in [1, 2, 3]
+                for mode in [1, 3]
+                for name in ["a", "b"]
+        ]
+        actual = [(c.alpha, c.mode, c.name) for c in target]
+        self.assertEqual(expected, actual)
+        
+        # CHECK: options that are not swept are populated as usual
+        for conf in target:
+            self.assertEqual(7, conf.count)
+            self.assertTrue(conf.flag)
+            self.assertEqual(1.5, conf.beta)
+        
+        # CHECK: configurations can be accessed by index
+        for i, values in enumerate(expected):
+            self.assertEqual(values, (target[i].alpha, target[i].mode, target[i].name))
+        self.assertEqual(expected[-1], (target[-1].alpha, target[-1].mode, target[-1].name))
+        self.assertEqual(expected[2:5], [(c.alpha, c.mode, c.name) for c in target[2:5]])
+        self.assertRaises(IndexError, target.__getitem__, 12)
+        self.assertRaises(IndexError, target.__getitem__, -13)
+        
+        # CHECK: shards are disjoint, and cover the whole sweep
+        shards = [[(c.alpha, c.mode, c.name) for c in target.shard(i, 5)] for i in range(5)]
+        self.assertEqual(sorted(expected), sorted(sum(shards, [])))
+        self.assertEqual(expected[1::5], shards[1])
+        self.assertRaises(ValueError, list, target.shard(5, 5))
+    
+    def test_sweep_without_multiple_values(self):
+        target = self._parser.sweep("7 abc".split(" "))
+        self.assertEqual(1, len(target))
+        self.assertEqual(self._parser.parse_args("7 abc".split(" ")), target[0])
+    
+    def test_errors(self):
+        self.assertRaises(parse_error.ParseError, self._parser.sweep, "--alpha 1,x 7 abc".split(" "))
+        self.assertRaises(parse_error.ParseError, self._parser.sweep, "--alpha 1,2".split(" "))
+        self.assertRaises(parse_error.ParseError, self._parser.sweep, "--unknown 1,2 7 abc".split(" "))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import pickle
+import unittest
+
+from argmagic import config_value
+from argmagic_test import dummy_enum
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class ConfigValueTest(unittest.TestCase):
+    
+    def test_eq_and_hash(self):
+        target = config_value.ConfigValue("x", "Prop x.", dict, default_value={"a": [1, 2]})
+        
+        # CHECK: equal values have equal hashes, even if their default values are mutable
+        self.assertEqual(target, config_value.ConfigValue("x", "Prop x.", dict, default_value={"a": [1, 2]}))
+        self.assertEqual(
+                hash(target),
+                hash(config_value.ConfigValue("x", "Prop x.", dict, default_value={"a": [1, 2]}))
+        )
+        self.assertNotEqual(target, config_value.ConfigValue("x", "Prop x.", dict, default_value={"a": [1]}))
+        self.assertNotEqual(target, config_value.ConfigValue("x", "Prop x.", dict, position=1))
+        self.assertEqual(1, len({target, config_value.ConfigValue("x", "Prop x.", dict, default_value={"a": [1, 2]})}))
+        
+        # CHECK: lazy descriptions are not created for comparisons, if they have the same inputs
+        first, second = [
+                config_value.ConfigValue("x", config_value.LazyDescription(lambda: "Prop x.", key=("x",)), int)
+                for _ in range(2)
+        ]
+        self.assertEqual(first, second)
+        self.assertFalse(first.help_text.created or second.help_text.created)
+        self.assertEqual(first, config_value.ConfigValue("x", config_value.LazyDescription(lambda: "Prop x."), int))
+        self.assertEqual(first, config_value.ConfigValue("x", "Prop x.", int))
+        self.assertNotEqual(first, config_value.ConfigValue("x", "Prop y.", int))
+    
+    def test_immutable(self):
+        target = config_value.ConfigValue("x", "Prop x.", dummy_enum.DummyEnum, default_value=1)
+        self.assertTrue(target.exhaustive)
+        self.assertFalse(target.required)
+        
+        # CHECK: config values cannot be modified, and do not have a __dict__
+        with self.assertRaises(AttributeError):
+            target.name = "y"
+        with self.assertRaises(AttributeError):
+            target.foo = 1
+        with self.assertRaises(AttributeError):
+            del target.name
+        self.assertFalse(hasattr(target, "__dict__"))
+        
+        # CHECK: args are validated when a config value is created
+        self.assertRaises(TypeError, config_value.ConfigValue, "x", "Prop x.", int, position="1")
+        self.assertRaises(ValueError, config_value.ConfigValue, "x", "Prop x.", int, position=-1)
+        self.assertRaises(ValueError, config_value.ConfigValue, "x", "Prop x.", bool)
+    
+    def test_pickle(self):
+        target = config_value.ConfigValue("x", "Prop x.", int, position=2, required=True)
+        restored = pickle.loads(pickle.dumps(target))
+        self.assertEqual(target, restored)
+        self.assertEqual(hash(target), hash(restored))
+        self.assertEqual(2, restored.position)
+
+
+if __name__ == "__main__":
+    unittest.main()
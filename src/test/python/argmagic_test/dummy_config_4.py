@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+
+
+import typing
+
+from argmagic import decorators
+from argmagic_test import dummy_enum
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class DummyConfig4(object):
+    """A configuration class that makes use of all kinds of values that are supported by default."""
+    
+    DEFAULT_ALPHA = "5"
+    DEFAULT_ALPHABET = "abc"
+    DEFAULT_BETA = 1.5
+    DEFAULT_FLAG = False
+    DEFAULT_LEARNING_RATE = 0.1
+    DEFAULT_MODE = dummy_enum.DummyEnum.DOS.value
+    DEFAULT_VERBOSE = True
+    
+    def __init__(self):
+        self._alpha = int(self.DEFAULT_ALPHA)
+        self._alphabet = self.DEFAULT_ALPHABET
+        self._beta = self.DEFAULT_BETA
+        self._count = None
+        self._extra = None
+        self._flag = self.DEFAULT_FLAG
+        self._learning_rate = self.DEFAULT_LEARNING_RATE
+        self._mode = self.DEFAULT_MODE
+        self._name = None
+        self._verbose = self.DEFAULT_VERBOSE
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __eq__(self, other):
+        return isinstance(other, DummyConfig4) and vars(self) == vars(other)
+    
+    def __str__(self):
+        return str(vars(self))
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def alpha(self) -> int:
+        """int: An int whose default value is specified as str."""
+        return self._alpha
+    
+    @alpha.setter
+    def alpha(self, alpha: int) -> None:
+        self._alpha = alpha
+    
+    @property
+    def alphabet(self) -> str:
+        """str: A str whose name starts with the name of another option."""
+        return self._alphabet
+    
+    @alphabet.setter
+    def alphabet(self, alphabet: str) -> None:
+        self._alphabet = alphabet
+    
+    @property
+    def beta(self) -> float:
+        """float: A float."""
+        return self._beta
+    
+    @beta.setter
+    def beta(self, beta: float) -> None:
+        self._beta = beta
+    
+    @decorators.position(0)
+    @property
+    def count(self) -> int:
+        """int: A required int."""
+        return self._count
+    
+    @count.setter
+    def count(self, count: int) -> None:
+        self._count = count
+    
+    @decorators.optional
+    @property
+    def extra(self) -> typing.Optional[int]:
+        """int: An optional int without default value."""
+        return self._extra
+    
+    @extra.setter
+    def extra(self, extra: int) -> None:
+        self._extra = extra
+    
+    @property
+    def flag(self) -> bool:
+        """bool: A flag that is False by default."""
+        return self._flag
+    
+    @flag.setter
+    def flag(self, flag: bool) -> None:
+        self._flag = flag
+    
+    @property
+    def learning_rate(self) -> float:
+        """float: A float whose name contains an underscore."""
+        return self._learning_rate
+    
+    @learning_rate.setter
+    def learning_rate(self, learning_rate: float) -> None:
+        self._learning_rate = learning_rate
+    
+    @decorators.exhaustive(dummy_enum.DummyEnum)
+    @property
+    def mode(self) -> int:
+        """An enum."""
+        return self._mode
+    
+    @mode.setter
+    def mode(self, mode: int) -> None:
+        self._mode = mode
+    
+    @decorators.position(1)
+    @property
+    def name(self) -> str:
+        """str: A required str."""
+        return self._name
+    
+    @name.setter
+    def name(self, name: str) -> None:
+        self._name = name
+    
+    @property
+    def verbose(self) -> bool:
+        """bool: A flag that is True by default."""
+        return self._verbose
+    
+    @verbose.setter
+    def verbose(self, verbose: bool) -> None:
+        self._verbose = verbose
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+
+import array
+import typing
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class DummyConfig5(object):
+    """A configuration class with structured values whose elements have specific types."""
+    
+    DEFAULT_NAMES = ["a"]
+    DEFAULT_RAW = {"x": [1]}
+    DEFAULT_SIZES = [1, 2]
+    DEFAULT_THRESHOLDS = "0.5, 0.25"
+    DEFAULT_WEIGHTS = {"a": 1.0}
+    
+    def __init__(self):
+        self._ids = None
+        self._names = self.DEFAULT_NAMES
+        self._raw = self.DEFAULT_RAW
+        self._sizes = array.array("q", self.DEFAULT_SIZES)
+        self._thresholds = array.array("d", [0.5, 0.25])
+        self._weights = self.DEFAULT_WEIGHTS
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def ids(self) -> list:
+        """list[int]: A required list of ints."""
+        return self._ids
+    
+    @ids.setter
+    def ids(self, ids: list) -> None:
+        self._ids = ids
+    
+    @property
+    def names(self) -> typing.List[str]:
+        """list: A list of strs whose element type is specified by means of an annotation."""
+        return self._names
+    
+    @names.setter
+    def names(self, names: list) -> None:
+        self._names = names
+    
+    @property
+    def raw(self) -> dict:
+        """dict: A dict whose elements are not checked."""
+        return self._raw
+    
+    @raw.setter
+    def raw(self, raw: dict) -> None:
+        self._raw = raw
+    
+    @property
+    def sizes(self) -> array.array:
+        """array.array[int]: An array of ints."""
+        return self._sizes
+    
+    @sizes.setter
+    def sizes(self, sizes: array.array) -> None:
+        self._sizes = sizes
+    
+    @property
+    def thresholds(self) -> array.array:
+        """array.array[float]: An array of floats whose default value is specified as str."""
+        return self._thresholds
+    
+    @thresholds.setter
+    def thresholds(self, thresholds: array.array) -> None:
+        self._thresholds = thresholds
+    
+    @property
+    def weights(self) -> dict:
+        """dict[str, float]: A dict that maps strs to floats."""
+        return self._weights
+    
+    @weights.setter
+    def weights(self, weights: dict) -> None:
+        self._weights = weights
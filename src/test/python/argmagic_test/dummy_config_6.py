@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+
+import typing
+
+from argmagic import decorators
+from argmagic_test import dummy_enum
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class DummyConfig6(object):
+    """A configuration class whose types are specified by means of annotations only."""
+    
+    DEFAULT_LEVEL = "info"
+    DEFAULT_MODE = dummy_enum.DummyEnum.UNO.value
+    DEFAULT_RATE = 0.5
+    DEFAULT_WEIGHTS = {"a": 1.0}
+    
+    def __init__(self):
+        self._ids = None
+        self._label = None
+        self._level = self.DEFAULT_LEVEL
+        self._mode = self.DEFAULT_MODE
+        self._rate = self.DEFAULT_RATE
+        self._weights = self.DEFAULT_WEIGHTS
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @decorators.position(0)
+    @property
+    def ids(self) -> typing.List[int]:
+        """A required list of ints."""
+        return self._ids
+    
+    @ids.setter
+    def ids(self, ids: typing.List[int]) -> None:
+        self._ids = ids
+    
+    @property
+    def label(self) -> typing.Optional[str]:
+        """An optional str without default value."""
+        return self._label
+    
+    @label.setter
+    def label(self, label: typing.Optional[str]) -> None:
+        self._label = label
+    
+    @property
+    def level(self) -> "typing.Literal['debug', 'info', 'warning']":
+        """A log level, which is specified by means of a forward reference."""
+        return self._level
+    
+    @level.setter
+    def level(self, level: str) -> None:
+        self._level = level
+    
+    @property
+    def mode(self) -> dummy_enum.DummyEnum:
+        """An enum."""
+        return self._mode
+    
+    @mode.setter
+    def mode(self, mode: int) -> None:
+        self._mode = mode
+    
+    @property
+    def rate(self) -> float:
+        """str: A float whose annotation takes precedence over the docstring."""
+        return self._rate
+    
+    @rate.setter
+    def rate(self, rate: float) -> None:
+        self._rate = rate
+    
+    @property
+    def weights(self) -> typing.Dict[str, float]:
+        return self._weights
+    
+    @weights.setter
+    def weights(self, weights: typing.Dict[str, float]) -> None:
+        self._weights = weights
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+
+from argmagic import decorators
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class DummyConfig7(object):
+    """A configuration class whose values have types that are specified by name only."""
+    
+    DEFAULT_LABEL = "none"
+    DEFAULT_SIZE = 3
+    
+    def __init__(self):
+        self._color = None
+        self._label = self.DEFAULT_LABEL
+        self._size = self.DEFAULT_SIZE
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @decorators.optional
+    @property
+    def color(self):
+        """argmagic_test.dummy_enum_2.DummyColor: A color that is defined in a module that is not imported."""
+        return self._color
+    
+    @color.setter
+    def color(self, color) -> None:
+        self._color = color
+    
+    @property
+    def label(self) -> str:
+        """argmagic_test.missing_module.Label: A value whose type does not exist."""
+        return self._label
+    
+    @label.setter
+    def label(self, label: str) -> None:
+        self._label = label
+    
+    @property
+    def size(self) -> int:
+        """int: A value of a builtin type."""
+        return self._size
+    
+    @size.setter
+    def size(self, size: int) -> None:
+        self._size = size
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+
+from argmagic import decorators
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class DummySchedule(object):
+    """A configuration class that is nested in :class:`DummyOptimizer`."""
+    
+    DEFAULT_STEPS = 10
+    
+    def __init__(self):
+        self._steps = self.DEFAULT_STEPS
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def steps(self) -> int:
+        """int: The number of steps."""
+        return self._steps
+    
+    @steps.setter
+    def steps(self, steps: int) -> None:
+        self._steps = steps
+
+
+class DummyOptimizer(object):
+    """A configuration class that is nested in :class:`DummyConfig8`, and contains a nested configuration itself."""
+    
+    DEFAULT_LEARNING_RATE = 0.1
+    DEFAULT_NESTEROV = False
+    
+    def __init__(self):
+        self._learning_rate = self.DEFAULT_LEARNING_RATE
+        self._nesterov = self.DEFAULT_NESTEROV
+        self._schedule = None
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def learning_rate(self) -> float:
+        """float: The learning rate."""
+        return self._learning_rate
+    
+    @learning_rate.setter
+    def learning_rate(self, learning_rate: float) -> None:
+        self._learning_rate = learning_rate
+    
+    @property
+    def nesterov(self) -> bool:
+        """bool: Whether to use Nesterov momentum."""
+        return self._nesterov
+    
+    @nesterov.setter
+    def nesterov(self, nesterov: bool) -> None:
+        self._nesterov = nesterov
+    
+    @decorators.nested(DummySchedule)
+    @property
+    def schedule(self) -> DummySchedule:
+        """argmagic_test.dummy_config_8.DummySchedule: The learning-rate schedule."""
+        return self._schedule
+    
+    @schedule.setter
+    def schedule(self, schedule: DummySchedule) -> None:
+        self._schedule = schedule
+
+
+class DummyConfig8(object):
+    """A configuration class that contains a nested configuration."""
+    
+    DEFAULT_NAME = "run"
+    
+    def __init__(self):
+        self._name = self.DEFAULT_NAME
+        self._optimizer = None
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def name(self) -> str:
+        """str: The name of the run."""
+        return self._name
+    
+    @name.setter
+    def name(self, name: str) -> None:
+        self._name = name
+    
+    @decorators.nested(DummyOptimizer)
+    @property
+    def optimizer(self) -> DummyOptimizer:
+        """argmagic_test.dummy_config_8.DummyOptimizer: The optimizer."""
+        return self._optimizer
+    
+    @optimizer.setter
+    def optimizer(self, optimizer: DummyOptimizer) -> None:
+        self._optimizer = optimizer
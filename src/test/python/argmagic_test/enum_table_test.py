@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import enum
+import unittest
+
+from argmagic import magic_parser
+from argmagic.parsing import default_parser_factory
+from argmagic.parsing import enum_table
+from argmagic_test import dummy_config_4
+from argmagic_test import dummy_enum
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class EnumTableTest(unittest.TestCase):
+    
+    def test_for_enum(self):
+        # CHECK: tables are shared
+        self.assertIs(enum_table.EnumTable.for_enum(dummy_enum.DummyEnum),
+                      enum_table.EnumTable.for_enum(dummy_enum.DummyEnum))
+    
+    def test_lookup(self):
+        Color = enum.Enum("Color", ["RED", "Red", "GREEN", "GREY", "BLUE"])
+        target = enum_table.EnumTable.for_enum(Color)
+        
+        # CHECK: exact matches are always accepted
+        self.assertEqual(Color.RED.value, target.lookup("RED"))
+        self.assertEqual(Color.Red.value, target.lookup("Red", ignore_case=True, allow_prefix=True))
+        self.assertRaises(ValueError, target.lookup, "BLU")
+        self.assertRaises(ValueError, target.lookup, "blue")
+        
+        # CHECK: case-insensitive and prefix matches are accepted if they are unique
+        self.assertEqual(Color.BLUE.value, target.lookup("blue", ignore_case=True))
+        self.assertRaises(ValueError, target.lookup, "red", ignore_case=True)
+        self.assertEqual(Color.BLUE.value, target.lookup("BL", allow_prefix=True))
+        self.assertEqual(Color.GREEN.value, target.lookup("GREE", allow_prefix=True))
+        self.assertRaises(ValueError, target.lookup, "GR", allow_prefix=True)
+        self.assertRaises(ValueError, target.lookup, "gre", allow_prefix=True)
+        self.assertEqual(Color.GREEN.value, target.lookup("gree", ignore_case=True, allow_prefix=True))
+        self.assertRaises(ValueError, target.lookup, "r", ignore_case=True, allow_prefix=True)
+    
+    def test_possible_values(self):
+        Large = enum.Enum("Large", ["M{}".format(i) for i in range(1000)])
+        target = enum_table.EnumTable.for_enum(Large)
+        
+        # CHECK: error messages list a limited number of possible values only
+        with self.assertRaises(enum_table.UnknownMemberError) as context:
+            target.lookup("X")
+        message = str(context.exception)
+        self.assertTrue(message.startswith("illegal value 'X', possible values are {M0, M1, "))
+        self.assertTrue(message.endswith(", ... (980 more)}"))
+    
+    def test_parser_factory(self):
+        factory = default_parser_factory.DefaultParserFactory(True, enum_ignore_case=True, enum_prefix_matching=True)
+        parser = magic_parser.MagicParser(dummy_config_4.DummyConfig4, custom_parsers={dummy_enum.DummyEnum: factory})
+        self.assertEqual(dummy_enum.DummyEnum.TRES.value, parser.parse_args(["1", "a", "--mode", "tr"]).mode)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import argparse
+import array
+import contextlib
+import io
+import sys
+import typing
+import unittest
+
+from argmagic import magic_parser
+from argmagic import parse_error
+from argmagic.parsing import array_values
+from argmagic.parsing import fast_parser
+from argmagic_test import dummy_config_4
+from argmagic_test import dummy_config_5
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class FastParserTest(unittest.TestCase):
+    
+    ARGS = [
+            "",
+            "7 abc",
+            "7",
+            "7 abc def",
+            "abc 7",
+            "--alpha 3 7 abc",
+            "7 --alpha 3 abc",
+            "7 abc --alpha 3",
+            "--alpha=3 7 abc",
+            "--alpha= 7 abc",
+            "--alpha 7 abc",
+            "--alpha -3 7 abc",
+            "--alpha x 7 abc",
+            "--alph 3 7 abc",
+            "--alpha 3 --alphab xyz 7 abc",
+            "--alphab=xyz 7 abc",
+            "--al 3 7 abc",
+            "--alphabet xyz --alphabet uvw 7 abc",
+            "--beta 2.5 --learning-rate 1e-3 7 abc",
+            "--learn 0.5 7 abc",
+            "--learning_rate 0.5 7 abc",
+            "--flag --no-verbose 7 abc",
+            "--flag=1 7 abc",
+            "--fl --no 7 abc",
+            "--mode TRES 7 abc",
+            "--mode tres 7 abc",
+            "--mode=UNO 7 abc",
+            "--extra 4 7 abc",
+            "--extra 7 abc",
+            "-- 7 abc",
+            "-x 7 abc",
+            "-5 abc",
+            "7 -",
+            "--unknown 1 7 abc",
+            "-h",
+            "--help",
+            "--he",
+            "7 abc --h",
+            "--count 7 --name abc",
+            "--count=7 --name=abc --alpha 1",
+            "--name abc",
+            "--na abc --co 7",
+            "--count 7 --name abc --flag --no-verbose --mode TRES --alphab xyz --learn 0.5",
+            "--count 7 --name abc --count 8",
+    ]
+    """list[str]: The args that the parsers are tested with."""
+    
+    ARRAY_ARGS = [
+            "[1]",
+            "[1] --sizes 3 4 5",
+            "--sizes 3 4 5 [1]",
+            "--sizes 3,4 5 --thresholds 0.1 [1]",
+            "--sizes=3,4 [1]",
+            "--sizes= [1]",
+            "--sizes [1]",
+            "[1] --sizes",
+            "[1] --sizes 3 x",
+            "[1] --thresholds 0.1 -0.2",
+            "[1] --thresholds -0.2",
+            "[1] --sizes 1 -- 2",
+            "[1] --siz 1 2 --names [b]",
+    ]
+    """list[str]: The args that the parsers are tested with for configurations that contain arrays."""
+    
+    @staticmethod
+    def _parse_with_argparse(parser: argparse.ArgumentParser, args: typing.List[str]) -> typing.Optional[dict]:
+        """Parses the provided args with the given arg parser, and returns ``None``, if this fails."""
+        try:
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                return vars(parser.parse_args(args))
+        except (SystemExit, parse_error.ParseError):
+            return None
+    
+    def test_parse(self):
+        for positional_args in [True, False]:
+            parser = magic_parser.MagicParser(dummy_config_4.DummyConfig4, positional_args=positional_args)
+            target = fast_parser.FastParser(parser._parser)
+            self.assertTrue(target.supported)
+            
+            for args in self.ARGS:
+                args = args.split(" ") if args else []
+                expected = self._parse_with_argparse(parser._parser, args)
+                actual = target.parse(args)
+                
+                # CHECK: the fast parser either gives up or yields exactly the same values as argparse
+                if actual is not None:
+                    self.assertEqual(expected, actual, msg="args: {}".format(args))
+        
+        # CHECK: the common cases are handled by the fast parser
+        target = fast_parser.FastParser(magic_parser.MagicParser(dummy_config_4.DummyConfig4)._parser)
+        self.assertEqual("xyz", target.parse("--alphab=xyz 7 abc".split(" "))["alphabet"])
+        self.assertEqual(5, target.parse("7 abc".split(" "))["alpha"])
+        self.assertEqual(3, target.parse("--mode TRES 7 abc".split(" "))["mode"])
+        self.assertEqual(False, target.parse("--no-verb 7 abc".split(" "))["verbose"])
+    
+    def test_parse_arrays(self):
+        parser = magic_parser.MagicParser(dummy_config_5.DummyConfig5)
+        target = fast_parser.FastParser(parser._parser)
+        self.assertTrue(target.supported)
+        
+        for args in self.ARRAY_ARGS:
+            args = args.split(" ")
+            expected = self._parse_with_argparse(parser._parser, args)
+            actual = target.parse(args)
+            
+            # CHECK: the fast parser either gives up or yields exactly the same values as argparse
+            if actual is not None:
+                self.assertEqual(expected, actual, msg="args: {}".format(args))
+        
+        # CHECK: arrays are handled by the fast parser, and their raw values are the args that specify them
+        self.assertEqual(array.array("q", [3, 4, 5]), target.parse("[1] --sizes 3,4 5".split(" "))["sizes"])
+        self.assertEqual({"ids": "[1]", "sizes": ("3,4", "5")}, target.parse("[1] --sizes 3,4 5".split(" "), False))
+
+    
+    def test_unsupported(self):
+        # CHECK: parsers with unsupported actions are never handled by the fast parser
+        parser = argparse.ArgumentParser()
+        parser.add_argument("--values", nargs="+")
+        target = fast_parser.FastParser(parser)
+        self.assertFalse(target.supported)
+        self.assertIsNone(target.parse([]))
+        
+        # CHECK: positional arrays are not supported either
+        parser = argparse.ArgumentParser()
+        parser.add_argument(
+                "sizes",
+                action=array_values.ArrayAction,
+                converter=array_values.ArrayConverter(array.array, int)
+        )
+        self.assertFalse(fast_parser.FastParser(parser).supported)
+    
+    def test_magic_parser(self):
+        # create target config object
+        target = dummy_config_4.DummyConfig4()
+        target.alpha = 3
+        target.count = 7
+        target.flag = True
+        target.mode = 3
+        target.name = "abc"
+        
+        # CHECK: the fast parser is used by the magic parser, if requested
+        parser = magic_parser.MagicParser(dummy_config_4.DummyConfig4, fast_parsing=True)
+        sys.argv = "test --alpha 3 --flag 7 abc --mode TRES".split(" ")
+        self.assertEqual(target, parser.parse_args())
+        
+        # CHECK: if the fast parser gives up, then argparse takes over
+        sys.argv = "test --alpha 3 --flag 7 abc --mode TRES --extra -1".split(" ")
+        target.extra = -1
+        self.assertEqual(target, parser.parse_args())
+        sys.argv = "test --alpha 3 --flag 7".split(" ")
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertRaises(SystemExit, parser.parse_args)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import array
+import json
+import os
+import pickle
+import tempfile
+import unittest
+
+from argmagic import magic_parser
+from argmagic.parsing import file_values
+from argmagic_test import dummy_config_5
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class FileValuesTest(unittest.TestCase):
+    
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._parser = magic_parser.MagicParser(dummy_config_5.DummyConfig5)
+    
+    def tearDown(self):
+        self._dir.cleanup()
+    
+    def _write(self, file_name: str, content) -> str:
+        path = os.path.join(self._dir.name, file_name)
+        with open(path, "wb" if isinstance(content, bytes) else "w") as f:
+            f.write(content)
+        return path
+    
+    def test_arrays(self):
+        text_path = self._write("sizes.txt", "1, 2\n3\n")
+        raw_path = self._write("thresholds.bin", array.array("d", [0.5, 1.5, -2.0]).tobytes())
+        conf = self._parser.parse_args(["[1]", "--sizes", "@" + text_path, "--thresholds", "@" + raw_path])
+        self.assertEqual(array.array("q", [1, 2, 3]), conf.sizes)
+        self.assertEqual(array.array("d", [0.5, 1.5, -2.0]), conf.thresholds)
+        
+        # CHECK: files that do not exist or contain invalid values are rejected
+        self.assertRaises(SystemExit, self._parser.parse_args, ["[1]", "--sizes", "@" + text_path + ".missing"])
+        self.assertRaises(SystemExit, self._parser.parse_args, ["[1]", "--sizes", "@" + self._write("x.txt", "a b")])
+    
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy_arrays(self):
+        path = os.path.join(self._dir.name, "values.npy")
+        numpy.save(path, numpy.arange(5, dtype=numpy.float32))
+        
+        # CHECK: arrays of matching dtype are views of the memory-mapped file
+        value = file_values.load_array(path, numpy.ndarray, numpy.float32)
+        self.assertIsInstance(value, numpy.memmap)
+        self.assertEqual([0, 1, 2, 3, 4], value.tolist())
+        self.assertEqual([0.0, 1.0, 2.0, 3.0, 4.0], file_values.load_array(path, numpy.ndarray, float).tolist())
+        self.assertEqual(array.array("d", range(5)), file_values.load_array(path, array.array, float))
+    
+    def test_structured_values(self):
+        weights_path = self._write("weights.json", json.dumps({"a": 1, "b": 0.5}))
+        ids_path = self._write("ids.yaml", "- 1\n- 2\n")
+        conf = self._parser.parse_args(["@" + ids_path, "--weights", "@" + weights_path])
+        
+        # CHECK: files are loaded on first access only
+        self.assertIsInstance(conf.weights, file_values.LazyMapping)
+        self.assertFalse(conf.weights.loaded)
+        self.assertEqual(1.0, conf.weights["a"])
+        self.assertTrue(conf.weights.loaded)
+        self.assertEqual({"a": 1.0, "b": 0.5}, dict(conf.weights))
+        self.assertEqual([1, 2], conf.ids)
+        self.assertEqual([1, 2], list(pickle.loads(pickle.dumps(conf.ids))))
+        
+        # CHECK: the types of values are checked when they are loaded
+        conf = self._parser.parse_args(["@" + self._write("bad.json", '["x"]')])
+        self.assertRaises(ValueError, len, conf.ids)
+        self.assertRaises(SystemExit, self._parser.parse_args, ["@" + ids_path + ".missing"])
+        
+        # CHECK: relative paths are resolved when values are parsed rather than when they are loaded
+        cwd = os.getcwd()
+        os.chdir(self._dir.name)
+        try:
+            conf = self._parser.parse_args(["@ids.yaml"])
+        finally:
+            os.chdir(cwd)
+        self.assertTrue(os.path.isabs(conf.ids.path))
+        self.assertTrue(os.path.samefile(ids_path, conf.ids.path))
+        self.assertEqual([1, 2], list(conf.ids))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import os
+import subprocess
+import sys
+import typing
+import unittest
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class ImportTimeTest(unittest.TestCase):
+    
+    IMPORT_TIME_BUDGET = int(os.environ.get("ARGMAGIC_IMPORT_TIME_BUDGET", 50000))
+    """int: The maximum number of microseconds that ``import argmagic`` may take, as reported by ``-X importtime``."""
+    
+    LAZY_MODULES = ["argmagic.magic_parser", "argparse", "inspect", "insanity", "pydoc", "yaml"]
+    """list[str]: Modules that must not be loaded by ``import argmagic``."""
+    
+    @staticmethod
+    def _run(code: str) -> subprocess.CompletedProcess:
+        """Runs the provided code in a new interpreter that has ``-X importtime`` enabled."""
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(p for p in sys.path if p)
+        return subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", code],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                env=env,
+                universal_newlines=True,
+                check=True
+        )
+    
+    @staticmethod
+    def _import_times(stderr: str) -> typing.Dict[str, int]:
+        """Extracts the cumulative import times from the output produced by ``-X importtime``."""
+        times = {}
+        for line in stderr.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            _, cumulative, name = line[len("import time:"):].split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+        
+        return times
+    
+    def test_import_argmagic(self):
+        times = self._import_times(self._run("import argmagic").stderr)
+        
+        # CHECK: expensive modules are not loaded eagerly
+        for module in self.LAZY_MODULES:
+            self.assertNotIn(module, times)
+        
+        # CHECK: the import stays within budget
+        self.assertIn("argmagic", times)
+        self.assertLessEqual(times["argmagic"], self.IMPORT_TIME_BUDGET)
+    
+    def test_decorators_and_get_config(self):
+        code = (
+                "import sys\n"
+                "import argmagic\n"
+                "from argmagic_test import dummy_config\n"
+                "argmagic.get_config(dummy_config.DummyConfig())\n"
+                "print(' '.join(sorted(sys.modules)))\n"
+        )
+        modules = self._run(code).stdout.split()
+        
+        # CHECK: applying decorators and summarizing configs does not load the parser
+        for module in ["argmagic.magic_parser", "argparse", "insanity", "yaml"]:
+            self.assertNotIn(module, modules)
+    
+    def test_yaml_is_loaded_on_demand(self):
+        code = (
+                "import sys\n"
+                "from argmagic import magic_parser\n"
+                "from argmagic_test import dummy_config\n"
+                "sys.argv = ['test', '--x', 'TRES', 'abc']\n"
+                "magic_parser.MagicParser(dummy_config.DummyConfig).parse_args()\n"
+                "print(' '.join(sorted(sys.modules)))\n"
+        )
+        modules = self._run(code).stdout.split()
+        
+        # CHECK: PyYAML is not loaded if no dict or list is parsed
+        self.assertIn("argmagic.magic_parser", modules)
+        self.assertNotIn("yaml", modules)
+        
+        # CHECK: PyYAML is not loaded for reading JSON config files
+        code = (
+                "import os, sys, tempfile\n"
+                "from argmagic import config_file\n"
+                "with tempfile.TemporaryDirectory() as d:\n"
+                "    path = os.path.join(d, 'config.json')\n"
+                "    with open(path, 'w') as f:\n"
+                "        f.write('{\"alpha\": 3}')\n"
+                "    assert config_file.load(path) == {'alpha': 3}\n"
+                "print(' '.join(sorted(sys.modules)))\n"
+        )
+        modules = self._run(code).stdout.split()
+        self.assertIn("argmagic.config_file", modules)
+        self.assertNotIn("yaml", modules)
+
+
+if __name__ == "__main__":
+    unittest.main()
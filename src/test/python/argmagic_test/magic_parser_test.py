@@ -2,10 +2,13 @@
 # -*- coding: utf-8 -*-
 
 
+import contextlib
+import io
 import unittest
 import sys
 
 from argmagic import magic_parser
+from argmagic import parse_error
 from argmagic_test import dummy_config
 from argmagic_test import dummy_config_2
 from argmagic_test import dummy_config_3
@@ -46,6 +49,64 @@ __status__ = "Development"
 
 class MagicParserTest(unittest.TestCase):
     
+    def test_format_help(self):
+        
+        class HelpConfig(object):
+            
+            DEFAULT_SIZE = 3
+            
+            def __init__(self):
+                self._name = None
+                self._size = self.DEFAULT_SIZE
+            
+            @property
+            def name(self) -> str:
+                """str: A name."""
+                return self._name
+            
+            @name.setter
+            def name(self, name: str) -> None:
+                self._name = name
+            
+            @property
+            def size(self) -> int:
+                """int: A size."""
+                return self._size
+            
+            @size.setter
+            def size(self, size: int) -> None:
+                self._size = size
+        
+        # CHECK: descriptions are created only when the help text is rendered
+        parser = magic_parser.MagicParser(HelpConfig, app_name="app")
+        self.assertFalse(parser.spec["size"].help_text.created)
+        self.assertEqual("app", parser.parse_args(["app"]).name)
+        self.assertFalse(parser.spec["size"].help_text.created)
+        
+        # CHECK: the help text is rendered per group, and is the same as the one rendered by argparse
+        group_help = parser.format_help(group="positional arguments")
+        self.assertIn("A name.", group_help)
+        self.assertNotIn("A size.", group_help)
+        self.assertFalse(parser.spec["size"].help_text.created)
+        help_text = parser.format_help()
+        self.assertIn("A size. (Default value: 3.)", help_text)
+        self.assertTrue(help_text.startswith("usage: app [-h] [--size SIZE] name\n"))
+        self.assertIn(group_help, help_text)
+        self.assertRaises(ValueError, parser.format_help, group="no such group")
+        
+        # CHECK: rendered help texts are shared by parsers of the same configuration class
+        other_parser = magic_parser.MagicParser(HelpConfig, app_name="app")
+        self.assertIs(group_help, other_parser.format_help(group="positional arguments"))
+        with contextlib.redirect_stdout(io.StringIO()) as stdout:
+            with self.assertRaises(SystemExit):
+                parser.parse_args(["--help"])
+        self.assertEqual(help_text, stdout.getvalue())
+        
+        # CHECK: rendered help texts are discarded if the configuration class changes
+        HelpConfig.DEFAULT_SIZE = 42
+        help_text = magic_parser.MagicParser(HelpConfig, app_name="app").format_help()
+        self.assertIn("A size. (Default value: 42.)", help_text)
+    
     def test_parser_args(self):
         # create target config object
         target = dummy_config.DummyConfig()
@@ -67,6 +128,32 @@ class MagicParserTest(unittest.TestCase):
                 magic_parser.MagicParser(dummy_config.DummyConfig, positional_args=False).parse_args()
         )
         
+        # CHECK: names of enum members are matched exactly by default
+        with contextlib.redirect_stderr(io.StringIO()) as stderr:
+            with self.assertRaises(SystemExit):
+                magic_parser.MagicParser(dummy_config.DummyConfig).parse_args("--x tr abc".split(" "))
+        self.assertIn("--x", stderr.getvalue())
+        
+        # CHECK: names of enum members may be matched case-insensitively as well as by prefixes
+        sys.argv = "test --x tr abc".split(" ")
+        self.assertEqual(
+                target,
+                magic_parser.MagicParser(
+                        dummy_config.DummyConfig,
+                        enum_ignore_case=True,
+                        enum_prefix_matching=True
+                ).parse_args()
+        )
+        for fast_parsing in (False, True):
+            self.assertEqual(
+                    target,
+                    magic_parser.MagicParser(
+                            dummy_config.DummyConfig,
+                            enum_ignore_case=True,
+                            fast_parsing=fast_parsing
+                    ).parse_args("--x tres abc".split(" "))
+            )
+        
         # create target config object
         target = dummy_config_2.DummyConfig2()
         target.a = "1"
@@ -97,7 +184,69 @@ class MagicParserTest(unittest.TestCase):
                 target,
                 magic_parser.MagicParser(dummy_config_3.DummyConfig3).parse_args()
         )
+        
+        # CHECK: args can be provided explicitly
+        self.assertEqual(
+                target,
+                magic_parser.MagicParser(dummy_config_3.DummyConfig3).parse_args("--a 1 --c 3 2".split(" "))
+        )
+        
+        # CHECK: errors terminate the application
+        with contextlib.redirect_stderr(io.StringIO()) as stderr:
+            with self.assertRaises(SystemExit):
+                magic_parser.MagicParser(dummy_config_3.DummyConfig3).parse_args("--c x 2".split(" "))
+        self.assertIn("invalid int value: 'x'", stderr.getvalue())
     
+    def test_parse_many(self):
+        parser = magic_parser.MagicParser(dummy_config.DummyConfig)
+        
+        # create target config objects
+        target_1 = dummy_config.DummyConfig()
+        target_1.x = 3
+        target_1.y = "abc"
+        target_2 = dummy_config.DummyConfig()
+        target_2.x = 2
+        target_2.y = "def"
+        target_2.z = 1.0
+        
+        # CHECK: configs are parsed in order, and errors are reported as ParseErrors
+        args = (a.split(" ") for a in ["--x TRES abc", "--x FOUR abc", "--x DOS --z 1 def", "abc def"])
+        results = list(parser.parse_many(args))
+        self.assertEqual(4, len(results))
+        self.assertEqual(target_1, results[0])
+        self.assertIsInstance(results[1], parse_error.ParseError)
+        self.assertEqual(1, results[1].index)
+        self.assertEqual(["--x", "FOUR", "abc"], results[1].item)
+        self.assertIn("invalid type_func value: 'FOUR'", results[1].message)
+        self.assertEqual(target_2, results[2])
+        self.assertIsInstance(results[3], parse_error.ParseError)
+        self.assertEqual(3, results[3].index)
+        self.assertIn("unrecognized arguments: def", results[3].message)
+        
+        # CHECK: missing args are reported as ParseErrors as well
+        parser = magic_parser.MagicParser(dummy_config_3.DummyConfig3)
+        results = list(parser.parse_many([["2"], ["--c", "3"]]))
+        self.assertEqual(2.0, results[0].b)
+        self.assertEqual("the following arguments are required: b", results[1].message)
+    
+    def test_parse_many_parallel(self):
+        parser = magic_parser.MagicParser(dummy_config.DummyConfig)
+        args = [
+                "--x {} {}".format(x, i).split(" ")
+                for i in range(25)
+                for x in ["UNO", "DOS", "TRES", "FOUR"]
+        ]
+        
+        # CHECK: parallel parsing yields the same results in the same order as sequential parsing
+        expected = list(parser.parse_many(args))
+        for workers, chunk_size in [(1, 100), (2, 1), (3, 7)]:
+            self.assertEqual(expected, list(parser.parse_many(iter(args), workers=workers, chunk_size=chunk_size)))
+        self.assertEqual(25, sum(isinstance(r, parse_error.ParseError) for r in expected))
+        
+        # CHECK: illegal args are rejected
+        self.assertRaises(ValueError, parser.parse_many, args, workers=0)
+        self.assertRaises(ValueError, parser.parse_many, args, workers=1, chunk_size=0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import contextlib
+import io
+import operator
+import pathlib
+import pickle
+import unittest
+
+from argmagic import config_export
+from argmagic import config_snapshot
+from argmagic import config_spec
+from argmagic import magic_parser
+from argmagic import nested_config
+from argmagic.parsing import parser_factory
+from argmagic_test import dummy_config_8
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class _PathConfig(object):
+    
+    DEFAULT_SIZE = 1
+    
+    def __init__(self):
+        self._path = None
+        self._size = self.DEFAULT_SIZE
+    
+    @property
+    def path(self) -> pathlib.Path:
+        """pathlib.Path: A path."""
+        return self._path
+    
+    @path.setter
+    def path(self, path: pathlib.Path) -> None:
+        self._path = path
+    
+    size = property(
+            operator.attrgetter("_size"),
+            lambda self, size: setattr(self, "_size", size),
+            doc="int: A value whose getter has no __dict__."
+    )
+
+
+class _ScheduleParserFactory(parser_factory.ParserFactory):
+    
+    def create_parser(self, parser, config):
+        def create_schedule(value: str):
+            schedule = dummy_config_8.DummySchedule()
+            schedule.steps = int(value)
+            return schedule
+        
+        parser.add_argument(config.option_name, dest=config.name, type=create_schedule, help=config.help_text)
+        return parser
+
+
+class _PathParserFactory(parser_factory.ParserFactory):
+    
+    def create_parser(self, parser, config):
+        parser.add_argument(config.option_name, dest=config.name, type=pathlib.Path, help=config.help_text)
+        return parser
+
+
+class NestedConfigTest(unittest.TestCase):
+    
+    def test_custom_parsers(self):
+        # CHECK: nested configurations whose classes have custom parsers are parsed by these
+        parser = magic_parser.MagicParser(
+                dummy_config_8.DummyConfig8,
+                custom_parsers={dummy_config_8.DummySchedule: _ScheduleParserFactory()}
+        )
+        conf = parser.parse_args(["--optimizer.schedule", "3"])
+        self.assertIs(dummy_config_8.DummySchedule, type(conf.optimizer.schedule))
+        self.assertEqual(3, conf.optimizer.schedule.steps)
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            parser.parse_args(["--optimizer.schedule.steps", "3"])
+        
+        # CHECK: classes with properties are nested configurations only if they are declared as such
+        parser = magic_parser.MagicParser(_PathConfig, custom_parsers={pathlib.Path: _PathParserFactory()})
+        self.assertEqual({}, parser.spec.nested())
+        self.assertEqual(pathlib.Path("a/b"), parser.parse_args(["--path", "a/b"]).path)
+    
+    def test_expand(self):
+        conf_class = dummy_config_8.DummyConfig8
+        spec = config_spec.ConfigSpec.create_spec(conf_class)
+        values, nodes = nested_config.expand(spec, conf_class=conf_class)
+        steps = {conf.name: conf for conf in values}["optimizer.schedule.steps"]
+        
+        # CHECK: expansions are cached per class
+        cached_values, cached_nodes = nested_config.expand(spec, conf_class=conf_class)
+        self.assertEqual(len(values), len(cached_values))
+        self.assertTrue(all(a is b for a, b in zip(values, cached_values)))
+        self.assertTrue(all(a is b for a, b in zip(nodes, cached_nodes)))
+        self.assertIsNot(values, cached_values)
+        
+        # CHECK: cached expansions are discarded if any nested class changes
+        default_steps = dummy_config_8.DummySchedule.DEFAULT_STEPS
+        try:
+            dummy_config_8.DummySchedule.DEFAULT_STEPS = default_steps + 1
+            values, _ = nested_config.expand(spec, conf_class=conf_class)
+            new_steps = {conf.name: conf for conf in values}["optimizer.schedule.steps"]
+            self.assertIsNot(steps, new_steps)
+            self.assertEqual(default_steps + 1, new_steps.default_value)
+        finally:
+            dummy_config_8.DummySchedule.DEFAULT_STEPS = default_steps
+    
+    def test_export(self):
+        conf = magic_parser.MagicParser(dummy_config_8.DummyConfig8).parse_args(["--optimizer.schedule.steps", "3"])
+        expected = {"name": "run", "optimizer": {"learning_rate": 0.1, "nesterov": False, "schedule": {"steps": 3}}}
+        
+        # CHECK: nested configurations are exported recursively
+        self.assertEqual(expected, config_export.export_config(conf))
+        
+        # CHECK: snapshots recreate nested configurations
+        restored = config_snapshot.ConfigSnapshot(conf).to_config()
+        self.assertIs(dummy_config_8.DummyOptimizer, type(restored.optimizer))
+        self.assertEqual(3, restored.optimizer.schedule.steps)
+        self.assertEqual(config_snapshot.fingerprint(conf), config_snapshot.fingerprint(restored))
+    
+    def test_lazy_config(self):
+        conf = magic_parser.MagicParser(dummy_config_8.DummyConfig8).parse_args([])
+        optimizer = conf.optimizer
+        
+        # CHECK: nested configurations that none of the args refer to are not created
+        self.assertIsInstance(optimizer, nested_config.LazyConfig)
+        self.assertIsInstance(optimizer, dummy_config_8.DummyOptimizer)
+        self.assertFalse(nested_config.is_instantiated(optimizer))
+        
+        # CHECK: they are created on first access
+        self.assertEqual(dummy_config_8.DummyOptimizer.DEFAULT_LEARNING_RATE, optimizer.learning_rate)
+        self.assertTrue(nested_config.is_instantiated(optimizer))
+        optimizer.learning_rate = 0.5
+        self.assertEqual(0.5, conf.optimizer.learning_rate)
+        
+        # CHECK: nested configurations of lazily created ones are populated in the same way as by the parser
+        self.assertIsInstance(optimizer.schedule, nested_config.LazyConfig)
+        self.assertEqual(dummy_config_8.DummySchedule.DEFAULT_STEPS, optimizer.schedule.steps)
+        other = magic_parser.MagicParser(dummy_config_8.DummyConfig8).parse_args(["--optimizer.learning-rate", "0.5"])
+        self.assertEqual(config_export.export_config(conf), config_export.export_config(other))
+        
+        # CHECK: pickling yields the configuration itself
+        restored = pickle.loads(pickle.dumps(conf))
+        self.assertIs(dummy_config_8.DummyOptimizer, type(restored.optimizer))
+        self.assertEqual(0.5, restored.optimizer.learning_rate)
+    
+    def test_parse_args(self):
+        args = ["--optimizer.learning-rate", "0.5", "--optimizer.nesterov", "--optimizer.schedule.steps", "3"]
+        for fast_parsing in (False, True):
+            parser = magic_parser.MagicParser(dummy_config_8.DummyConfig8, fast_parsing=fast_parsing)
+            
+            # CHECK: all nested configurations are created and populated
+            conf = parser.parse_args(args)
+            self.assertIs(dummy_config_8.DummyOptimizer, type(conf.optimizer))
+            self.assertEqual(0.5, conf.optimizer.learning_rate)
+            self.assertTrue(conf.optimizer.nesterov)
+            self.assertIs(dummy_config_8.DummySchedule, type(conf.optimizer.schedule))
+            self.assertEqual(3, conf.optimizer.schedule.steps)
+            
+            # CHECK: only those nested configurations are created that any of the args refer to
+            conf = parser.parse_args(["--optimizer.learning-rate", "0.5"])
+            self.assertIs(dummy_config_8.DummyOptimizer, type(conf.optimizer))
+            self.assertFalse(conf.optimizer.nesterov)
+            self.assertFalse(nested_config.is_instantiated(conf.optimizer.schedule))
+    
+    def test_parser(self):
+        parser = magic_parser.MagicParser(dummy_config_8.DummyConfig8)
+        
+        # CHECK: nested configurations are not part of the spec, and their specs are shared
+        self.assertEqual(["name"], list(parser.spec.keys()))
+        self.assertEqual({"optimizer": dummy_config_8.DummyOptimizer}, parser.spec.nested())
+        self.assertIs(
+                config_spec.ConfigSpec.create_spec(dummy_config_8.DummyOptimizer),
+                parser.spec.nested_spec("optimizer")
+        )
+        
+        # CHECK: the options of nested configurations appear in the help text
+        help_text = parser.format_help()
+        for option in ("--optimizer.learning-rate", "--optimizer.nesterov", "--optimizer.schedule.steps"):
+            self.assertIn(option, help_text)
+    
+    def test_sweep(self):
+        parser = magic_parser.MagicParser(dummy_config_8.DummyConfig8)
+        sweep = parser.sweep(["--optimizer.learning-rate", "0.1,0.2"])
+        
+        # CHECK: nested options may be swept
+        self.assertEqual([0.1, 0.2], [conf.optimizer.learning_rate for conf in sweep])
+        self.assertEqual([10, 10], [conf.optimizer.schedule.steps for conf in sweep])
+
+
+if __name__ == "__main__":
+    unittest.main()
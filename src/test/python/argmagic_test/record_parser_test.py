@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import json
+import os
+import tempfile
+import unittest
+
+from argmagic import magic_parser
+from argmagic import parse_error
+from argmagic_test import dummy_config_4
+from argmagic_test import dummy_config_8
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class RecordParserTest(unittest.TestCase):
+    
+    def setUp(self):
+        self._parser = magic_parser.MagicParser(dummy_config_4.DummyConfig4)
+        self._dir = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self._dir.cleanup()
+    
+    def _write(self, file_name: str, content: str) -> str:
+        path = os.path.join(self._dir.name, file_name)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+    
+    def test_parse_file_csv(self):
+        path = self._write(
+                "configs.csv",
+                "count,name,learning-rate,flag,mode,extra\n"
+                "1,a,0.5,true,UNO,\n"
+                "2,b,,no,,4\n"
+        )
+        
+        first, second = list(self._parser.parse_file(path))
+        self.assertEqual((1, "a", 0.5, True, 1, None), (first.count, first.name, first.learning_rate, first.flag,
+                                                         first.mode, first.extra))
+        self.assertEqual((2, "b", 0.1, False, 2, 4), (second.count, second.name, second.learning_rate, second.flag,
+                                                      second.mode, second.extra))
+        
+        # CHECK: records are converted in the same way as command-line args
+        expected = self._parser.parse_args(["1", "a", "--learning-rate", "0.5", "--flag", "--mode", "UNO"])
+        self.assertEqual(expected, first)
+    
+    def test_parse_file_errors(self):
+        records = [
+                {"count": 1, "name": "a"},
+                {"count": "x", "name": "b"},
+                {"count": 3},
+                "invalid json",
+                {"count": 5, "name": "e", "unknown": 1},
+                {"count": 6, "name": "f", "beta": "wrong type"},
+                {"count": 7, "name": "g", "beta": 2, "mode": 3}
+        ]
+        path = self._write(
+                "configs.jsonl",
+                "\n".join(json.dumps(r) if isinstance(r, dict) else r for r in records) + "\n\n"
+        )
+        
+        # CHECK: by default, parsing stops at the first erroneous record
+        results = self._parser.parse_file(path)
+        self.assertEqual(1, next(results).count)
+        with self.assertRaises(parse_error.ParseError) as context:
+            next(results)
+        self.assertEqual(1, context.exception.index)
+        self.assertEqual(records[1], context.exception.item)
+        
+        # CHECK: erroneous records may be skipped or yielded as errors
+        skipped = list(self._parser.parse_file(path, on_error="skip"))
+        self.assertEqual([1, 7], [c.count for c in skipped])
+        self.assertEqual((2.0, 3), (skipped[1].beta, skipped[1].mode))
+        
+        yielded = list(self._parser.parse_file(path, on_error="yield"))
+        self.assertEqual(len(records), len(yielded))
+        self.assertEqual(
+                [1, 2, 3, 4, 5],
+                [r.index for r in yielded if isinstance(r, parse_error.ParseError)]
+        )
+        self.assertEqual("invalid json", yielded[3].item)
+        self.assertIn("unknown", yielded[4].message)
+        
+        # CHECK: illegal args are rejected
+        self.assertRaises(ValueError, self._parser.parse_file, path, on_error="ignore")
+        self.assertRaises(ValueError, self._parser.parse_file, path, file_format="xml")
+        self.assertRaises(ValueError, self._parser.parse_file, self._write("configs.txt", ""))
+        
+        # CHECK: values of enums have to be values of members
+        modes = [1, 4, [1], "TRES"]
+        path = self._write("modes.jsonl", "\n".join(json.dumps({"count": 1, "name": "a", "mode": m}) for m in modes))
+        results = list(self._parser.parse_file(path, on_error="yield"))
+        self.assertEqual(1, results[0].mode)
+        self.assertIsInstance(results[1], parse_error.ParseError)
+        self.assertIsInstance(results[2], parse_error.ParseError)
+        self.assertEqual(3, results[3].mode)
+    
+    def test_parse_file_nested(self):
+        records = [
+                {"optimizer.learning_rate": 0.5},
+                {"optimizer": {"learning-rate": "0.5", "schedule": {"steps": 3}}},
+                {"name": "x"},
+                {"optimizer": {"unknown": 1}},
+                {"optimizer": 1}
+        ]
+        path = self._write("configs.jsonl", "\n".join(json.dumps(r) for r in records) + "\n")
+        parser = magic_parser.MagicParser(dummy_config_8.DummyConfig8)
+        first, second, third, *errors = parser.parse_file(path, on_error="yield")
+        
+        # CHECK: nested options may be specified by their dotted names or as dicts
+        self.assertEqual((0.5, dummy_config_8.DummySchedule.DEFAULT_STEPS),
+                         (first.optimizer.learning_rate, first.optimizer.schedule.steps))
+        self.assertEqual((0.5, 3), (second.optimizer.learning_rate, second.optimizer.schedule.steps))
+        self.assertEqual(
+                dummy_config_8.DummyOptimizer.DEFAULT_LEARNING_RATE,
+                third.optimizer.learning_rate
+        )
+        
+        # CHECK: unknown nested options and nested configurations that are not given as dicts are rejected
+        self.assertEqual([3, 4], [e.index for e in errors])
+        self.assertTrue(all("unknown" in e.message for e in errors))
+
+
+if __name__ == "__main__":
+    unittest.main()
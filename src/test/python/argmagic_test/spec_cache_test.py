@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import os
+import sys
+import tempfile
+import unittest
+
+from argmagic import config_spec
+from argmagic import magic_parser
+from argmagic import spec_cache
+from argmagic.parsing import default_parser_factory
+from argmagic_test import dummy_config
+from argmagic_test import dummy_config_2
+from argmagic_test import dummy_config_3
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class SpecCacheTest(unittest.TestCase):
+    
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self._cache_dir = os.path.join(self._tmp_dir.name, "cache")
+    
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+    
+    def test_key(self):
+        cache = spec_cache.SpecCache(self._cache_dir)
+        key = cache.key(dummy_config.DummyConfig)
+        
+        # CHECK: keys are deterministic
+        self.assertEqual(key, cache.key(dummy_config.DummyConfig))
+        
+        # CHECK: keys depend on the class and on the custom parser factories
+        self.assertNotEqual(key, cache.key(dummy_config_2.DummyConfig2))
+        self.assertNotEqual(
+                key,
+                cache.key(
+                        dummy_config.DummyConfig,
+                        custom_parsers={float: default_parser_factory.DefaultParserFactory(True)}
+                )
+        )
+        
+        # CHECK: classes without source files cannot be cached
+        self.assertIsNone(cache.key(type("Config", (object,), {"__module__": "no_such_module"})))
+    
+    def test_load_and_store(self):
+        cache = spec_cache.SpecCache(self._cache_dir)
+        key = cache.key(dummy_config.DummyConfig)
+        spec = config_spec.ConfigSpec.create_spec(dummy_config.DummyConfig)
+        
+        # CHECK: missing entries are reported as None
+        self.assertIsNone(cache.load(key))
+        
+        # CHECK: stored entries can be loaded
+        self.assertTrue(cache.store(key, spec, ["y", "z", "x"]))
+        loaded_spec, option_order = cache.load(key)
+        self.assertEqual(spec, loaded_spec)
+        self.assertEqual(["y", "z", "x"], option_order)
+        self.assertEqual([key + spec_cache.SpecCache.FILE_EXTENSION], os.listdir(self._cache_dir))
+        
+        # CHECK: entries are created with the same permissions as any other file
+        umask = os.umask(0)
+        os.umask(umask)
+        path = os.path.join(self._cache_dir, key + spec_cache.SpecCache.FILE_EXTENSION)
+        self.assertEqual(0o666 & ~umask, os.stat(path).st_mode & 0o777)
+        
+        # CHECK: corrupt entries are ignored
+        with open(os.path.join(self._cache_dir, key + spec_cache.SpecCache.FILE_EXTENSION), "wb") as f:
+            f.write(b"corrupt")
+        self.assertIsNone(cache.load(key))
+        
+        # CHECK: clearing the cache removes all entries
+        cache.store(key, spec, ["y", "z", "x"])
+        cache.clear()
+        self.assertIsNone(cache.load(key))
+    
+    def test_read_only(self):
+        cache = spec_cache.SpecCache(self._cache_dir)
+        read_only_cache = spec_cache.SpecCache(self._cache_dir, read_only=True)
+        key = cache.key(dummy_config.DummyConfig)
+        spec = config_spec.ConfigSpec.create_spec(dummy_config.DummyConfig)
+        
+        # CHECK: read-only caches are never written
+        self.assertFalse(read_only_cache.store(key, spec, ["y", "z", "x"]))
+        self.assertFalse(os.path.exists(self._cache_dir))
+        self.assertRaises(ValueError, read_only_cache.clear)
+        
+        # CHECK: read-only caches can be used for looking up entries
+        cache.store(key, spec, ["y", "z", "x"])
+        self.assertEqual(spec, read_only_cache.load(key)[0])
+    
+    def test_magic_parser(self):
+        cache = spec_cache.SpecCache(self._cache_dir)
+        
+        # create target config object
+        target = dummy_config_3.DummyConfig3()
+        target.a = "1"
+        target.b = 2.0
+        target.c = 3
+        
+        # CHECK: the first parser populates the cache, and the second one uses it
+        sys.argv = "test --a 1 --c 3 2".split(" ")
+        for _ in range(2):
+            self.assertEqual(
+                    target,
+                    magic_parser.MagicParser(dummy_config_3.DummyConfig3, spec_cache=cache).parse_args()
+            )
+            self.assertEqual(1, len(os.listdir(self._cache_dir)))
+        
+        # CHECK: caches that cannot be written are ignored
+        blocker = os.path.join(self._tmp_dir.name, "file")
+        open(blocker, "w").close()
+        cache = spec_cache.SpecCache(os.path.join(blocker, "cache"))
+        self.assertFalse(cache.store("key", config_spec.ConfigSpec.create_spec(dummy_config_3.DummyConfig3), []))
+        self.assertEqual(
+                target,
+                magic_parser.MagicParser(dummy_config_3.DummyConfig3, spec_cache=cache).parse_args()
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import unittest
+
+from argmagic import config_spec
+from argmagic import magic_parser
+from argmagic.parsing import default_parser_factory
+from argmagic.parsing import structured_loader
+from argmagic_test import dummy_config_5
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class StructuredLoaderTest(unittest.TestCase):
+    
+    def test_check_type(self):
+        self.assertEqual([1, 2], structured_loader.check_type([1, 2], list))
+        self.assertEqual([1, 2], structured_loader.check_type([1, 2], list, [int]))
+        self.assertEqual({"a": 1.0}, structured_loader.check_type({"a": 1}, dict, [str, float]))
+        self.assertIsInstance(structured_loader.check_type({"a": 1}, dict, [str, float])["a"], float)
+        self.assertRaises(ValueError, structured_loader.check_type, {"a": 1}, list)
+        self.assertRaises(ValueError, structured_loader.check_type, [1, "2"], list, [int])
+        self.assertRaises(ValueError, structured_loader.check_type, [True], list, [int])
+        self.assertRaises(ValueError, structured_loader.check_type, {1: 1.0}, dict, [str, float])
+    
+    def test_load(self):
+        for mode in ["auto", "yaml", "pure"]:
+            target = structured_loader.StructuredLoader(mode)
+            self.assertEqual({"a": [1, 2.5, "x"]}, target.load('{"a": [1, 2.5, "x"]}'))
+            self.assertEqual({"a": [1, 2]}, target.load("{a: [1, 2]}"))
+            self.assertEqual([1, 2], target.load("- 1\n- 2"))
+            self.assertRaises(ValueError, target.load, "{a: [1, 2}")
+        
+        # CHECK: only plain data is loaded
+        self.assertRaises(ValueError, structured_loader.StructuredLoader().load, "!!python/object/apply:os.getcwd []")
+        
+        target = structured_loader.StructuredLoader("json")
+        self.assertEqual({"a": [1, 2]}, target.load('{"a": [1, 2]}'))
+        self.assertRaises(ValueError, target.load, "{a: [1, 2]}")
+        self.assertRaises(ValueError, structured_loader.StructuredLoader, "xml")
+    
+    def test_parse_args(self):
+        # CHECK: element types are taken from doc strings and annotations
+        spec = config_spec.ConfigSpec.create_spec(dummy_config_5.DummyConfig5)
+        self.assertEqual((list, (int,)), (spec["ids"].data_type, spec["ids"].type_args))
+        self.assertEqual((list, (str,)), (spec["names"].data_type, spec["names"].type_args))
+        self.assertEqual((dict, ()), (spec["raw"].data_type, spec["raw"].type_args))
+        self.assertEqual((dict, (str, float)), (spec["weights"].data_type, spec["weights"].type_args))
+        
+        for mode in structured_loader.StructuredLoader.MODES:
+            factory = default_parser_factory.DefaultParserFactory(
+                    True,
+                    structured_loader=structured_loader.StructuredLoader(mode)
+            )
+            parser = magic_parser.MagicParser(
+                    dummy_config_5.DummyConfig5,
+                    custom_parsers={list: factory, dict: factory}
+            )
+            conf = parser.parse_args(["[1, 2]", "--weights", '{"a": 2, "b": 0.5}', "--raw", '{"x": null}'])
+            self.assertEqual([1, 2], conf.ids)
+            self.assertEqual({"a": 2.0, "b": 0.5}, conf.weights)
+            self.assertEqual({"x": None}, conf.raw)
+            self.assertEqual(["a"], conf.names)
+            
+            # CHECK: elements of the wrong type are rejected
+            self.assertRaises(SystemExit, parser.parse_args, ['[1, "2"]'])
+            self.assertRaises(SystemExit, parser.parse_args, ["[1]", "--names", "[1]"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import contextlib
+import io
+import unittest
+
+from argmagic import subcommand_parser
+from argmagic_test import dummy_config_4
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class SubcommandParserTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.parser = subcommand_parser.SubcommandParser(
+                {
+                        "broken": "argmagic_test.does_not_exist:DummyConfig",
+                        "nested": "argmagic_test.dummy_config_8:DummyConfig8",
+                        "run": dummy_config_4.DummyConfig4
+                },
+                app_name="app",
+                fast_parsing=True
+        )
+    
+    def test_format_help(self):
+        help_text = self.parser.format_help()
+        for command in ("broken", "nested", "run"):
+            self.assertIn("  " + command + "\n", help_text)
+        
+        with contextlib.redirect_stdout(io.StringIO()) as stdout:
+            with self.assertRaises(SystemExit):
+                self.parser.parse_args(["--help"])
+        self.assertEqual(help_text, stdout.getvalue())
+    
+    def test_init(self):
+        with self.assertRaises(ValueError):
+            subcommand_parser.SubcommandParser({})
+        with self.assertRaises(ValueError):
+            subcommand_parser.SubcommandParser({"--run": dummy_config_4.DummyConfig4})
+        with self.assertRaises(TypeError):
+            subcommand_parser.SubcommandParser({"run": 1})
+    
+    def test_parse_args(self):
+        # CHECK: only the selected subcommand is loaded, i.e., the broken one is never imported
+        command, conf = self.parser.parse_args(["run", "1", "abc"])
+        self.assertEqual("run", command)
+        self.assertIsInstance(conf, dummy_config_4.DummyConfig4)
+        self.assertEqual(1, conf.count)
+        
+        # CHECK: subcommands that are given as import paths are imported on demand
+        command, conf = self.parser.parse_args(["nested", "--optimizer.learning-rate", "0.5"])
+        self.assertEqual("nested", command)
+        self.assertEqual(0.5, conf.optimizer.learning_rate)
+        self.assertIs(self.parser.conf_class("nested"), type(conf))
+        
+        # CHECK: parsers are created once only
+        self.assertIs(self.parser.get_parser("nested"), self.parser.get_parser("nested"))
+        
+        # CHECK: broken import paths are reported when the according subcommand is selected
+        with self.assertRaises(ImportError):
+            self.parser.parse_args(["broken"])
+        
+        # CHECK: missing and unknown subcommands terminate the application
+        with contextlib.redirect_stderr(io.StringIO()) as stderr:
+            for args in ([], ["unknown"]):
+                with self.assertRaises(SystemExit):
+                    self.parser.parse_args(args)
+        self.assertIn("usage: app [-h] COMMAND ...", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import contextlib
+import io
+import unittest
+
+from argmagic import magic_parser
+from argmagic import tracing
+from argmagic_test import dummy_config_4
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class TracingTest(unittest.TestCase):
+    
+    def test_disabled(self):
+        # CHECK: tracing is disabled by default (the environment variable is not set when the tests are run)
+        self.assertIsNone(magic_parser.MagicParser(dummy_config_4.DummyConfig4).tracer)
+        self.assertIsNone(magic_parser.MagicParser(dummy_config_4.DummyConfig4, trace=False).tracer)
+        with tracing.span(None, "x"):
+            pass
+    
+    def test_max_spans(self):
+        tracer = tracing.Tracer(max_spans=3)
+        for i in range(5):
+            with tracer.span("outer", index=i):
+                with tracer.span("inner"):
+                    pass
+        
+        # CHECK: only the most recent spans are retained, but all of them are aggregated
+        self.assertEqual(["outer", "inner", "outer"], [s.name for s in tracer.spans])
+        self.assertEqual(4, tracer.spans[-1].attributes["index"])
+        self.assertEqual(7, tracer.dropped)
+        self.assertEqual({"inner": 5, "outer": 5}, {k: v[0] for k, v in tracer.summary().items()})
+        self.assertTrue(tracer.report().startswith("7 earlier spans were discarded"))
+        
+        # CHECK: clearing the tracer resets the aggregates as well
+        tracer.clear()
+        self.assertEqual(([], 0, {}), (tracer.spans, tracer.dropped, tracer.summary()))
+        
+        # CHECK: illegal limits are rejected
+        self.assertRaises(TypeError, tracing.Tracer, max_spans=1.5)
+        self.assertRaises(ValueError, tracing.Tracer, max_spans=0)
+        self.assertEqual(0, tracing.Tracer(max_spans=None).dropped)
+    
+    def test_memory(self):
+        tracer = tracing.Tracer(trace_memory=True)
+        with tracer.span("allocate"):
+            data = [object() for _ in range(1000)]
+        self.assertGreater(tracer.spans[0].allocated, 0)
+        self.assertIn("allocate", tracer.report())
+        del data
+    
+    def test_spans(self):
+        hooked = []
+        tracer = tracing.Tracer(hooks=[hooked.append])
+        parser = magic_parser.MagicParser(dummy_config_4.DummyConfig4, trace=tracer)
+        self.assertIs(tracer, parser.tracer)
+        parser.parse_args(["1", "x", "--beta", "2.5"])
+        
+        # CHECK: all phases are traced, including the conversion and setting of individual options
+        summary = tracer.summary()
+        for name in ["create_spec", "build_parser", "parse", "tokenize", "populate"]:
+            self.assertEqual(1, summary[name][0])
+        self.assertEqual(len(parser.spec), summary["build_option"][0])
+        self.assertEqual(
+                {"alpha", "alphabet", "beta", "count", "name"},  # alpha and alphabet have default values of type str
+                {s.attributes["option"] for s in tracer.spans if s.name == "convert"}
+        )
+        self.assertIn("learning_rate", {s.attributes["option"] for s in tracer.spans if s.name == "set"})
+        
+        # CHECK: nested spans are recorded before the spans that contain them, and are passed on to hooks
+        spans = tracer.spans
+        self.assertEqual("parse", spans[-1].name)
+        self.assertEqual(0, spans[-1].depth)
+        self.assertTrue(all(s.depth > 0 for s in spans if s.name in ("convert", "set")))
+        self.assertEqual(spans, hooked)
+        self.assertTrue(all(s.allocated is None for s in spans))
+        
+        # CHECK: traced conversion functions are reported by their names on errors
+        with contextlib.redirect_stderr(io.StringIO()) as stderr:
+            with self.assertRaises(SystemExit):
+                parser.parse_args(["x", "x"])
+        self.assertIn("invalid int value", stderr.getvalue())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+import collections
+import pickle
+import sys
+import types
+import unittest
+
+from argmagic import config_spec
+from argmagic import magic_parser
+from argmagic import parse_error
+from argmagic import type_ref
+from argmagic_test import dummy_config_7
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2017 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2017.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class TypeRefTest(unittest.TestCase):
+    
+    def test_deferred_resolution(self):
+        module_name = "argmagic_test.dummy_enum_2"
+        self.assertNotIn(module_name, sys.modules)
+        
+        # CHECK: neither creating the spec nor the parser imports the module that defines the type
+        spec = config_spec.ConfigSpec.create_spec(dummy_config_7.DummyConfig7, use_cache=False)
+        parser = magic_parser.MagicParser(dummy_config_7.DummyConfig7)
+        self.assertNotIn(module_name, sys.modules)
+        self.assertIsInstance(spec["color"].declared_type, type_ref.TypeRef)
+        self.assertEqual([spec["color"]], spec.by_type(spec["color"].declared_type))
+        self.assertEqual([], spec.imports())
+        
+        # CHECK: parsing args that do not use the deferred type does not import it either
+        self.assertEqual(5, parser.parse_args(["--size", "5"]).size)
+        self.assertNotIn(module_name, sys.modules)
+        
+        # CHECK: the type is resolved on first conversion, and the import is reported by the spec
+        conf = parser.parse_args(["--color", "GREEN"])
+        self.assertIn(module_name, sys.modules)
+        color_type = sys.modules[module_name].DummyColor
+        self.assertEqual(color_type.GREEN.value, conf.color)
+        self.assertIs(color_type, spec["color"].data_type)
+        self.assertTrue(spec["color"].exhaustive)
+        self.assertEqual([spec["color"]], spec.by_type(color_type))
+        self.assertEqual([module_name], [r.module for r in spec.imports()])
+        self.assertTrue(all(r.seconds >= 0 for r in spec.imports()))
+        self.assertIn(spec.imports()[0], type_ref.import_log())
+        
+        # CHECK: types that cannot be found are resolved as str
+        self.assertEqual("abc", parser.parse_args(["--label", "abc"]).label)
+        self.assertIs(str, spec["label"].data_type)
+    
+    def test_deferred_unsupported_type(self):
+        module_name = "argmagic_test.deferred_module"
+        
+        class Config(object):
+            
+            def __init__(self):
+                self._value = None
+            
+            @property
+            def value(self):
+                """argmagic_test.deferred_module.Unsupported: A value of a type that is not supported."""
+                return self._value
+            
+            @value.setter
+            def value(self, value) -> None:
+                self._value = value
+        
+        parser = magic_parser.MagicParser(Config)
+        self.assertIsInstance(parser.spec["value"].declared_type, type_ref.TypeRef)
+        
+        # CHECK: unsupported types are reported as such when they are resolved, rather than as invalid values
+        module = types.ModuleType(module_name)
+        module.Unsupported = type("Unsupported", (object,), {})
+        sys.modules[module_name] = module
+        try:
+            with self.assertRaises(parse_error.ParseError) as context:
+                parser._parse(["--value", "x"], None)
+        finally:
+            del sys.modules[module_name]
+        self.assertIn("is not supported: Unsupported", context.exception.message)
+    
+    def test_locate(self):
+        # CHECK: builtins and types from modules that have been imported already are resolved right away
+        self.assertIs(int, type_ref.locate("int"))
+        self.assertIs(collections.OrderedDict, type_ref.locate("collections.OrderedDict"))
+        self.assertIsNone(type_ref.locate("no_such_builtin"))
+        
+        # CHECK: references are shared, also when they are unpickled
+        ref = type_ref.locate("argmagic_test.missing_module.Foo")
+        self.assertIsInstance(ref, type_ref.TypeRef)
+        self.assertIs(ref, type_ref.locate("argmagic_test.missing_module.Foo"))
+        self.assertIs(ref, pickle.loads(pickle.dumps(ref)))
+        self.assertIs(str, ref.resolve())
+        self.assertTrue(ref.resolved)
+    
+    def test_eq(self):
+        ref = type_ref.TypeRef("collections.OrderedDict")
+        self.assertEqual(type_ref.TypeRef("collections.OrderedDict"), ref)
+        self.assertEqual(collections.OrderedDict, ref)
+        self.assertNotEqual(dict, ref)
+        self.assertEqual("collections.OrderedDict", type_ref.type_name(collections.OrderedDict))
+        self.assertEqual("int", type_ref.type_name(int))